@@ -0,0 +1,207 @@
+"""Benchmarks for the screening, dashboard and export hot paths
+
+Usage::
+
+    python -m benchmarks.bench --rows 100000 --output bench-results/$(git rev-parse --short HEAD).json
+    python -m benchmarks.bench --rows 100000 --compare bench-results/baseline.json
+
+Data comes from ``healthbridge.synthetic`` with a fixed seed, so two runs
+at the same size measure the same work. Each case reports the best and
+median wall time over ``--repeat`` runs plus rows per second; ``--compare``
+flags cases whose best time regressed by more than ``--tolerance``.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from healthbridge import synthetic
+from healthbridge.export import export_rows
+from healthbridge.model import synthetic_set, train
+from healthbridge.risk import kidney_risk, kidney_risk_batch, referral_facilities
+from healthbridge.scoring_service import ScoringService
+from healthbridge.summary import overall, render_report, render_reports, summarize_by
+
+MODEL_TRAINING_ROWS = 50000
+RISK_INPUT_FIELDS = ("age", "systolic_bp", "diastolic_bp", "blood_glucose", "weight", "height",
+                     "urine_protein", "known_diabetes", "known_hypertension", "family_history",
+                     "herbal_use", "smoking")
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _time(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _asgi_post(app, path, body, chunk_size=64 * 1024):
+    """POST ``body`` to an ASGI app in-process, in ``chunk_size`` pieces; returns the response body"""
+    chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)] or [b""]
+    out = []
+
+    async def receive():
+        data = chunks.pop(0)
+        return {"type": "http.request", "body": data, "more_body": bool(chunks)}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            out.append(message.get("body", b""))
+
+    scope = {"type": "http", "method": "POST", "path": path, "query_string": b""}
+    asyncio.run(app(scope, receive, send))
+    return b"".join(out)
+
+
+def cases(rows, seed):
+    """``{name: (callable, rows_processed)}`` built from one synthetic dataset"""
+    columns = synthetic.screenings(rows, seed=seed)
+    records = synthetic.records(columns)
+    risk_columns = {k: columns[k] for k in RISK_INPUT_FIELDS}
+    risk_rows = [{k: r[k] for k in RISK_INPUT_FIELDS} for r in records]
+    referral_rows = [(r["location"], r["risk_level"]) for r in records]
+    summary = overall(summarize_by(records))
+    by_location = summarize_by(records)
+    export_slice = records[:min(rows, 100000)]
+    service_rows = [dict(r, location=loc) for r, (loc, _) in zip(risk_rows, referral_rows)][:10000]
+    service_batch = json.dumps({"records": service_rows}).encode()
+    service_stream = "\n".join(json.dumps(r) for r in service_rows).encode()
+    # Fitted on separate synthetic data so the model cases do not depend on a local artifact
+    model = train(*synthetic_set(MODEL_TRAINING_ROWS, seed=seed + 1), seed=seed)
+    rule_service, model_service = ScoringService(), ScoringService(model=model)
+    _, rule_levels = kidney_risk_batch(risk_columns)
+
+    def export(fmt):
+        def run():
+            out, _ = export_rows(export_slice, fmt)
+            out.close()
+        return run
+
+    return {
+        "risk_single": (lambda: [kidney_risk(dict(r)) for r in risk_rows], rows),
+        "risk_batch": (lambda: kidney_risk_batch(risk_columns), rows),
+        "model_single": (lambda: [model.assess(dict(r)) for r in risk_rows], rows),
+        "model_batch": (lambda: model.levels(model.probability(risk_columns), floor=rule_levels), rows),
+        "dataframe_from_records": (lambda: pd.DataFrame(records), rows),
+        "dashboard_aggregation": (lambda: overall(summarize_by(records)), rows),
+        "dashboard_report": (lambda: render_report(summary), 1),
+        "state_reports": (lambda: render_reports(by_location), len(by_location)),
+        "export_csv": (export("csv"), len(export_slice)),
+        "export_csv_gz": (export("csv.gz"), len(export_slice)),
+        "export_ndjson": (export("ndjson"), len(export_slice)),
+        "export_parquet": (export("parquet"), len(export_slice)),
+        "referral_lookup": (lambda: [referral_facilities(loc, level) for loc, level in referral_rows], rows),
+        "service_batch": (lambda: _asgi_post(rule_service, "/score/batch", service_batch), len(service_rows)),
+        "service_stream": (lambda: _asgi_post(rule_service, "/score/stream", service_stream), len(service_rows)),
+        "service_batch_model": (lambda: _asgi_post(model_service, "/score/batch", service_batch),
+                                len(service_rows)),
+    }
+
+
+def run(rows, seed=0, repeat=5, only=None):
+    """Run the suite and return the JSON-serialisable result document"""
+    start = time.perf_counter()
+    suite = cases(rows, seed)
+    setup = time.perf_counter() - start
+    results = {}
+    for name, (func, processed) in suite.items():
+        if only and name not in only:
+            continue
+        try:
+            timings = _time(func, repeat)
+        except Exception as e:
+            # One broken case (e.g. a missing Parquet engine) must not cost the whole report
+            results[name] = {"error": f"{type(e).__name__}: {e}", "rows": processed}
+            print(f"{name:<24} ERROR {results[name]['error']}", file=sys.stderr)
+            continue
+        best = min(timings)
+        results[name] = {
+            "best_s": best,
+            "median_s": statistics.median(timings),
+            "timings_s": timings,
+            "rows": processed,
+            "rows_per_s": processed / best if best else None,
+        }
+        print(f"{name:<24} best {best * 1000:10.2f} ms   median {statistics.median(timings) * 1000:10.2f} ms"
+              f"   {processed / best if best else 0:14,.0f} rows/s", file=sys.stderr)
+    return {
+        "commit": _git_commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "params": {"rows": rows, "seed": seed, "repeat": repeat},
+        "setup_s": setup,
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance):
+    """Print per-case ratios against a baseline; returns the regressed case names"""
+    regressed = []
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if not before or "error" in before or "error" in result:
+            continue
+        ratio = result["best_s"] / before["best_s"] if before["best_s"] else float("inf")
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  REGRESSION"
+            regressed.append(name)
+        print(f"{name:<24} {ratio:6.2f}x{flag}", file=sys.stderr)
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="run only these cases")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--compare", help="baseline results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="allowed slowdown before a case counts as regressed (default 10%%)")
+    args = parser.parse_args(argv)
+
+    document = run(args.rows, args.seed, args.repeat, args.only)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("params", {}).get("rows") != args.rows:
+            print("warning: baseline was run with a different --rows", file=sys.stderr)
+        if compare(document, baseline, args.tolerance):
+            return 1
+    return 1 if any("error" in result for result in document["results"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
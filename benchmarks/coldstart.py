@@ -0,0 +1,200 @@
+"""Cold-start import and first-paint timings for the Streamlit app
+
+Usage::
+
+    python -m benchmarks.coldstart --repeat 5 --output bench-results/coldstart.json
+    python -m benchmarks.coldstart --compare bench-results/coldstart-baseline.json
+
+Every sample runs in a fresh interpreter, so nothing is imported already:
+
+* ``modules``: ``python -X importtime -c "import <module>"`` for each module
+  the app imports eagerly and each one it defers, cumulative import time.
+* ``app_import``: importing the page shell (what every new server process
+  pays before the first page; page modules load later, on demand), plus
+  the heavy modules that pulled in beyond Streamlit's own.
+* ``pages``: first render of a page through ``streamlit.testing`` with no
+  database credentials, and the heavy modules that render imported.
+
+``--check`` exits 1 if the homepage or About page imports any heavy module.
+"""
+import argparse
+import importlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+# Same driver as benchmarks.loadtest, which is not imported here because it
+# pulls in NumPy and would hide the app's own imports.
+DRIVER = """
+import streamlit as st
+from healthbridge_app.shell import run
+run(st.session_state.get("loadtest_page", "home"), navigation=False)
+"""
+EAGER_MODULES = ("streamlit", "dotenv", "streamlit_option_menu", "healthbridge.tracing",
+                 "healthbridge.risk", "healthbridge.search", "healthbridge.identity",
+                 "healthbridge.history", "healthbridge.ledger", "healthbridge.export",
+                 "healthbridge.summary", "healthbridge.figures", "healthbridge.records",
+                 "healthbridge.timerange")
+DEFERRED_MODULES = ("numpy", "pandas", "plotly.express", "plotly.graph_objects", "plotly.subplots",
+                    "supabase", "requests", "healthbridge.charts", "healthbridge.sketches",
+                    "healthbridge.epi")
+HEAVY_MODULES = ("numpy", "pandas", "plotly", "supabase", "requests", "pyarrow")
+LIGHT_PAGES = ("home", "about")
+SECRETS = {"ADMIN_USERNAME": "admin", "ADMIN_PASSWORD": "cold-start"}
+
+
+def _child(mode, *args):
+    """Run ``mode`` in a fresh interpreter and return its JSON result"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (os.getcwd(), os.getenv("PYTHONPATH")))))
+    proc = subprocess.run([sys.executable, "-m", "benchmarks.coldstart", "--child", mode, *args],
+                          capture_output=True, text=True, env=env)
+    if proc.returncode:
+        return {"error": (proc.stderr.strip().splitlines() or ["exit %d" % proc.returncode])[-1]}
+    return json.loads(proc.stdout)
+
+
+def _new_heavy(before):
+    return sorted(m for m in HEAVY_MODULES if m in sys.modules and m not in before)
+
+
+def child_app():
+    import streamlit  # noqa: F401  (Streamlit's own imports are not the app's cost)
+
+    before = set(sys.modules)
+    start = time.perf_counter()
+    importlib.import_module("healthbridge_app.shell")
+    return {"seconds": time.perf_counter() - start, "heavy_modules": _new_heavy(before)}
+
+
+def child_page(page, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    before = set(sys.modules)
+    app = AppTest.from_string(DRIVER, default_timeout=float(timeout))
+    for key, value in SECRETS.items():
+        app.secrets[key] = value
+    app.session_state["loadtest_page"] = page
+    start = time.perf_counter()
+    app.run()
+    return {"seconds": time.perf_counter() - start, "heavy_modules": _new_heavy(before),
+            "exception": bool(app.exception)}
+
+
+def import_time(module):
+    """Cumulative ``-X importtime`` microseconds for ``module`` in a fresh interpreter"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          capture_output=True, text=True)
+    if proc.returncode:
+        return None
+    best = None
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, self_us, cumulative, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        if name == module:
+            best = int(cumulative)
+    return best
+
+
+def _stats(samples):
+    seconds = [s["seconds"] for s in samples if "seconds" in s]
+    if not seconds:
+        return {"error": samples[0].get("error") if samples else "no samples"}
+    return {"median_s": statistics.median(seconds), "best_s": min(seconds), "timings_s": seconds,
+            "heavy_modules": samples[-1].get("heavy_modules", []),
+            "exceptions": sum(bool(s.get("exception")) for s in samples)}
+
+
+def run(repeat=3, pages=LIGHT_PAGES, timeout=60):
+    """Collect module, app-import and page timings; returns the JSON document"""
+    modules = {}
+    for module in EAGER_MODULES + DEFERRED_MODULES:
+        timings = [t for t in (import_time(module) for _ in range(repeat)) if t is not None]
+        modules[module] = {"deferred": module in DEFERRED_MODULES,
+                           "median_ms": statistics.median(timings) / 1000 if timings else None}
+        if timings:
+            print(f"{module:<28} {modules[module]['median_ms']:9.1f} ms"
+                  f"{'  (deferred)' if module in DEFERRED_MODULES else ''}", file=sys.stderr)
+
+    app_import = _stats([_child("app") for _ in range(repeat)])
+    results = {"app_import": app_import}
+    for page in pages:
+        results[page] = _stats([_child("page", page, str(timeout)) for _ in range(repeat)])
+    for name, result in results.items():
+        if "median_s" in result:
+            print(f"{name:<28} {result['median_s'] * 1000:9.1f} ms  heavy: "
+                  f"{', '.join(result['heavy_modules']) or '-'}", file=sys.stderr)
+        else:
+            print(f"{name:<28} failed: {result['error']}", file=sys.stderr)
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "params": {"repeat": repeat, "pages": list(pages)},
+        "modules": modules,
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance):
+    """Print median ratios against a baseline; returns the regressed names"""
+    regressed = []
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name, {})
+        if "median_s" not in result or not before.get("median_s"):
+            continue
+        ratio = result["median_s"] / before["median_s"]
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  REGRESSION"
+            regressed.append(name)
+        print(f"{name:<28} {ratio:6.2f}x{flag}", file=sys.stderr)
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per measurement")
+    parser.add_argument("--pages", nargs="*", default=list(LIGHT_PAGES), help="registry keys of pages to render")
+    parser.add_argument("--timeout", type=float, default=60, help="per-render timeout in seconds")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--compare", help="baseline results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="allowed slowdown before a result counts as regressed (default 10%%)")
+    parser.add_argument("--check", action="store_true",
+                        help="fail if the homepage or About page imports a heavy module")
+    parser.add_argument("--child", nargs="+", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        mode, *rest = args.child
+        json.dump(child_app() if mode == "app" else child_page(*rest), sys.stdout)
+        return 0
+
+    document = run(args.repeat, args.pages, args.timeout)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        print()
+    status = 0
+    if args.compare:
+        with open(args.compare) as f:
+            if compare(document, json.load(f), args.tolerance):
+                status = 1
+    if args.check:
+        for page in LIGHT_PAGES:
+            heavy = document["results"].get(page, {}).get("heavy_modules")
+            if heavy:
+                print(f"{page} imported {', '.join(heavy)}", file=sys.stderr)
+                status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
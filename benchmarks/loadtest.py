@@ -0,0 +1,363 @@
+"""Concurrent-session load test for the Streamlit app
+
+Usage::
+
+    python -m benchmarks.loadtest --sessions 25 --iterations 4 \\
+        --mix screening=4,dashboard=3,funding=2,admin=1 --db-latency-ms 25
+
+Each simulated session is a ``streamlit.testing`` ``AppTest`` running a
+driver script that does what a page script does on every rerun
+(``healthbridge_app.shell.run``) for the session's current page. The option
+menu is a custom component AppTest cannot click, so the driver skips the
+sidebar and picks the page from session state. Sessions run on threads, the
+same model the Streamlit server uses. Supabase and Paystack are replaced by
+the in-process stand-ins in ``benchmarks.standins``, seeded with synthetic
+data, with optional per-call latency.
+
+The report gives throughput, p50/p95/p99 latency per step, error counts,
+and per-session memory: pickled session-state size and resident-set growth
+divided by the session count.
+"""
+import argparse
+import json
+import os
+import pickle
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
+
+from benchmarks.standins import FakePaystack, FakeSupabase
+from healthbridge.synthetic import FIRST_NAMES, LAST_NAMES, STATES
+
+DRIVER = """
+import streamlit as st
+from healthbridge_app.shell import run
+run(st.session_state.get("loadtest_page", "home"), navigation=False)
+"""
+DEFAULT_MIX = "screening=4,dashboard=3,funding=2,admin=1"
+SECRETS = {"SUPABASE_URL": "http://supabase.local", "SUPABASE_KEY": "load-test",
+           "PAYSTACK_PUBLIC_KEY": "pk_test_load", "PAYSTACK_SECRET_KEY": "sk_test_load",
+           "ADMIN_USERNAME": "admin", "ADMIN_PASSWORD": "load-test"}
+
+
+def parse_mix(text):
+    """'screening=4,dashboard=3' -> {'screening': 4.0, 'dashboard': 3.0}"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in FLOWS:
+            raise ValueError(f"Unknown flow {name.strip()!r}; choose from {', '.join(FLOWS)}")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def _rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+@contextmanager
+def stand_ins(db, paystack):
+    """Route the app's Supabase client and Paystack HTTP calls to the stand-ins"""
+    import requests
+    import supabase
+
+    saved = supabase.create_client, requests.post, requests.get
+    supabase.create_client = lambda url, key, *args, **kwargs: db
+    requests.post, requests.get = paystack.post, paystack.get
+    try:
+        yield
+    finally:
+        supabase.create_client, requests.post, requests.get = saved
+
+
+class _KeepInstance(type):
+    def __setattr__(cls, name, value):
+        if name != "_instance":
+            super().__setattr__(name, value)
+
+
+@contextmanager
+def shared_runtime():
+    """One Streamlit runtime for all sessions, as on a real server
+
+    ``AppTest`` installs a mock runtime for each run and clears it when the
+    run ends, which breaks any other session still running on another
+    thread. Its per-run installs and clears are ignored here while one
+    shared mock runtime stays in place. ``st.secrets`` is set once here too:
+    an ``AppTest`` given secrets swaps the global per run, so concurrent
+    sessions would overwrite each other's. Heavy modules are imported up front,
+    because concurrent first imports of pandas from several threads can see
+    it half initialised.
+    """
+    from unittest.mock import MagicMock
+
+    import streamlit as st
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.secrets import Secrets
+    from streamlit.testing.v1 import app_test
+
+    import pandas  # noqa: F401
+    import plotly.express  # noqa: F401
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    secrets = Secrets([])
+    secrets._secrets = dict(SECRETS)
+    saved_instance, saved_secrets = Runtime._instance, st.secrets
+    Runtime._instance, st.secrets = runtime, secrets
+    app_test.Runtime = _KeepInstance("SharedRuntime", (Runtime,), {})
+    try:
+        yield
+    finally:
+        app_test.Runtime = Runtime
+        Runtime._instance, st.secrets = saved_instance, saved_secrets
+
+
+# ==================== SESSIONS AND FLOWS ====================
+def _find(widgets, label):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    return None
+
+
+class Session:
+    """One simulated browser session driving an AppTest instance"""
+
+    def __init__(self, number, paystack, timeout, seed):
+        from streamlit.testing.v1 import AppTest
+
+        self.number = number
+        self.paystack = paystack
+        self.timeout = timeout
+        self.rng = random.Random(seed * 100003 + number)
+        # app.secrets stays empty so runs keep the st.secrets set by shared_runtime()
+        self.app = AppTest.from_string(DRIVER, default_timeout=timeout)
+        self.samples = []
+        self.errors = defaultdict(int)
+        self.messages = {}
+
+    def step(self, name, action=None):
+        """Run one interaction (``action`` sets widgets first) and time the rerun"""
+        start = time.perf_counter()
+        try:
+            if action is not None:
+                action()
+            self.app.run(timeout=self.timeout)
+            failed = bool(self.app.exception)
+            message = self.app.exception[0].message if failed else None
+        except Exception as e:
+            failed = True
+            message = f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - start
+        self.samples.append((name, elapsed))
+        if failed:
+            self.errors[name] += 1
+            self.messages.setdefault(name, message)
+        return not failed
+
+    def open(self, page):
+        self.app.session_state["loadtest_page"] = page
+        self.app.query_params.clear()
+        return self.step(f"{page}.load")
+
+    def state_bytes(self):
+        """Pickled size of the session's state (unpicklable entries are skipped)"""
+        size = 0
+        # filtered_state leaves out widget internals; iterating the
+        # SafeSessionState itself raises KeyError on integer indexes
+        for value in self.app.session_state.filtered_state.values():
+            try:
+                size += len(pickle.dumps(value))
+            except Exception:
+                pass
+        return size
+
+
+def flow_screening(session):
+    if not session.open("screening"):
+        return
+    app, rng = session.app, session.rng
+
+    def fill():
+        _find(app.text_input, "Full Name*").input(f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}")
+        _find(app.text_input, "Phone Number*").input(f"080{rng.randrange(10 ** 8):08d}")
+        _find(app.number_input, "Age*").set_value(rng.randint(18, 85))
+        _find(app.selectbox, "Location*").set_value(rng.choice(STATES))
+        _find(app.number_input, "Random Blood Glucose (mg/dL)*").set_value(int(rng.lognormvariate(4.65, 0.3)))
+        _find(app.checkbox, "I consent to store my health data securely in the cloud*").check()
+        _find(app.button, "🚀 Analyze My Health Risk").click()
+    session.step("screening.submit", fill)
+
+
+def flow_dashboard(session):
+    if not session.open("dashboard"):
+        return
+    app = session.app
+    strata = _find(app.selectbox, "Stratify by")
+    if strata is not None:
+        session.step("dashboard.prevalence", lambda: strata.set_value(session.rng.choice(list(strata.options))))
+    next_page = _find(app.button, "Next ▶")
+    if next_page is not None:
+        session.step("dashboard.next_page", next_page.click)
+
+
+def flow_funding(session):
+    if not session.open("funding"):
+        return
+    app = session.app
+
+    email = f"donor{session.number}@example.org"
+
+    def donate():
+        _find(app.text_input, "Email Address*").input(email)
+        _find(app.number_input, "Amount (₦)*").set_value(session.rng.choice((1000, 5000, 10000)))
+        _find(app.button, "💳 Proceed to Payment").click()
+    before = set(session.paystack.transactions)
+    if not session.step("funding.donate", donate):
+        return
+    created = [reference for reference, transaction in list(session.paystack.transactions.items())
+               if reference not in before and transaction["customer"]["email"] == email]
+    if created:
+        # Paystack redirects back with ?reference=...
+        app.query_params["reference"] = created[-1]
+        session.step("funding.verify")
+
+
+def flow_admin(session):
+    session.app.session_state["admin_authenticated"] = True
+    session.open("admin")
+
+
+FLOWS = {"screening": flow_screening, "dashboard": flow_dashboard,
+         "funding": flow_funding, "admin": flow_admin}
+
+
+# ==================== RUNNER ====================
+def _run_session(number, mix, iterations, paystack, timeout, seed, start_barrier):
+    try:
+        session = Session(number, paystack, timeout, seed)
+    except Exception:
+        start_barrier.abort()
+        raise
+    names, weights = zip(*mix.items())
+    start_barrier.wait()
+    flows = defaultdict(int)
+    for _ in range(iterations):
+        name = session.rng.choices(names, weights)[0]
+        FLOWS[name](session)
+        flows[name] += 1
+    return session.samples, dict(session.errors), session.messages, dict(flows), session.state_bytes()
+
+
+def run(sessions=10, iterations=3, mix=None, screenings=20000, db_latency_ms=0.0,
+        paystack_latency_ms=0.0, timeout=60, seed=0):
+    """Run the load test and return the JSON-serialisable report"""
+    mix = mix or parse_mix(DEFAULT_MIX)
+    db = FakeSupabase(db_latency_ms).seed(screenings=screenings, seed=seed)
+    paystack = FakePaystack(paystack_latency_ms)
+    barrier = threading.Barrier(sessions + 1)
+    with stand_ins(db, paystack), shared_runtime(), \
+            ThreadPoolExecutor(max_workers=sessions, thread_name_prefix="session") as pool:
+        rss_before = _rss_bytes()
+        futures = [pool.submit(_run_session, n, mix, iterations, paystack, timeout, seed, barrier)
+                   for n in range(sessions)]
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass  # a session failed to start; its error surfaces from result()
+        start = time.perf_counter()
+        outcomes = [f.result() for f in futures]
+        wall = time.perf_counter() - start
+    rss_after = _rss_bytes()
+
+    by_step = defaultdict(list)
+    errors = defaultdict(int)
+    messages = {}
+    flows = defaultdict(int)
+    state_sizes = []
+    for samples, session_errors, session_messages, session_flows, state_bytes in outcomes:
+        for name, elapsed in samples:
+            by_step[name].append(elapsed)
+        for name, count in session_errors.items():
+            errors[name] += count
+        for name, message in session_messages.items():
+            messages.setdefault(name, message)
+        for name, count in session_flows.items():
+            flows[name] += count
+        state_sizes.append(state_bytes)
+
+    steps = {}
+    for name, timings in sorted(by_step.items()):
+        p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+        steps[name] = {"count": len(timings), "errors": errors.get(name, 0), "error": messages.get(name),
+                       "p50_ms": p50 * 1000, "p95_ms": p95 * 1000, "p99_ms": p99 * 1000,
+                       "max_ms": max(timings) * 1000}
+    total_steps = sum(len(t) for t in by_step.values())
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "params": {"sessions": sessions, "iterations": iterations, "mix": mix, "screenings": screenings,
+                   "db_latency_ms": db_latency_ms, "paystack_latency_ms": paystack_latency_ms, "seed": seed},
+        "wall_s": wall,
+        "throughput": {"reruns_per_s": total_steps / wall if wall else None,
+                       "flows_per_s": sum(flows.values()) / wall if wall else None},
+        "flows": dict(flows),
+        "errors": sum(errors.values()),
+        "database_calls": db.calls,
+        "memory": {"session_state_bytes_mean": float(np.mean(state_sizes)) if state_sizes else 0.0,
+                   "rss_growth_bytes": rss_after - rss_before,
+                   "rss_growth_per_session_bytes": (rss_after - rss_before) / sessions},
+        "steps": steps,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent sessions")
+    parser.add_argument("--iterations", type=int, default=3, help="flows per session")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"weighted flow mix (default {DEFAULT_MIX})")
+    parser.add_argument("--screenings", type=int, default=20000, help="seeded screening rows")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0)
+    parser.add_argument("--paystack-latency-ms", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=60, help="per-rerun timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the report JSON here")
+    args = parser.parse_args(argv)
+
+    report = run(args.sessions, args.iterations, parse_mix(args.mix), args.screenings,
+                 args.db_latency_ms, args.paystack_latency_ms, args.timeout, args.seed)
+    for name, step in report["steps"].items():
+        print(f"{name:<32} n={step['count']:<5} p50 {step['p50_ms']:9.1f} ms  p95 {step['p95_ms']:9.1f} ms"
+              f"  p99 {step['p99_ms']:9.1f} ms  errors {step['errors']}", file=sys.stderr)
+    print(f"throughput {report['throughput']['reruns_per_s']:.2f} reruns/s, "
+          f"{report['throughput']['flows_per_s']:.2f} flows/s; "
+          f"~{report['memory']['rss_growth_per_session_bytes'] / 1024 / 1024:.1f} MiB RSS per session",
+          file=sys.stderr)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
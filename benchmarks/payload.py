@@ -0,0 +1,114 @@
+"""Per-page payload in full and lite rendering modes
+
+Usage::
+
+    python -m benchmarks.payload --pages home screening dashboard
+    python -m benchmarks.payload --output bench-results/payload.json
+
+Each page is rendered through ``streamlit.testing`` with no database
+credentials, once per mode, and the screening page is also submitted once.
+The report gives the serialised size of the elements sent to the browser,
+broken down by element type, and the frontend bundles the page makes the
+browser fetch on top (Plotly, map tiles, custom components, remote images).
+Those bundles are usually far larger than the elements themselves.
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+DRIVER = """
+import streamlit as st
+from healthbridge_app.shell import run
+run(st.session_state.get("loadtest_page", "home"), navigation=st.session_state.get("payload_navigation", True))
+"""
+BUNDLES = {"plotly_chart": "plotly.js", "deck_gl_json_chart": "map tiles", "map": "map tiles",
+           "component_instance": "custom component"}
+SECRETS = {"ADMIN_USERNAME": "admin", "ADMIN_PASSWORD": "payload"}
+DEFAULT_PAGES = ("home", "screening", "dashboard", "about")
+
+
+def _elements(node, out):
+    proto = getattr(node, "proto", None)
+    kind = getattr(node, "type", None)
+    if kind and proto is not None and hasattr(proto, "ByteSize"):
+        out[kind] = out.get(kind, 0) + proto.ByteSize()
+        if kind == "imgs":
+            for image in proto.imgs:
+                if image.url.startswith("http"):
+                    out.setdefault("_remote", []).append(image.url)
+    children = getattr(node, "children", None)
+    if isinstance(children, dict):
+        for child in children.values():
+            _elements(child, out)
+    return out
+
+
+def _find(widgets, label):
+    return next((w for w in widgets if w.label == label), None)
+
+
+def submit_screening(app):
+    _find(app.text_input, "Full Name*").input("Adaeze Okafor")
+    _find(app.text_input, "Phone Number*").input("08031234567")
+    _find(app.number_input, "Random Blood Glucose (mg/dL)*").set_value(210)
+    _find(app.checkbox, "I consent to store my health data securely in the cloud*").check()
+    _find(app.button, "🚀 Analyze My Health Risk").click()
+
+
+def measure(page, lite, timeout=60, navigation=True):
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_string(DRIVER, default_timeout=timeout)
+    for key, value in SECRETS.items():
+        app.secrets[key] = value
+    app.session_state["loadtest_page"] = page
+    app.session_state["lite_mode"] = lite
+    app.session_state["payload_navigation"] = navigation
+    app.run()
+    if page == "screening" and not app.exception:
+        submit_screening(app)
+        app.run()
+    elements = _elements(app._tree, {})
+    remote = elements.pop("_remote", [])
+    bundles = sorted({BUNDLES[kind] for kind in elements if kind in BUNDLES} | ({"remote images"} if remote else set()))
+    return {"element_bytes": sum(elements.values()), "by_type": dict(sorted(elements.items())),
+            "bundles": bundles, "remote_images": remote, "exception": bool(app.exception)}
+
+
+def run(pages=DEFAULT_PAGES, timeout=60, navigation=True):
+    results = {}
+    for page in pages:
+        full = measure(page, False, timeout, navigation)
+        lite = measure(page, True, timeout, navigation)
+        ratio = lite["element_bytes"] / full["element_bytes"] if full["element_bytes"] else None
+        results[page] = {"full": full, "lite": lite, "lite_ratio": ratio}
+        print(f"{page:<12} full {full['element_bytes']:8,} B [{', '.join(full['bundles']) or '-'}]"
+              f"   lite {lite['element_bytes']:8,} B [{', '.join(lite['bundles']) or '-'}]"
+              f"   {ratio or 0:.2f}x", file=sys.stderr)
+    return {"created_at": datetime.now().isoformat(timespec="seconds"),
+            "params": {"pages": list(pages), "navigation": navigation}, "results": results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", nargs="*", default=list(DEFAULT_PAGES), help="registry keys of pages")
+    parser.add_argument("--timeout", type=float, default=60, help="per-render timeout in seconds")
+    parser.add_argument("--no-navigation", action="store_true", help="leave out the sidebar")
+    parser.add_argument("--output", help="write the report JSON here")
+    args = parser.parse_args(argv)
+
+    report = run(args.pages, args.timeout, not args.no_navigation)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+    return 1 if any(r[mode]["exception"] for r in report["results"].values() for mode in ("full", "lite")) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
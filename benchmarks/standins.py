@@ -0,0 +1,370 @@
+"""In-process stand-ins for Supabase and Paystack used by the load tests
+
+``FakeSupabase`` implements the slice of the supabase-py / PostgREST query
+builder the app uses (select with projection and estimated counts, insert,
+upsert, update, eq/gte/lt/ilike/or_ filters, order, range, limit, and the
+``apply_payment`` / ``rebuild_funding_ledger`` RPCs) over Python lists
+guarded by one lock. ``FakePaystack`` answers ``transaction/initialize`` and
+``transaction/verify`` the way the live API does. Both can add a fixed
+per-call latency to model network round trips.
+"""
+import re
+import threading
+import time
+import uuid
+
+from healthbridge import synthetic
+from healthbridge.ledger import DAY_SCOPE, TOTALS_TABLE, payment_day
+
+PRIMARY_KEYS = {"patient_identities": "patient_id", "funding_totals": "scope",
+                "funding_ledger": "reference"}
+
+
+class FakeResponse:
+    __slots__ = ("data", "count")
+
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+def _comparable(left, right):
+    if isinstance(left, (int, float)) and isinstance(right, str):
+        try:
+            return left, float(right)
+        except ValueError:
+            return str(left), right
+    if isinstance(left, str) and isinstance(right, (int, float)):
+        return left, str(right)
+    return left, right
+
+
+def _like(pattern):
+    parts = re.split(r"[*%]", pattern)
+    return re.compile(".*".join(re.escape(p) for p in parts), re.IGNORECASE | re.DOTALL)
+
+
+def _predicate(column, op, value):
+    if op == "ilike":
+        regex = _like(str(value))
+        return lambda row: row.get(column) is not None and regex.fullmatch(str(row[column])) is not None
+    if op == "in":
+        values = {str(v) for v in value}
+        return lambda row: str(row.get(column)) in values
+
+    compare = {
+        "eq": lambda a, b: a == b, "neq": lambda a, b: a != b,
+        "gt": lambda a, b: a > b, "gte": lambda a, b: a >= b,
+        "lt": lambda a, b: a < b, "lte": lambda a, b: a <= b,
+    }[op]
+
+    def check(row):
+        current = row.get(column)
+        if current is None:
+            return op == "neq"
+        return compare(*_comparable(current, value))
+    return check
+
+
+class FakeQuery:
+    """Chainable query mirroring postgrest-py's request builders"""
+
+    def __init__(self, db, table):
+        self._db = db
+        self._table = table
+        self._action = "select"
+        self._columns = None
+        self._count = None
+        self._payload = None
+        self._on_conflict = None
+        self._ignore_duplicates = False
+        self._filters = []
+        self._order = []
+        self._range = None
+        self._limit = None
+
+    # ---- actions ----
+    def select(self, columns="*", count=None):
+        self._action = "select"
+        self._columns = None if columns.strip() == "*" else [c.strip() for c in columns.split(",")]
+        self._count = count
+        return self
+
+    def insert(self, payload):
+        self._action, self._payload = "insert", payload
+        return self
+
+    def upsert(self, payload, on_conflict=None, ignore_duplicates=False):
+        self._action, self._payload = "upsert", payload
+        self._on_conflict, self._ignore_duplicates = on_conflict, ignore_duplicates
+        return self
+
+    def update(self, payload):
+        self._action, self._payload = "update", payload
+        return self
+
+    def delete(self):
+        self._action = "delete"
+        return self
+
+    # ---- filters and modifiers ----
+    def _filter(self, column, op, value):
+        self._filters.append(_predicate(column, op, value))
+        return self
+
+    def eq(self, column, value):
+        return self._filter(column, "eq", value)
+
+    def neq(self, column, value):
+        return self._filter(column, "neq", value)
+
+    def gt(self, column, value):
+        return self._filter(column, "gt", value)
+
+    def gte(self, column, value):
+        return self._filter(column, "gte", value)
+
+    def lt(self, column, value):
+        return self._filter(column, "lt", value)
+
+    def lte(self, column, value):
+        return self._filter(column, "lte", value)
+
+    def ilike(self, column, pattern):
+        return self._filter(column, "ilike", pattern)
+
+    def in_(self, column, values):
+        return self._filter(column, "in", values)
+
+    def or_(self, filters):
+        alternatives = []
+        for part in filters.split(","):
+            column, op, value = part.strip().split(".", 2)
+            alternatives.append(_predicate(column, op, value))
+        self._filters.append(lambda row: any(p(row) for p in alternatives))
+        return self
+
+    def order(self, column, desc=False):
+        self._order.append((column, desc))
+        return self
+
+    def range(self, start, end):
+        self._range = (start, end)
+        return self
+
+    def limit(self, count):
+        self._limit = count
+        return self
+
+    def execute(self):
+        return self._db._execute(self)
+
+
+class FakeRPC:
+    def __init__(self, db, name, params):
+        self._db, self._name, self._params = db, name, params
+
+    def execute(self):
+        return self._db._execute_rpc(self._name, self._params)
+
+
+class FakeSupabase:
+    """Thread-safe in-memory tables behind a supabase-py compatible client"""
+
+    def __init__(self, latency_ms=0.0):
+        self.latency = latency_ms / 1000
+        self.tables = {}
+        self.calls = 0
+        self._ids = {}
+        self._lock = threading.Lock()
+
+    # ---- client API ----
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, name, params=None):
+        return FakeRPC(self, name, params or {})
+
+    # ---- seeding ----
+    def load(self, table, rows):
+        with self._lock:
+            target = self.tables.setdefault(table, [])
+            target.extend(dict(r) for r in rows)
+            ids = [r["id"] for r in target if isinstance(r.get("id"), int)]
+            self._ids[table] = max(ids, default=0)
+
+    def seed(self, screenings=10000, volunteers=500, payments=2000, funding_requests=20, seed=0):
+        """Fill the tables with synthetic data"""
+        self.load("screening_data", synthetic.records(synthetic.screenings(screenings, seed=seed)))
+        self.load("volunteers", synthetic.records(synthetic.volunteers(volunteers, seed=seed)))
+        payment_rows = synthetic.records(synthetic.payments(payments, seed=seed, funding_requests=funding_requests))
+        for row in payment_rows:
+            row["metadata"] = {"funding_request_id": row.pop("funding_request_id")}
+        self.load("payments", payment_rows)
+        self.load("funding_requests", [
+            {"id": i, "patient_name": f"Patient {i}", "diagnosis": "Chronic Kidney Disease",
+             "amount_needed": 500000 + 25000 * i, "urgency_level": "High" if i % 3 == 0 else "Medium",
+             "status": "active"}
+            for i in range(1, funding_requests + 1)
+        ])
+        self._rpc("rebuild_funding_ledger", {})
+        return self
+
+    # ---- execution ----
+    def _execute(self, query):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.calls += 1
+            rows = self.tables.setdefault(query._table, [])
+            if query._action == "insert":
+                return FakeResponse(self._insert(query._table, rows, query._payload))
+            if query._action == "upsert":
+                return FakeResponse(self._upsert(query._table, rows, query._payload,
+                                                 query._on_conflict, query._ignore_duplicates))
+            matched = [r for r in rows if all(f(r) for f in query._filters)]
+            if query._action == "update":
+                for row in matched:
+                    row.update(query._payload)
+                return FakeResponse([dict(r) for r in matched])
+            if query._action == "delete":
+                doomed = {id(r) for r in matched}
+                self.tables[query._table] = [r for r in rows if id(r) not in doomed]
+                return FakeResponse([dict(r) for r in matched])
+            return self._select(query, matched)
+
+    def _select(self, query, matched):
+        for column, desc in reversed(query._order):
+            present = [r for r in matched if r.get(column) is not None]
+            missing = [r for r in matched if r.get(column) is None]
+            present.sort(key=lambda r: r[column], reverse=desc)
+            matched = present + missing
+        total = len(matched)
+        if query._range:
+            matched = matched[query._range[0]:query._range[1] + 1]
+        if query._limit is not None:
+            matched = matched[:query._limit]
+        if query._columns:
+            matched = [{c: r.get(c) for c in query._columns} for r in matched]
+        else:
+            matched = [dict(r) for r in matched]
+        return FakeResponse(matched, total if query._count else None)
+
+    def _next_id(self, table):
+        self._ids[table] = self._ids.get(table, 0) + 1
+        return self._ids[table]
+
+    def _insert(self, table, rows, payload):
+        saved = []
+        for record in payload if isinstance(payload, list) else [payload]:
+            record = dict(record)
+            if table not in PRIMARY_KEYS:
+                record.setdefault("id", self._next_id(table))
+            rows.append(record)
+            saved.append(dict(record))
+        return saved
+
+    def _upsert(self, table, rows, payload, on_conflict=None, ignore_duplicates=False):
+        keys = [k.strip() for k in on_conflict.split(",")] if on_conflict else [PRIMARY_KEYS.get(table, "id")]
+        index = {tuple(r.get(k) for k in keys): r for r in rows}
+        saved = []
+        for record in payload if isinstance(payload, list) else [payload]:
+            existing = index.get(tuple(record.get(k) for k in keys))
+            if existing is not None and ignore_duplicates:
+                continue
+            if existing is not None:
+                existing.update(record)
+                saved.append(dict(existing))
+            else:
+                saved.extend(self._insert(table, rows, record))
+        return saved
+
+    def _execute_rpc(self, name, params):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.calls += 1
+            return self._rpc(name, params)
+
+    def _rpc(self, name, params):
+        ledger = self.tables.setdefault("funding_ledger", [])
+        totals = self.tables.setdefault(TOTALS_TABLE, [])
+        if name == "apply_payment":
+            if any(r["reference"] == params["p_reference"] for r in ledger):
+                return FakeResponse(False)
+            ledger.append({"reference": params["p_reference"], "amount": params["p_amount"],
+                           "funding_request_id": params.get("p_request_id")})
+            self._bump(totals, "global", params["p_amount"])
+            self._bump(totals, DAY_SCOPE + payment_day(params.get("p_paid_at")), params["p_amount"])
+            if params.get("p_request_id"):
+                self._bump(totals, f"request:{params['p_request_id']}", params["p_amount"])
+            return FakeResponse(True)
+        if name == "rebuild_funding_ledger":
+            ledger.clear()
+            totals.clear()
+            for payment in self.tables.get("payments", []):
+                if payment.get("status") == "success" and payment.get("reference"):
+                    self._rpc("apply_payment", {
+                        "p_reference": payment["reference"], "p_amount": payment["amount"],
+                        "p_request_id": (payment.get("metadata") or {}).get("funding_request_id"),
+                        "p_paid_at": payment.get("created_at")})
+            return FakeResponse(None)
+        raise ValueError(f"Unknown RPC: {name}")
+
+    @staticmethod
+    def _bump(totals, scope, amount):
+        for row in totals:
+            if row["scope"] == scope:
+                row["amount_raised"] += amount
+                row["donation_count"] += 1
+                return
+        totals.append({"scope": scope, "amount_raised": amount, "donation_count": 1})
+
+
+class _HTTPResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+        self.content = repr(payload).encode()
+
+    def json(self):
+        return self._payload
+
+
+class FakePaystack:
+    """Replacement for ``requests.post`` / ``requests.get`` against api.paystack.co"""
+
+    def __init__(self, latency_ms=0.0, success_rate=1.0):
+        self.latency = latency_ms / 1000
+        self.success_rate = success_rate
+        self.transactions = {}
+        self._lock = threading.Lock()
+        self._counter = 0
+
+    def post(self, url, headers=None, json=None, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        if not url.endswith("/transaction/initialize"):
+            return _HTTPResponse({"status": False, "message": "Not found"}, 404)
+        reference = uuid.uuid4().hex[:12]
+        with self._lock:
+            self._counter += 1
+            succeeded = (self._counter % 100) < self.success_rate * 100
+            self.transactions[reference] = {
+                "reference": reference, "amount": json["amount"], "currency": json.get("currency", "NGN"),
+                "metadata": json.get("metadata") or {}, "customer": {"email": json["email"]},
+                "status": "success" if succeeded else "failed",
+            }
+        return _HTTPResponse({"status": True, "message": "Authorization URL created", "data": {
+            "authorization_url": f"https://checkout.paystack.test/{reference}",
+            "access_code": reference, "reference": reference}})
+
+    def get(self, url, headers=None, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        reference = url.rstrip("/").rsplit("/", 1)[-1]
+        with self._lock:
+            transaction = self.transactions.get(reference)
+        if "/transaction/verify/" not in url or transaction is None:
+            return _HTTPResponse({"status": False, "message": "Transaction reference not found"}, 400)
+        return _HTTPResponse({"status": True, "message": "Verification successful", "data": dict(transaction)})
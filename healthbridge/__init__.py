@@ -0,0 +1,5 @@
+"""Health Bridge Initiative support package
+
+Modules here hold the non-UI building blocks used by the Streamlit app.
+They avoid importing Streamlit so they can be reused by jobs and services.
+"""
@@ -0,0 +1,216 @@
+"""Admission control for outbound writes and payment calls
+
+On camp days and during campaigns, bursts of submissions would otherwise go
+straight to Supabase and Paystack, trip their rate limits and fail together.
+A ``Gate`` sits in front of one upstream and admits a call only when:
+
+* the caller's own token bucket has a token (per client, e.g. per session;
+  calls with no client only count against the global limits),
+* the gate's global token bucket has a token, and
+* fewer than ``max_concurrent`` admitted calls are still running.
+
+Callers over a limit are not failed: they wait in a queue, and an
+``on_wait(position, waited, eta)`` callback lets the page show progress.
+The global bucket and the concurrency cap are handed out in arrival order
+among callers whose own bucket has a token; a caller waiting only on its
+own bucket does not hold up the callers behind it.
+Only a caller still waiting after ``max_wait`` seconds gets ``Throttled``.
+``stats()`` counts admitted, throttled (had to wait) and rejected calls.
+
+Limits are per process; with several app workers each gets its own.
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+from healthbridge.tracing import tracer
+
+MAX_CLIENTS = 10000
+POLL_SECONDS = 0.25
+
+
+class Throttled(Exception):
+    """A call waited longer than its gate's ``max_wait``"""
+
+
+class TokenBucket:
+    """``rate`` tokens per second, holding at most ``burst``"""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate, burst, now=None):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic() if now is None else now
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now, count=1):
+        """Seconds until ``count`` tokens are available (0 if they are)"""
+        self._refill(now)
+        return max(0.0, (count - self.tokens) / self.rate)
+
+    def take(self, now):
+        """Take a token if one is available"""
+        if self.wait_time(now) > 0:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class _Ticket:
+    """One waiting call"""
+
+    __slots__ = ("bucket",)
+
+    def __init__(self, bucket):
+        self.bucket = bucket
+
+
+class Gate:
+    """Per-client and global token buckets plus a concurrency cap in front of one upstream"""
+
+    def __init__(self, name, rate, burst, client_rate, client_burst, max_concurrent, max_wait,
+                 max_clients=MAX_CLIENTS):
+        self.name = name
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.max_concurrent = max_concurrent
+        self.max_wait = max_wait
+        self.max_clients = max_clients
+        self._global = TokenBucket(rate, burst)
+        self._clients = OrderedDict()
+        self._queue = deque()
+        self._in_flight = 0
+        self._ready = threading.Condition()
+        self.admitted = 0
+        self.throttled = 0
+        self.rejected = 0
+        self.waited_seconds = 0.0
+        self.call_seconds = 0.0
+
+    def _client_bucket(self, client):
+        bucket = self._clients.get(client)
+        if bucket is None:
+            bucket = self._clients[client] = TokenBucket(self.client_rate, self.client_burst)
+            while len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        else:
+            self._clients.move_to_end(client)
+        return bucket
+
+    @staticmethod
+    def _client_wait(bucket, now):
+        return bucket.wait_time(now) if bucket is not None else 0.0
+
+    def _ahead(self, ticket, now):
+        """Queued callers before ``ticket`` whose own bucket has a token"""
+        ahead = 0
+        for other in self._queue:
+            if other is ticket:
+                break
+            if self._client_wait(other.bucket, now) <= 0:
+                ahead += 1
+        return ahead
+
+    def _wait_time(self, ticket, now):
+        """0 if ``ticket`` may go now, else how long until it may next be checked"""
+        client_wait = self._client_wait(ticket.bucket, now)
+        if client_wait > 0:
+            return client_wait
+        if self._ahead(ticket, now) or self._in_flight >= self.max_concurrent:
+            return POLL_SECONDS
+        return self._global.wait_time(now)
+
+    def _eta(self, ticket, now):
+        """Rough seconds until ``ticket`` is admitted, from its own bucket, the callers
+        ahead of it on the global bucket, and the concurrency cap"""
+        ahead = self._ahead(ticket, now)
+        eta = max(self._client_wait(ticket.bucket, now), self._global.wait_time(now, ahead + 1))
+        over = self._in_flight + ahead + 1 - self.max_concurrent
+        if over > 0:
+            # ``over`` running calls must finish first, ``max_concurrent`` at a time
+            eta = max(eta, -(-over // self.max_concurrent) * self.call_seconds)
+        return eta
+
+    def acquire(self, client=None, on_wait=None):
+        """Block until the call is admitted and return the admission time (pass it to
+        ``release``); raises ``Throttled`` after ``max_wait`` seconds"""
+        start = time.monotonic()
+        with self._ready:
+            bucket = self._client_bucket(client) if client is not None else None
+            ticket = _Ticket(bucket)
+            self._queue.append(ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = self._wait_time(ticket, now)
+                    if wait <= 0:
+                        if bucket is not None:
+                            bucket.take(now)
+                        self._global.take(now)
+                        break
+                    waited = now - start
+                    if waited >= self.max_wait:
+                        self.rejected += 1
+                        tracer.record(f"admission.{self.name}.rejected", waited)
+                        raise Throttled(f"{self.name} is busy; gave up after {waited:.0f}s")
+                    if on_wait is not None:
+                        position = self._queue.index(ticket) + 1
+                        eta = max(wait, self._eta(ticket, now))
+                        # on_wait may draw to the page, so it runs without the lock
+                        self._ready.release()
+                        try:
+                            on_wait(position, waited, eta)
+                        finally:
+                            self._ready.acquire()
+                    self._ready.wait(min(wait, POLL_SECONDS, self.max_wait - waited))
+            finally:
+                self._queue.remove(ticket)
+                self._ready.notify_all()
+            self._in_flight += 1
+            self.admitted += 1
+            admitted_at = time.monotonic()
+            waited = admitted_at - start
+            if waited > 0.001:
+                self.throttled += 1
+                self.waited_seconds += waited
+                tracer.record(f"admission.{self.name}.wait", waited)
+            return admitted_at
+
+    def release(self, admitted_at=None):
+        """Frees the call's slot; ``admitted_at`` (from ``acquire``) feeds the call time used for etas"""
+        with self._ready:
+            self._in_flight -= 1
+            if admitted_at is not None:
+                held = time.monotonic() - admitted_at
+                self.call_seconds = held if not self.call_seconds else 0.8 * self.call_seconds + 0.2 * held
+            self._ready.notify_all()
+
+    @contextmanager
+    def admit(self, client=None, on_wait=None):
+        """``acquire`` for the duration of a block"""
+        admitted_at = self.acquire(client, on_wait)
+        try:
+            yield
+        finally:
+            self.release(admitted_at)
+
+    def stats(self):
+        with self._ready:
+            return {
+                "gate": self.name,
+                "admitted": self.admitted,
+                "throttled": self.throttled,
+                "rejected": self.rejected,
+                "in_flight": self._in_flight,
+                "queued": len(self._queue),
+                "avg_wait_s": self.waited_seconds / self.throttled if self.throttled else 0.0,
+                "rate": self._global.rate,
+                "client_rate": self.client_rate,
+                "max_concurrent": self.max_concurrent,
+            }
@@ -0,0 +1,105 @@
+"""Adaptive rendering for large-N charts
+
+Scatter plots switch from SVG to WebGL traces above ``WEBGL_THRESHOLD``
+points and to a server-side 2D density heatmap above ``BINNING_THRESHOLD``.
+Histograms are always binned with NumPy on the server, so their payload is
+one bar per bin regardless of row count.
+"""
+import hashlib
+
+import numpy as np
+import plotly.graph_objects as go
+
+WEBGL_THRESHOLD = 5000
+BINNING_THRESHOLD = 100000
+CHART_FIELDS = "age, blood_glucose, risk_score, risk_level"
+RISK_COLORS = {"LOW": "#2ecc71", "MODERATE": "#f39c12", "HIGH": "#e74c3c", "CRITICAL": "#8b0000"}
+
+
+def array_digest(*arrays):
+    """Content digest of NumPy arrays, usable as a figure data version"""
+    digest = hashlib.sha1()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(str(array.dtype).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def scatter_mode(n):
+    """'svg', 'webgl' or 'binned' for a scatter of ``n`` points"""
+    if n > BINNING_THRESHOLD:
+        return "binned"
+    if n > WEBGL_THRESHOLD:
+        return "webgl"
+    return "svg"
+
+
+def histogram_bins(values, nbins=20, value_range=None):
+    """``(counts, edges)`` of the finite values"""
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values)]
+    if not len(values):
+        return np.array([0]), np.array([0.0, 1.0])
+    return np.histogram(values, bins=nbins, range=value_range)
+
+
+def density_bins(x, y, nx=60, ny=40):
+    """2D counts over an (nx, ny) grid of the finite (x, y) pairs"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    keep = np.isfinite(x) & np.isfinite(y)
+    counts, x_edges, y_edges = np.histogram2d(x[keep], y[keep], bins=(nx, ny))
+    return counts, x_edges, y_edges
+
+
+def build_histogram(counts, edges, title, x_title, y_title="Count"):
+    """Bar chart of pre-binned counts"""
+    edges = np.asarray(edges, dtype=float)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=np.asarray(counts),
+        width=np.diff(edges),
+        marker_line_width=0
+    ))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title, bargap=0.02)
+    return fig
+
+
+def _risk_color(level):
+    level = str(level).upper()
+    for key, color in RISK_COLORS.items():
+        if key in level:
+            return color
+    return "#7f7f7f"
+
+
+def build_scatter(x, y, groups, title, x_title, y_title):
+    """Scatter coloured by group, using WebGL or density binning as N grows"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    groups = np.asarray(groups, dtype=object)
+    mode = scatter_mode(len(x))
+    fig = go.Figure()
+    if mode == "binned":
+        counts, x_edges, y_edges = density_bins(x, y)
+        fig.add_trace(go.Heatmap(
+            x=(x_edges[:-1] + x_edges[1:]) / 2,
+            y=(y_edges[:-1] + y_edges[1:]) / 2,
+            z=np.where(counts.T > 0, counts.T, np.nan),
+            colorscale="Viridis",
+            colorbar={"title": "Screenings"},
+            hovertemplate=f"{x_title}: %{{x:.0f}}<br>{y_title}: %{{y:.1f}}<br>Screenings: %{{z}}<extra></extra>"
+        ))
+        title = f"{title} (density of {len(x):,} screenings)"
+    else:
+        trace = go.Scattergl if mode == "webgl" else go.Scatter
+        for group in sorted(set(groups.tolist()), key=str):
+            mask = groups == group
+            fig.add_trace(trace(
+                x=x[mask], y=y[mask], mode="markers", name=str(group),
+                marker={"color": _risk_color(group), "size": 5 if mode == "webgl" else 7,
+                        "opacity": 0.6 if mode == "webgl" else 0.8}
+            ))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title)
+    return fig
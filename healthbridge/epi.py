@@ -0,0 +1,158 @@
+"""Prevalence estimates with confidence intervals, by stratum
+
+Screenings are counted per stratum (state, age band, or both) in one pass,
+then every stratum's interval is computed in a single batched NumPy call.
+Bootstrap intervals resample each stratum as ``Binomial(n, p_hat)``, which
+is equivalent to resampling its individual 0/1 outcomes. Strata that are too
+small or sit at 0% / 100% (where the bootstrap collapses to a point) use the
+Wilson score interval instead.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+from healthbridge.summary import is_high_risk
+
+CONFIDENCE = 0.95
+BOOTSTRAP_DRAWS = 2000
+MIN_BOOTSTRAP_N = 30
+PARALLEL_MIN_DRAWS = 5_000_000
+AGE_BANDS = ((0, "0-17"), (18, "18-29"), (30, "30-44"), (45, "45-59"), (60, "60+"))
+EPI_FIELDS = "age, blood_glucose, risk_score, risk_level, location"
+
+
+def _glucose_at_least(threshold):
+    def outcome(row):
+        try:
+            return float(row.get("blood_glucose")) >= threshold
+        except (TypeError, ValueError):
+            return False
+    return outcome
+
+
+OUTCOMES = {
+    "High risk": is_high_risk,
+    "Pre-diabetes or diabetes glucose (≥140)": _glucose_at_least(140),
+    "Diabetes-range glucose (≥200)": _glucose_at_least(200),
+}
+STRATA = {
+    "State": ("location",),
+    "Age band": ("age_band",),
+    "State × Age band": ("location", "age_band"),
+}
+
+
+def age_band(age):
+    """Label of the age band ``age`` falls in (None if unknown)"""
+    try:
+        age = float(age)
+    except (TypeError, ValueError):
+        return None
+    label = None
+    for lower, band in AGE_BANDS:
+        if age >= lower:
+            label = band
+    return label
+
+
+def _z(confidence):
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def wilson_interval(k, n, confidence=CONFIDENCE):
+    """Wilson score interval for ``k`` successes out of ``n`` (vectorised)"""
+    k = np.asarray(k, dtype=float)
+    n = np.asarray(n, dtype=float)
+    z = _z(confidence)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = k / n
+        denominator = 1 + z * z / n
+        centre = (p + z * z / (2 * n)) / denominator
+        half = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    lower = np.where(n > 0, np.clip(centre - half, 0, 1), np.nan)
+    upper = np.where(n > 0, np.clip(centre + half, 0, 1), np.nan)
+    return lower, upper
+
+
+def _bootstrap_chunk(k, n, draws, confidence, seed):
+    rng = np.random.default_rng(seed)
+    p = k / n
+    samples = rng.binomial(n[:, None].astype(np.int64), p[:, None], size=(len(n), draws)) / n[:, None]
+    alpha = (1 - confidence) / 2
+    lower, upper = np.quantile(samples, [alpha, 1 - alpha], axis=1)
+    return lower, upper
+
+
+def bootstrap_interval(k, n, draws=BOOTSTRAP_DRAWS, confidence=CONFIDENCE, seed=None, workers=None):
+    """Percentile bootstrap intervals for all strata in one batched computation
+
+    With ``workers`` set and more than ``PARALLEL_MIN_DRAWS`` samples, strata
+    are split across worker processes with independent random streams.
+    """
+    k = np.asarray(k, dtype=float)
+    n = np.asarray(n, dtype=float)
+    if not len(n):
+        return np.array([]), np.array([])
+    if not workers or workers == 1 or len(n) * draws < PARALLEL_MIN_DRAWS:
+        return _bootstrap_chunk(k, n, draws, confidence, seed)
+    chunks = np.array_split(np.arange(len(n)), workers)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_bootstrap_chunk, [k[c] for c in chunks], [n[c] for c in chunks],
+                                [draws] * len(chunks), [confidence] * len(chunks), seeds))
+    return (np.concatenate([lower for lower, _ in results]),
+            np.concatenate([upper for _, upper in results]))
+
+
+def prevalence(k, n, draws=BOOTSTRAP_DRAWS, confidence=CONFIDENCE, seed=None, workers=None):
+    """Estimate, interval and method per stratum
+
+    Returns a dict of equal-length arrays: ``estimate``, ``lower``,
+    ``upper`` and ``method`` ("bootstrap" or "wilson").
+    """
+    k = np.asarray(k, dtype=float)
+    n = np.asarray(n, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        estimate = np.where(n > 0, k / n, np.nan)
+    use_bootstrap = (n >= MIN_BOOTSTRAP_N) & (k > 0) & (k < n)
+    lower, upper = wilson_interval(k, n, confidence)
+    if use_bootstrap.any():
+        boot_lower, boot_upper = bootstrap_interval(k[use_bootstrap], n[use_bootstrap],
+                                                    draws, confidence, seed, workers)
+        lower[use_bootstrap] = boot_lower
+        upper[use_bootstrap] = boot_upper
+    method = np.where(use_bootstrap, "bootstrap", "wilson")
+    return {"estimate": estimate, "lower": lower, "upper": upper, "method": method}
+
+
+def stratum_counts(rows, keys, outcome):
+    """``{stratum: [n, k]}`` in one pass; ``age_band`` is derived from ``age``"""
+    counts = {}
+    for row in rows:
+        stratum = tuple((age_band(row.get("age")) if key == "age_band" else row.get(key)) or "Unknown"
+                        for key in keys)
+        cell = counts.get(stratum)
+        if cell is None:
+            cell = counts[stratum] = [0, 0]
+        cell[0] += 1
+        if outcome(row):
+            cell[1] += 1
+    return counts
+
+
+def prevalence_table(counts, keys, **options):
+    """One record per stratum with its prevalence interval, sorted by stratum"""
+    strata = sorted(counts)
+    n = np.array([counts[s][0] for s in strata], dtype=float)
+    k = np.array([counts[s][1] for s in strata], dtype=float)
+    result = prevalence(k, n, **options)
+    records = []
+    for i, stratum in enumerate(strata):
+        record = dict(zip(keys, stratum))
+        record.update(screened=int(n[i]), cases=int(k[i]),
+                      estimate=float(result["estimate"][i]),
+                      lower=float(result["lower"][i]), upper=float(result["upper"][i]),
+                      method=str(result["method"][i]))
+        records.append(record)
+    return records
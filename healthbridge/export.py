@@ -0,0 +1,216 @@
+"""Streaming, chunked table exports (CSV, gzip-CSV, Parquet, NDJSON)
+
+Rows are pulled page by page from an iterator and written chunk by chunk
+into a ``SpooledTemporaryFile`` that moves to disk past ``SPOOL_MAX_BYTES``,
+so peak memory is one chunk of rows plus the spool threshold no matter how
+large the table is. Parquet needs its schema up front, so its chunks are
+spooled once while column types are collected, then written. ``ExportJobs`` runs the same pipeline in the background
+and keeps the finished artifact on disk for download.
+"""
+import csv
+import gzip
+import io
+import itertools
+import json
+import os
+import pickle
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+CHUNK_ROWS = 5000
+
+FORMATS = {
+    "csv": {"label": "CSV", "extension": ".csv", "mime": "text/csv"},
+    "csv.gz": {"label": "CSV (gzip)", "extension": ".csv.gz", "mime": "application/gzip"},
+    "parquet": {"label": "Parquet", "extension": ".parquet", "mime": "application/vnd.apache.parquet"},
+    "ndjson": {"label": "NDJSON", "extension": ".ndjson", "mime": "application/x-ndjson"},
+}
+
+
+def chunked(rows, size=CHUNK_ROWS):
+    """Split any row iterator into lists of at most ``size`` rows"""
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _flat(value):
+    """Scalar form of nested values (dicts/lists become JSON text)"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return value
+
+
+# ==================== WRITERS ====================
+def _write_csv(chunks, out, columns, compress):
+    raw = gzip.GzipFile(fileobj=out, mode="wb") if compress else out
+    text = io.TextIOWrapper(raw, encoding="utf-8", newline="", write_through=True)
+    writer = None
+    rows = 0
+    for chunk in chunks:
+        if writer is None:
+            fields = columns or list(dict.fromkeys(k for row in chunk for k in row))
+            writer = csv.DictWriter(text, fieldnames=fields, extrasaction="ignore")
+            writer.writeheader()
+        writer.writerows({k: _flat(v) for k, v in row.items()} for row in chunk)
+        rows += len(chunk)
+    text.flush()
+    text.detach()
+    if compress:
+        raw.close()
+    return rows
+
+
+def _write_ndjson(chunks, out, columns):
+    rows = 0
+    for chunk in chunks:
+        lines = []
+        for row in chunk:
+            if columns:
+                row = {k: row.get(k) for k in columns}
+            lines.append(json.dumps(row, default=str, ensure_ascii=False))
+        out.write(("\n".join(lines) + "\n").encode("utf-8"))
+        rows += len(chunk)
+    return rows
+
+
+def _column_type(kinds):
+    """Arrow type for a column whose non-null values had Python types ``kinds``"""
+    import pyarrow as pa
+
+    if kinds == {bool}:
+        return pa.bool_()
+    if kinds == {int}:
+        return pa.int64()
+    if kinds and kinds <= {int, float}:
+        return pa.float64()
+    return pa.string()
+
+
+def _write_parquet(chunks, out, columns):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # First pass: spool the chunks and collect every column's value types
+    kinds = {name: set() for name in columns or ()}
+    rows = 0
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, mode="w+b") as spool:
+        for chunk in chunks:
+            records = [{k: _flat(v) for k, v in row.items()} for row in chunk]
+            for record in records:
+                for name, value in record.items():
+                    if columns and name not in kinds:
+                        continue
+                    seen = kinds.setdefault(name, set())
+                    if value is not None:
+                        seen.add(type(value) if isinstance(value, (bool, int, float)) else str)
+            pickle.dump(records, spool, protocol=pickle.HIGHEST_PROTOCOL)
+            rows += len(chunk)
+        if not rows:
+            return 0
+        schema = pa.schema([pa.field(name, _column_type(seen)) for name, seen in kinds.items()])
+        string_fields = [f.name for f in schema if pa.types.is_string(f.type)]
+        float_fields = [f.name for f in schema if pa.types.is_floating(f.type)]
+
+        # Second pass: write every chunk against the schema of the whole export
+        spool.seek(0)
+        with pq.ParquetWriter(out, schema, compression="snappy") as writer:
+            while True:
+                try:
+                    records = pickle.load(spool)
+                except EOFError:
+                    break
+                for record in records:
+                    for name in string_fields:
+                        value = record.get(name)
+                        if value is not None and not isinstance(value, str):
+                            record[name] = str(value)
+                    for name in float_fields:
+                        if record.get(name) is not None:
+                            record[name] = float(record[name])
+                writer.write_table(pa.Table.from_pylist(records, schema=schema))
+    return rows
+
+
+def export_rows(rows, fmt="csv", columns=None, chunk_rows=CHUNK_ROWS, out=None):
+    """Write ``rows`` in ``fmt`` to ``out`` (a new spooled temp file by default)
+
+    Returns ``(file, row_count)`` with the file rewound for reading.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if out is None:
+        out = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, mode="w+b")
+    chunks = chunked(rows, chunk_rows)
+    if fmt in ("csv", "csv.gz"):
+        count = _write_csv(chunks, out, columns, compress=(fmt == "csv.gz"))
+    elif fmt == "ndjson":
+        count = _write_ndjson(chunks, out, columns)
+    else:
+        count = _write_parquet(chunks, out, columns)
+    out.seek(0)
+    return out, count
+
+
+def export_filename(name, fmt):
+    """Dated download name such as screenings_20260101.csv.gz"""
+    return f"{name}_{datetime.now().strftime('%Y%m%d')}{FORMATS[fmt]['extension']}"
+
+
+# ==================== BACKGROUND JOBS ====================
+class ExportJobs:
+    """Background export runner producing on-disk artifacts"""
+
+    def __init__(self, max_workers=2, directory=None):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="export")
+        self._directory = directory or tempfile.mkdtemp(prefix="healthbridge-exports-")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, name, fmt, rows_factory, columns=None):
+        """Queue an export; ``rows_factory()`` is called on the worker to page the table"""
+        job_id = uuid.uuid4().hex[:8]
+        filename = export_filename(name, fmt)
+        job = {"id": job_id, "name": name, "format": fmt, "filename": filename,
+               "path": os.path.join(self._directory, f"{job_id}-{filename}"),
+               "status": "queued", "rows": 0, "error": None,
+               "created_at": datetime.now().isoformat()}
+        with self._lock:
+            self._jobs[job_id] = job
+        self._pool.submit(self._run, job, rows_factory, columns)
+        return job_id
+
+    def _run(self, job, rows_factory, columns):
+        job["status"] = "running"
+        try:
+            with open(job["path"], "w+b") as out:
+                _, job["rows"] = export_rows(rows_factory(), job["format"], columns, out=out)
+            job["size"] = os.path.getsize(job["path"])
+            job["status"] = "done"
+        except Exception as e:
+            job["status"] = "failed"
+            job["error"] = str(e)
+
+    def jobs(self):
+        """All jobs, newest first"""
+        with self._lock:
+            return sorted((dict(j) for j in self._jobs.values()),
+                          key=lambda j: j["created_at"], reverse=True)
+
+    def open(self, job_id):
+        """Open a finished artifact for reading"""
+        return open(self._jobs[job_id]["path"], "rb")
+
+    def discard(self, job_id):
+        """Delete a job and its artifact"""
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+        if job and os.path.exists(job["path"]):
+            os.remove(job["path"])
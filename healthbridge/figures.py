@@ -0,0 +1,65 @@
+"""Figure-spec cache: build each Plotly chart once per data version
+
+Figures are stored as serialised JSON keyed by ``(chart kind, data
+version)``. A cache hit skips plotly.express / graph_objects entirely and
+hands back a fresh dict decoded from the stored JSON, so sessions never share
+a mutable figure. Static templates (the glucose gauge) are built once and
+only their value is patched per request.
+"""
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+
+def data_version(*parts):
+    """Short digest identifying the data a chart is drawn from"""
+    return hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+
+
+class FigureCache:
+    """Bounded LRU of pre-serialised figure JSON"""
+
+    def __init__(self, capacity=256):
+        self._capacity = capacity
+        self._specs = OrderedDict()
+        self._templates = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._specs)
+
+    def spec(self, kind, version, build):
+        """Figure dict for ``kind`` at ``version``; ``build()`` runs only on a miss"""
+        key = (kind, version)
+        with self._lock:
+            cached = self._specs.get(key)
+            if cached is not None:
+                self._specs.move_to_end(key)
+                self.hits += 1
+        if cached is None:
+            cached = build().to_json()
+            with self._lock:
+                self.misses += 1
+                self._specs[key] = cached
+                while len(self._specs) > self._capacity:
+                    self._specs.popitem(last=False)
+        return json.loads(cached)
+
+    def template(self, kind, build):
+        """Decoded spec of a static figure, built once per process"""
+        with self._lock:
+            spec = self._templates.get(kind)
+        if spec is None:
+            spec = json.loads(build().to_json())
+            with self._lock:
+                spec = self._templates.setdefault(kind, spec)
+        return copy.deepcopy(spec)
+
+    def clear(self):
+        with self._lock:
+            self._specs.clear()
+            self._templates.clear()
@@ -0,0 +1,128 @@
+"""Longitudinal patient history: compact per-patient vitals time series
+
+Each patient's recent screenings are held column-wise in ``array('d')``
+buffers (8 bytes per value) behind an LRU cache. A cache miss costs one
+indexed query on ``screening_data (patient_id, timestamp desc)``; new
+screenings are appended write-through so the cache never rescans.
+"""
+import bisect
+import threading
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+VITALS = ("systolic_bp", "diastolic_bp", "blood_glucose", "risk_score")
+HISTORY_FIELDS = "patient_id, timestamp, " + ", ".join(VITALS)
+
+
+def to_epoch(timestamp):
+    """ISO timestamp (or datetime) to POSIX seconds; naive values are taken as UTC"""
+    if not isinstance(timestamp, datetime):
+        timestamp = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
+class VitalsSeries:
+    """Chronological vitals for one patient, capped at ``depth`` points"""
+
+    __slots__ = ("patient_id", "depth", "timestamps") + VITALS
+
+    def __init__(self, patient_id, depth=20):
+        self.patient_id = patient_id
+        self.depth = depth
+        self.timestamps = array("d")
+        for vital in VITALS:
+            setattr(self, vital, array("d"))
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def append(self, record):
+        """Add one screening, keeping time order; repeats of a timestamp are ignored"""
+        try:
+            ts = to_epoch(record["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            return
+        i = bisect.bisect_left(self.timestamps, ts)
+        if i < len(self.timestamps) and self.timestamps[i] == ts:
+            return
+        self.timestamps.insert(i, ts)
+        for vital in VITALS:
+            value = record.get(vital)
+            getattr(self, vital).insert(i, float(value) if value is not None else float("nan"))
+        if len(self.timestamps) > self.depth:
+            del self.timestamps[0]
+            for vital in VITALS:
+                del getattr(self, vital)[0]
+
+    def last(self, n=10):
+        """The most recent ``n`` screenings, oldest first"""
+        start = max(0, len(self) - n)
+        return [
+            dict({"timestamp": datetime.fromtimestamp(self.timestamps[i], timezone.utc)},
+                 **{vital: getattr(self, vital)[i] for vital in VITALS})
+            for i in range(start, len(self))
+        ]
+
+    def deltas(self):
+        """Change of each vital since the previous screening and since the first"""
+        if len(self) < 2:
+            return {}
+        return {
+            vital: {
+                "latest": getattr(self, vital)[-1],
+                "since_previous": getattr(self, vital)[-1] - getattr(self, vital)[-2],
+                "since_first": getattr(self, vital)[-1] - getattr(self, vital)[0],
+            }
+            for vital in VITALS
+        }
+
+    def nbytes(self):
+        """Approximate buffer size of the series"""
+        return len(self.timestamps) * self.timestamps.itemsize * (1 + len(VITALS))
+
+
+class PatientHistoryStore:
+    """LRU cache of VitalsSeries loaded through ``fetch(patient_id, n)``"""
+
+    def __init__(self, fetch, capacity=5000, depth=20):
+        self._fetch = fetch
+        self._capacity = capacity
+        self._depth = depth
+        self._series = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._series)
+
+    def series(self, patient_id):
+        """Vitals series for a patient, loading it with one query on a miss"""
+        with self._lock:
+            series = self._series.get(patient_id)
+            if series is not None:
+                self._series.move_to_end(patient_id)
+                return series
+        series = VitalsSeries(patient_id, self._depth)
+        for row in self._fetch(patient_id, self._depth) or []:
+            series.append(row)
+        with self._lock:
+            # another session may have loaded it meanwhile; keep theirs
+            series = self._series.setdefault(patient_id, series)
+            self._series.move_to_end(patient_id)
+            while len(self._series) > self._capacity:
+                self._series.popitem(last=False)
+            return series
+
+    def record(self, row):
+        """Write-through for a new screening; unseen patients load lazily later"""
+        with self._lock:
+            series = self._series.get(row.get("patient_id"))
+            if series is not None:
+                series.append(row)
+
+    def nbytes(self):
+        """Approximate memory held by cached series buffers"""
+        with self._lock:
+            return sum(s.nbytes() for s in self._series.values())
@@ -0,0 +1,312 @@
+"""Deterministic patient identity resolution and record linkage
+
+A screening is linked to a patient by:
+1. normalising the name (accent/punctuation stripped, tokens sorted) and phone,
+2. an O(1) exact lookup on the deterministic identity key,
+3. otherwise scoring the few candidates that share a blocking key.
+
+Run ``python -m healthbridge.identity`` to relink the existing screening history.
+"""
+import argparse
+import hashlib
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from healthbridge.search import normalize_phone, normalize_text
+
+LINK_THRESHOLD = 0.8
+IDENTITY_TABLE = "patient_identities"
+IDENTITY_FIELDS = ("patient_id", "identity_key", "name", "name_norm", "phone",
+                   "birth_year", "sex", "location", "first_seen", "last_seen")
+
+
+# ==================== NORMALISATION ====================
+def normalize_name(name):
+    """Order-independent name key: 'Okafor  Ngozi' and 'ngozi okafor' agree"""
+    return " ".join(sorted(normalize_text(name).split()))
+
+
+def birth_year(age, timestamp=None):
+    """Approximate birth year from the age reported at screening time"""
+    try:
+        year = datetime.fromisoformat(str(timestamp)).year if timestamp else datetime.now().year
+        return year - int(age)
+    except (TypeError, ValueError):
+        return None
+
+
+def identity_key(name, phone):
+    """Exact-match key for a normalised (name, phone) pair"""
+    return f"{normalize_phone(phone)}|{normalize_name(name)}"
+
+
+def deterministic_patient_id(name, phone):
+    """Stable patient ID: the same person gets the same ID at every camp"""
+    return hashlib.sha1(identity_key(name, phone).encode()).hexdigest()[:10].upper()
+
+
+def blocking_keys(phone):
+    """Candidate blocks: the full number, and its subscriber digits to catch prefix typos"""
+    digits = normalize_phone(phone)
+    keys = []
+    if digits:
+        keys.append(f"p:{digits}")
+    if len(digits) >= 7:
+        keys.append(f"s:{digits[-7:]}")
+    return keys
+
+
+def profile(record):
+    """Comparable identity attributes of a screening record"""
+    return {
+        "name": record.get("name"),
+        "name_norm": normalize_name(record.get("name")),
+        "phone": normalize_phone(record.get("phone")),
+        "birth_year": birth_year(record.get("age"), record.get("timestamp")),
+        "sex": record.get("sex"),
+        "location": record.get("location"),
+    }
+
+
+# ==================== SIMILARITY ====================
+def jaro_winkler(a, b):
+    """Jaro-Winkler similarity in [0, 1]"""
+    if a == b:
+        return 1.0 if a else 0.0
+    if not a or not b:
+        return 0.0
+    window = max(len(a), len(b)) // 2 - 1
+    a_flags = [False] * len(a)
+    b_flags = [False] * len(b)
+    matches = 0
+    for i, ch in enumerate(a):
+        for j in range(max(0, i - window), min(len(b), i + window + 1)):
+            if not b_flags[j] and b[j] == ch:
+                a_flags[i] = b_flags[j] = True
+                matches += 1
+                break
+    if not matches:
+        return 0.0
+    a_matched = [c for c, f in zip(a, a_flags) if f]
+    b_matched = [c for c, f in zip(b, b_flags) if f]
+    transpositions = sum(x != y for x, y in zip(a_matched, b_matched)) / 2
+    jaro = (matches / len(a) + matches / len(b) + (matches - transpositions) / matches) / 3
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * 0.1 * (1 - jaro)
+
+
+def name_similarity(a, b):
+    """Symmetric best-token Jaro-Winkler between two normalised names"""
+    ta, tb = a.split(), b.split()
+    if not ta or not tb:
+        return 0.0
+    forward = sum(max(jaro_winkler(x, y) for y in tb) for x in ta) / len(ta)
+    backward = sum(max(jaro_winkler(y, x) for x in ta) for y in tb) / len(tb)
+    return (forward + backward) / 2
+
+
+def match_score(p, q):
+    """Weighted evidence that two profiles are the same person (0..1)
+
+    A shared phone plus a close name clears LINK_THRESHOLD; a name alone
+    never does, since phones are the only identifier captured at camps.
+    """
+    score = 0.0
+    if p["phone"] and p["phone"] == q["phone"]:
+        score += 0.45
+    elif p["phone"][-7:] and p["phone"][-7:] == q["phone"][-7:]:
+        score += 0.3
+    score += 0.4 * name_similarity(p["name_norm"], q["name_norm"])
+    if p["birth_year"] is not None and q["birth_year"] is not None:
+        gap = abs(p["birth_year"] - q["birth_year"])
+        score += 0.1 if gap <= 1 else (-0.3 if gap > 2 else 0)
+    known = ("Male", "Female")
+    if p["sex"] in known and q["sex"] in known:
+        score += 0.05 if p["sex"] == q["sex"] else -0.3
+    return max(0.0, min(score, 1.0))
+
+
+# ==================== IDENTITY INDEX ====================
+class IdentityIndex:
+    """Identity registry with O(1) exact lookup and blocked fuzzy linking"""
+
+    def __init__(self, rows=()):
+        self._lock = threading.RLock()
+        self._by_key = {}
+        self._by_id = {}
+        self._blocks = {}
+        for row in rows:
+            self._register(row)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def get(self, patient_id):
+        """Identity row for a patient ID, if known"""
+        return self._by_id.get(patient_id)
+
+    def _register(self, identity):
+        self._by_id[identity["patient_id"]] = identity
+        self._by_key[identity["identity_key"]] = identity["patient_id"]
+        for key in blocking_keys(identity.get("phone")):
+            self._blocks.setdefault(key, set()).add(identity["patient_id"])
+
+    def candidates(self, phone):
+        """Patient IDs sharing a blocking key with this phone number"""
+        found = set()
+        for key in blocking_keys(phone):
+            found |= self._blocks.get(key, set())
+        return found
+
+    def link(self, record):
+        """Resolve a screening record to a patient
+
+        Returns ``(patient_id, identity_row, is_new)``. The identity row is
+        updated with the latest sighting and should be persisted by the caller.
+        """
+        with self._lock:
+            key = identity_key(record.get("name"), record.get("phone"))
+            seen_at = record.get("timestamp") or datetime.now().isoformat()
+            patient_id = self._by_key.get(key)
+            if patient_id is None:
+                incoming = profile(record)
+                best, best_score = None, LINK_THRESHOLD
+                for candidate_id in self.candidates(incoming["phone"]):
+                    score = match_score(incoming, self._by_id[candidate_id])
+                    if score >= best_score:
+                        best, best_score = candidate_id, score
+                patient_id = best
+            if patient_id is not None:
+                identity = dict(self._by_id[patient_id], last_seen=seen_at,
+                                location=record.get("location") or self._by_id[patient_id].get("location"))
+                self._by_key[key] = patient_id
+                self._by_id[patient_id] = identity
+                return patient_id, identity, False
+            identity = dict(profile(record), patient_id=deterministic_patient_id(record.get("name"), record.get("phone")),
+                            identity_key=key, first_seen=seen_at, last_seen=seen_at)
+            self._register(identity)
+            return identity["patient_id"], identity, True
+
+
+# ==================== BATCH LINKAGE ====================
+def _link_block(block):
+    """Pairwise-score one block of (index, profile) pairs; returns matched index pairs"""
+    pairs = []
+    for i in range(len(block)):
+        for j in range(i + 1, len(block)):
+            if match_score(block[i][1], block[j][1]) >= LINK_THRESHOLD:
+                pairs.append((block[i][0], block[j][0]))
+    return pairs
+
+
+def link_records(records, workers=None, chunksize=256):
+    """Cluster screening records into patients
+
+    Records are blocked by phone, blocks are scored in parallel worker
+    processes and merged with union-find. Returns a list of
+    ``(patient_id, [record indexes])`` clusters, each keyed by the
+    deterministic ID of its earliest record.
+    """
+    # Records with the same exact identity key are the same person already;
+    # only one representative per key takes part in pairwise scoring.
+    representatives = {}
+    for i, r in enumerate(records):
+        representatives.setdefault(identity_key(r.get("name"), r.get("phone")), []).append(i)
+    blocks = {}
+    for members in representatives.values():
+        p = profile(records[members[0]])
+        keys = blocking_keys(p["phone"])
+        if keys:
+            # the subscriber-digits block is a superset of the full-number block
+            blocks.setdefault(keys[-1], []).append((members[0], p))
+    work = [b for b in blocks.values() if len(b) > 1]
+
+    parent = list(range(len(records)))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def merge(results):
+        for pairs in results:
+            for a, b in pairs:
+                ra, rb = find(a), find(b)
+                if ra != rb:
+                    parent[max(ra, rb)] = min(ra, rb)
+
+    merge([(members[0], m) for m in members[1:]] for members in representatives.values())
+    if workers == 1 or len(work) < chunksize:
+        merge(map(_link_block, work))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            merge(pool.map(_link_block, work, chunksize=chunksize))
+
+    clusters = {}
+    for i in range(len(records)):
+        clusters.setdefault(find(i), []).append(i)
+    linked = []
+    for members in clusters.values():
+        members.sort(key=lambda i: str(records[i].get("timestamp") or ""))
+        first = records[members[0]]
+        linked.append((deterministic_patient_id(first.get("name"), first.get("phone")), members))
+    return linked
+
+
+def identities_from_clusters(records, clusters):
+    """Identity rows for clustered records (earliest record supplies the profile)"""
+    rows = []
+    for patient_id, members in clusters:
+        first, last = records[members[0]], records[members[-1]]
+        rows.append(dict(profile(first), patient_id=patient_id,
+                         identity_key=identity_key(first.get("name"), first.get("phone")),
+                         location=last.get("location"),
+                         first_seen=first.get("timestamp"), last_seen=last.get("timestamp")))
+    return rows
+
+
+def main(argv=None):
+    """Relink the whole screening history in Supabase"""
+    from supabase import create_client
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--dry-run", action="store_true", help="report clusters without writing")
+    args = parser.parse_args(argv)
+
+    client = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_KEY"])
+    records, start, page = [], 0, 1000
+    while True:
+        rows = (client.table("screening_data")
+                .select("id, patient_id, name, phone, age, sex, location, timestamp")
+                .order("id").range(start, start + page - 1).execute().data or [])
+        records.extend(rows)
+        if len(rows) < page:
+            break
+        start += page
+
+    clusters = link_records(records, workers=args.workers)
+    changed = [(pid, [records[i]["id"] for i in members if records[i].get("patient_id") != pid])
+               for pid, members in clusters]
+    changed = [(pid, ids) for pid, ids in changed if ids]
+    print(f"{len(records)} screenings -> {len(clusters)} patients; "
+          f"{sum(len(ids) for _, ids in changed)} records to relink")
+    if args.dry_run:
+        return
+
+    identities = identities_from_clusters(records, clusters)
+    for i in range(0, len(identities), page):
+        client.table(IDENTITY_TABLE).upsert(identities[i:i + page]).execute()
+    for pid, ids in changed:
+        client.table("screening_data").update({"patient_id": pid}).in_("id", ids).execute()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Deferred imports for heavy modules
+
+``lazy_import("pandas")`` returns a stand-in that imports pandas the first
+time an attribute is read, so ``pd = lazy_import("pandas")`` at the top of a
+page module costs nothing until that page actually builds a DataFrame.
+After the first access the stand-in forwards straight to the real module.
+``loaded()`` lists which of the tracked modules have been imported so far,
+which the cold-start benchmark uses to check the homepage stays light.
+"""
+import importlib
+import sys
+import threading
+import time
+
+_lock = threading.Lock()
+_proxies = {}
+_import_seconds = {}
+
+
+class LazyModule:
+    """Module stand-in that imports ``name`` on first attribute access"""
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_module", None)
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            with _lock:
+                module = self._module
+                if module is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._name)
+                    _import_seconds.setdefault(self._name, time.perf_counter() - start)
+                    object.__setattr__(self, "_module", module)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name):
+    """Shared ``LazyModule`` for ``name`` (one per module name per process)"""
+    with _lock:
+        proxy = _proxies.get(name)
+        if proxy is None:
+            proxy = _proxies[name] = LazyModule(name)
+        return proxy
+
+
+def loaded():
+    """``{module name: import seconds}`` for lazy modules imported so far
+
+    Modules already in ``sys.modules`` before their first access show up
+    with the (near zero) time it took to fetch them.
+    """
+    return {name: _import_seconds[name] for name in _proxies
+            if name in _import_seconds and name in sys.modules}
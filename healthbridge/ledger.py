@@ -0,0 +1,102 @@
+"""Funding ledger: running donation totals applied once per payment reference
+
+The authoritative ledger lives in Postgres (``apply_payment`` /
+``rebuild_funding_ledger`` in supabase/migrations); ``FundingLedger`` mirrors
+the same semantics in memory for offline sessions, jobs and benchmarks.
+Reads never touch the payments table: totals are kept per scope, globally,
+per funding request and per day (``day:YYYY-MM-DD``) for the trend chart.
+"""
+import threading
+from datetime import datetime, timezone
+
+LEDGER_TABLE = "funding_ledger"
+TOTALS_TABLE = "funding_totals"
+GLOBAL_SCOPE = "global"
+REQUEST_SCOPE = "request:"
+DAY_SCOPE = "day:"
+
+
+def empty_totals():
+    """Totals snapshot with nothing raised yet"""
+    return {"amount_raised": 0.0, "donation_count": 0, "requests": {}, "daily": {}}
+
+
+def payment_day(timestamp=None):
+    """``YYYY-MM-DD`` of an ISO timestamp, or today's UTC date"""
+    if timestamp:
+        return str(timestamp)[:10]
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def totals_from_rows(rows):
+    """Build a totals snapshot from ``funding_totals`` rows"""
+    totals = empty_totals()
+    for row in rows or []:
+        scope = row.get("scope") or ""
+        amount = float(row.get("amount_raised") or 0)
+        count = int(row.get("donation_count") or 0)
+        if scope == GLOBAL_SCOPE:
+            totals["amount_raised"], totals["donation_count"] = amount, count
+        elif scope.startswith(REQUEST_SCOPE):
+            totals["requests"][scope[len(REQUEST_SCOPE):]] = amount
+        elif scope.startswith(DAY_SCOPE):
+            totals["daily"][scope[len(DAY_SCOPE):]] = amount
+    return totals
+
+
+class FundingLedger:
+    """In-memory ledger with idempotent, atomic application of confirmed payments"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._amount = 0.0
+        self._count = 0
+        self._requests = {}
+        self._daily = {}
+
+    def _add(self, amount, request_key, day):
+        self._amount += amount
+        self._count += 1
+        if request_key is not None:
+            self._requests[request_key] = self._requests.get(request_key, 0.0) + amount
+        self._daily[day] = self._daily.get(day, 0.0) + amount
+
+    def apply(self, reference, amount, request_id=None, day=None):
+        """Add a confirmed payment; returns False if the reference was already applied"""
+        entry = (float(amount), str(request_id) if request_id is not None else None, payment_day(day))
+        with self._lock:
+            if reference in self._entries:
+                return False
+            self._entries[reference] = entry
+            self._add(*entry)
+            return True
+
+    def recompute(self):
+        """Rebuild the running totals from the applied payments"""
+        with self._lock:
+            self._amount, self._count, self._requests, self._daily = 0.0, 0, {}, {}
+            for entry in self._entries.values():
+                self._add(*entry)
+
+    def snapshot(self):
+        """Current totals in the same shape as ``totals_from_rows``"""
+        with self._lock:
+            return {"amount_raised": self._amount, "donation_count": self._count,
+                    "requests": dict(self._requests), "daily": dict(self._daily)}
+
+    def request_total(self, request_id):
+        """Amount raised for one funding request"""
+        return self._requests.get(str(request_id), 0.0)
+
+    @classmethod
+    def rebuild(cls, payments):
+        """Recompute the ledger from raw payment rows (successful ones only)"""
+        ledger = cls()
+        for payment in payments or []:
+            if payment.get("status") != "success" or not payment.get("reference"):
+                continue
+            metadata = payment.get("metadata") or {}
+            ledger.apply(payment["reference"], payment.get("amount") or 0,
+                         metadata.get("funding_request_id"), payment.get("created_at"))
+        return ledger
@@ -0,0 +1,182 @@
+"""Low-bandwidth rendering helpers for field devices on 2G/3G
+
+``wants_lite(headers)`` picks lite mode from request headers: the browser's
+Save-Data preference, Network Information client hints (``ECT``,
+``Downlink``) and user agents of feature-phone browsers. ``figure_svg``
+turns a Plotly figure spec into a small static SVG (bars and pies as
+horizontal bars, lines as polylines), so a lite page never loads the
+Plotly bundle. ``qr_svg``
+draws QR codes locally with segno instead of fetching them from a remote
+QR service.
+"""
+import base64
+import math
+from html import escape
+
+SLOW_CONNECTIONS = ("slow-2g", "2g", "3g")
+LITE_DOWNLINK_MBPS = 1.5
+LITE_USER_AGENTS = ("kaios", "opera mini", "opera mobi", "ucbrowser", "nokia", "series40")
+PALETTE = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f")
+CHART_WIDTH = 360
+CHART_HEIGHT = 180
+MAX_POINTS = 500
+MAX_BARS = 24
+
+
+def wants_lite(headers):
+    """True if the request looks like it comes from a slow or data-saving client"""
+    headers = {k.lower(): v for k, v in (headers or {}).items()}
+    if headers.get("save-data", "").strip().lower() == "on":
+        return True
+    if headers.get("ect", "").strip().lower() in SLOW_CONNECTIONS:
+        return True
+    try:
+        if float(headers.get("downlink", "")) < LITE_DOWNLINK_MBPS:
+            return True
+    except ValueError:
+        pass
+    agent = headers.get("user-agent", "").lower()
+    return any(token in agent for token in LITE_USER_AGENTS)
+
+
+# ==================== QR CODES ====================
+def qr_svg(data, scale=4, border=2):
+    """QR code for ``data`` as an SVG document (needs the segno package)"""
+    import segno
+
+    return segno.make(data, error="m").svg_inline(scale=scale, border=border, dark="#000", light="#fff")
+
+
+# ==================== STATIC CHARTS ====================
+def _values(value):
+    """Plain list from a Plotly JSON array (list or typed-array ``bdata``)"""
+    if value is None:
+        return []
+    if isinstance(value, dict) and "bdata" in value:
+        import numpy as np
+
+        return np.frombuffer(base64.b64decode(value["bdata"]), dtype=value["dtype"]).tolist()
+    return list(value)
+
+
+def _number(value):
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _fmt(value):
+    if abs(value) >= 1e6:
+        return f"{value / 1e6:.1f}M"
+    if abs(value) >= 1e4:
+        return f"{value / 1e3:.0f}k"
+    return f"{value:.0f}" if float(value).is_integer() else f"{value:.1f}"
+
+
+def _title(spec):
+    title = (spec.get("layout") or {}).get("title")
+    if isinstance(title, dict):
+        title = title.get("text")
+    return title or ""
+
+
+def _svg(title, body, height):
+    title_text = f'<text x="4" y="14" font-size="12" font-weight="bold">{escape(str(title))}</text>' if title else ""
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {CHART_WIDTH} {height}" '
+            f'width="{CHART_WIDTH}" height="{height}" font-family="sans-serif" font-size="10">'
+            f'{title_text}{body}</svg>')
+
+
+def _bars(title, labels, values):
+    pairs = [(str(l), v) for l, v in zip(labels, values) if v is not None][:MAX_BARS]
+    if not pairs:
+        return None
+    top = max(v for _, v in pairs) or 1
+    row = 16
+    label_width = 110
+    span = CHART_WIDTH - label_width - 50
+    parts = []
+    for i, (label, value) in enumerate(pairs):
+        y = 22 + i * row
+        width = max(0.0, value / top * span)
+        parts.append(f'<text x="{label_width - 4}" y="{y + 11}" text-anchor="end">{escape(label[:18])}</text>'
+                     f'<rect x="{label_width}" y="{y + 2}" width="{width:.1f}" height="{row - 4}" fill="{PALETTE[0]}"/>'
+                     f'<text x="{label_width + width + 4:.1f}" y="{y + 11}">{_fmt(value)}</text>')
+    return _svg(title, "".join(parts), 26 + len(pairs) * row)
+
+
+def _panel(traces, top, height):
+    series = []
+    for trace in traces:
+        ys = [_number(v) for v in _values(trace.get("y"))][-MAX_POINTS:]
+        if any(v is not None for v in ys):
+            series.append((trace.get("name") or "", ys))
+    if not series:
+        return ""
+    finite = [v for _, ys in series for v in ys if v is not None]
+    low, high = min(finite), max(finite)
+    high = high if high > low else low + 1
+    left, width, plot = 36, CHART_WIDTH - 44, height - 16
+    parts = [f'<text x="{left - 4}" y="{top + 8}" text-anchor="end">{_fmt(high)}</text>'
+             f'<text x="{left - 4}" y="{top + plot}" text-anchor="end">{_fmt(low)}</text>'
+             f'<line x1="{left}" y1="{top + plot}" x2="{left + width}" y2="{top + plot}" stroke="#999"/>']
+    for i, (name, ys) in enumerate(series):
+        step = width / max(1, len(ys) - 1)
+        points = " ".join(f"{left + j * step:.1f},{top + plot - (v - low) / (high - low) * plot:.1f}"
+                          for j, v in enumerate(ys) if v is not None)
+        colour = PALETTE[i % len(PALETTE)]
+        parts.append(f'<polyline points="{points}" fill="none" stroke="{colour}" stroke-width="1.5"/>')
+        if name and len(series) > 1:
+            parts.append(f'<text x="{left + 4 + i * 80}" y="{top + height - 2}" fill="{colour}">'
+                         f'{escape(str(name)[:14])}</text>')
+    return "".join(parts)
+
+
+def _lines(title, traces):
+    """One panel per y axis, so subplots keep their own scales"""
+    axes = {}
+    for trace in traces:
+        axes.setdefault(trace.get("yaxis", "y"), []).append(trace)
+    panel = CHART_HEIGHT - 40 if len(axes) == 1 else 90
+    body = "".join(_panel(group, 22 + i * panel, panel) for i, group in enumerate(axes.values()))
+    return _svg(title, body, 26 + len(axes) * panel) if body else None
+
+
+def figure_svg(spec):
+    """Static SVG for a Plotly figure spec, or None if its traces are not supported
+
+    Bar traces (including histograms drawn as bars) and pies become ranked
+    horizontal bars; line traces become polylines, one panel per y axis.
+    Marker-only scatters, heatmaps, indicators and other trace types return
+    None so the caller can fall back to plain metrics.
+    """
+    traces = spec.get("data") or []
+    if not traces:
+        return None
+    title = _title(spec)
+    kinds = {trace.get("type", "scatter") for trace in traces}
+    if kinds == {"pie"}:
+        trace = traces[0]
+        return _bars(title, _values(trace.get("labels")), [_number(v) for v in _values(trace.get("values"))])
+    if kinds == {"bar"}:
+        labels, values = [], []
+        for trace in traces:
+            x, y = _values(trace.get("x")), _values(trace.get("y"))
+            if trace.get("orientation") == "h":
+                x, y = y, x
+            labels += [l if isinstance(l, str) else _fmt(_number(l) or 0) for l in x]
+            values += [_number(v) for v in y]
+        return _bars(title, labels, values)
+    if kinds == {"scatter"} and all("lines" in trace.get("mode", "lines") for trace in traces):
+        return _lines(title, traces)
+    return None
+
+
+def figure_summary(spec):
+    """One line describing a figure when no static image can be drawn"""
+    traces = spec.get("data") or []
+    points = sum(len(_values(t.get("x") or t.get("values") or t.get("z"))) for t in traces)
+    title = _title(spec) or "Chart"
+    return f"{title}: {points:,} data points (chart hidden in lite mode)"
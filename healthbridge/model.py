@@ -0,0 +1,362 @@
+"""Fitted kidney risk model: offline training and vectorised inference
+
+A logistic regression over the same inputs as the rule score
+(``healthbridge.risk``), trained on screenings joined to referral outcomes
+(``referral_outcomes.ckd_confirmed``). Training is Newton's method in NumPy
+on CPU; the fitted artifact is a small ``.npz`` file (coefficients, band
+thresholds, metadata; no pickle) that the app loads once and caches.
+
+Inference is one matrix-vector product: ``RiskModel.probability`` takes
+columns like ``kidney_risk_batch`` does, and ``RiskModel.assess`` scores one
+form submission through the same path in well under a millisecond. The
+probability is mapped to the rule score's risk bands with thresholds chosen
+at training time so each band flags the same share of the training
+screenings as the rules did. Until the model is validated against referral
+outcomes it may only raise a screening's band: the result is the higher of
+the model band and the rule band, so a rule HIGH is never re-banded (and
+referred) as MODERATE or LOW. The rule result is kept alongside as the
+baseline (``rule_risk_level``, ``score``) and is what callers fall back to
+when no artifact is present.
+
+Usage::
+
+    python -m healthbridge.model train --screenings screenings.ndjson \\
+        --outcomes referral_outcomes.csv --output models/kidney_risk.npz
+    python -m healthbridge.model train --synthetic 200000 --output models/kidney_risk.npz
+    python -m healthbridge.model evaluate --model models/kidney_risk.npz --synthetic 50000 --seed 1
+
+Screenings and outcomes are CSV (optionally gzipped) or NDJSON exports,
+such as the admin page's table exports.
+"""
+import argparse
+import csv
+import gzip
+import json
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+
+from healthbridge.risk import RISK_BANDS, URINE_PROTEIN_SCORES, kidney_risk, kidney_risk_batch
+
+MODEL_VERSION = 1
+DEFAULT_MODEL_PATH = os.path.join("models", "kidney_risk.npz")
+YES_NO_FEATURES = ("known_diabetes", "known_hypertension", "family_history", "herbal_use", "smoking")
+FEATURES = ("systolic_bp", "diastolic_bp", "blood_glucose", "bmi", "age", "urine_protein") + YES_NO_FEATURES
+MODEL_INPUTS = FEATURES[:3] + ("weight", "height", "bmi", "age", "urine_protein") + YES_NO_FEATURES
+# Used when a field is missing; the screening form always sends all of them
+NEUTRAL_VALUES = {"blood_glucose": 100.0, "bmi": 25.0, "age": 40.0}
+TEST_FRACTION = 0.2
+L2_PENALTY = 1.0
+MAX_ITERATIONS = 50
+# Position of each level in RISK_BANDS; lower is more severe
+BAND_RANK = {band[1]: rank for rank, band in enumerate(RISK_BANDS)}
+
+
+def model_path():
+    return os.getenv("HEALTHBRIDGE_RISK_MODEL", DEFAULT_MODEL_PATH)
+
+
+# ==================== FEATURES ====================
+def _numbers(columns, name, n):
+    value = columns.get(name)
+    if value is None:
+        return np.full(n, NEUTRAL_VALUES.get(name, 0.0))
+    values = np.asarray(value, dtype=float)
+    return np.where(np.isnan(values), NEUTRAL_VALUES.get(name, 0.0), values)
+
+
+def feature_matrix(columns):
+    """``(n, len(FEATURES))`` float matrix from column arrays (as for ``kidney_risk_batch``)
+
+    Missing values (``None``/NaN) count as ``NEUTRAL_VALUES``, or 0 / "No".
+    """
+    systolic = np.asarray(columns["systolic_bp"], dtype=float)
+    n = len(systolic)
+    X = np.empty((n, len(FEATURES)))
+    X[:, 0] = systolic
+    X[:, 1] = _numbers(columns, "diastolic_bp", n)
+    X[:, 2] = _numbers(columns, "blood_glucose", n)
+    if columns.get("weight") is not None and columns.get("height") is not None:
+        height_m = np.asarray(columns["height"], dtype=float) / 100
+        X[:, 3] = _numbers({"bmi": np.asarray(columns["weight"], dtype=float) / height_m ** 2}, "bmi", n)
+    else:
+        X[:, 3] = _numbers(columns, "bmi", n)
+    X[:, 4] = _numbers(columns, "age", n)
+    urine = np.asarray(columns["urine_protein"], dtype=object)
+    X[:, 5] = 0.0
+    for label, value in URINE_PROTEIN_SCORES.items():
+        X[urine == label, 5] = value
+    for i, field in enumerate(YES_NO_FEATURES, start=6):
+        value = columns.get(field)
+        X[:, i] = 0.0 if value is None else (np.asarray(value, dtype=object) == "Yes")
+    return X
+
+
+def record_columns(records):
+    """Model input columns from a list of screening dicts"""
+    return {name: [record.get(name) for record in records] for name in MODEL_INPUTS}
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -35, 35)))
+
+
+# ==================== MODEL ====================
+class RiskModel:
+    """Fitted logistic model; coefficients are on the raw feature scale"""
+
+    __slots__ = ("coef", "intercept", "thresholds", "metadata")
+
+    def __init__(self, coef, intercept, thresholds, metadata=None):
+        self.coef = np.asarray(coef, dtype=float)
+        self.intercept = float(intercept)
+        # Minimum probability for each of RISK_BANDS[:-1], highest band first
+        self.thresholds = np.asarray(thresholds, dtype=float)
+        self.metadata = metadata or {}
+
+    def probability(self, columns):
+        """Probability of confirmed CKD for each row of ``columns``"""
+        return _sigmoid(feature_matrix(columns) @ self.coef + self.intercept)
+
+    def levels(self, probabilities, floor=None):
+        """Risk band labels for an array of probabilities
+
+        ``floor`` is an optional array of rule levels; no label is lower than
+        its rule level.
+        """
+        probabilities = np.asarray(probabilities, dtype=float)
+        levels = np.full(len(probabilities), RISK_BANDS[-1][1], dtype=object)
+        for threshold, band in zip(self.thresholds[::-1], RISK_BANDS[-2::-1]):
+            levels[probabilities >= threshold] = band[1]
+        if floor is not None:
+            floor = np.asarray(floor, dtype=object)
+            rank = np.vectorize(BAND_RANK.get, otypes=[int])
+            levels = np.where(rank(floor) < rank(levels), floor, levels)
+        return levels
+
+    def band(self, probability):
+        """``(level, recommendation, timeline)`` for one probability"""
+        for threshold, band in zip(self.thresholds, RISK_BANDS):
+            if probability >= threshold:
+                return band[1:]
+        return RISK_BANDS[-1][1:]
+
+    def assess(self, data):
+        """``kidney_risk`` result with the model's band; the rule result is kept as the baseline"""
+        rule = kidney_risk(data)
+        return self.overlay(rule, float(self.probability(record_columns([data]))[0]))
+
+    def assess_many(self, records, rules):
+        """``assess`` for records whose rule results are already known, in one matrix product"""
+        probabilities = self.probability(record_columns(records))
+        return [self.overlay(rule, float(p)) for rule, p in zip(rules, probabilities)]
+
+    def overlay(self, rule, probability):
+        """A rule result raised to the model's band when that is higher, never lowered"""
+        model_level, recommendation, timeline = self.band(probability)
+        level = model_level
+        if BAND_RANK.get(rule['risk_level'], len(RISK_BANDS)) < BAND_RANK[model_level]:
+            level, recommendation, timeline = rule['risk_level'], rule['recommendation'], rule['timeline']
+        return {
+            **rule,
+            'risk_level': level,
+            'recommendation': recommendation,
+            'timeline': timeline,
+            'probability': round(probability, 4),
+            'model_risk_level': model_level,
+            'rule_risk_level': rule['risk_level'],
+            'method': 'model',
+            'model_trained_at': self.metadata.get('trained_at'),
+        }
+
+    def save(self, path):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(f, coef=self.coef, intercept=np.asarray([self.intercept]), thresholds=self.thresholds,
+                     features=np.asarray(FEATURES), metadata=np.asarray(json.dumps(self.metadata)))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as artifact:
+            if tuple(artifact["features"].tolist()) != FEATURES:
+                raise ValueError(f"{path} was trained on different features")
+            metadata = json.loads(str(artifact["metadata"]))
+            if metadata.get("model_version") != MODEL_VERSION:
+                raise ValueError(f"{path} is model version {metadata.get('model_version')}, expected {MODEL_VERSION}")
+            return cls(artifact["coef"], artifact["intercept"][0], artifact["thresholds"], metadata)
+
+
+def load_model(path=None):
+    """The model at ``path`` (default ``model_path()``), or None if there is none"""
+    path = path or model_path()
+    if not os.path.exists(path):
+        return None
+    return RiskModel.load(path)
+
+
+# ==================== TRAINING ====================
+def fit_logistic(X, y, l2=L2_PENALTY, max_iter=MAX_ITERATIONS, tol=1e-8):
+    """L2-regularised logistic regression by Newton's method; returns ``(coef, intercept)``"""
+    mean = X.mean(axis=0)
+    scale = X.std(axis=0)
+    scale[scale == 0] = 1.0
+    A = np.hstack([np.ones((len(X), 1)), (X - mean) / scale])
+    penalty = np.full(A.shape[1], float(l2))
+    penalty[0] = 0.0
+    w = np.zeros(A.shape[1])
+    for _ in range(max_iter):
+        p = _sigmoid(A @ w)
+        gradient = A.T @ (p - y) + penalty * w
+        hessian = (A.T * (p * (1 - p))) @ A + np.diag(penalty)
+        step = np.linalg.solve(hessian, gradient)
+        w -= step
+        if np.abs(step).max() < tol:
+            break
+    coef = w[1:] / scale
+    return coef, w[0] - coef @ mean
+
+
+def band_thresholds(probabilities, rule_scores):
+    """Probability cut-offs flagging the same share of rows per band as the rule score"""
+    thresholds = []
+    for minimum, *_ in RISK_BANDS[:-1]:
+        share = float(np.mean(rule_scores >= minimum))
+        thresholds.append(np.quantile(probabilities, 1 - share) if share > 0 else np.inf)
+    return np.maximum.accumulate(np.asarray(thresholds)[::-1])[::-1]
+
+
+def auc(y, scores):
+    """Area under the ROC curve (ties share their average rank)"""
+    y = np.asarray(y, dtype=bool)
+    scores = np.asarray(scores, dtype=float)
+    positives, negatives = y.sum(), (~y).sum()
+    if not positives or not negatives:
+        return None
+    order = np.argsort(scores, kind="mergesort")
+    _, inverse, counts = np.unique(scores[order], return_inverse=True, return_counts=True)
+    ranks = np.empty(len(scores))
+    ranks[order] = (np.cumsum(counts) - (counts - 1) / 2)[inverse]
+    return float((ranks[y].sum() - positives * (positives + 1) / 2) / (positives * negatives))
+
+
+def evaluate(model, columns, y):
+    """Model and rule-score metrics on labelled screenings"""
+    y = np.asarray(y, dtype=float)
+    probabilities = model.probability(columns)
+    rule_scores, _ = kidney_risk_batch(columns)
+    return {
+        "rows": int(len(y)),
+        "positive_rate": float(y.mean()) if len(y) else None,
+        "auc_model": auc(y, probabilities),
+        "auc_rule": auc(y, rule_scores),
+        "brier_model": float(np.mean((probabilities - y) ** 2)) if len(y) else None,
+    }
+
+
+def _take(columns, index):
+    return {name: np.asarray(values)[index] for name, values in columns.items()}
+
+
+def train(columns, y, groups=None, seed=0, l2=L2_PENALTY):
+    """Fit on ``columns`` with labels ``y``; a held-out share (by patient if ``groups``) scores it"""
+    y = np.asarray(y, dtype=float)
+    rng = np.random.default_rng(seed)
+    if groups is not None:
+        unique, inverse = np.unique(np.asarray(groups, dtype=str), return_inverse=True)
+        test = (rng.random(len(unique)) < TEST_FRACTION)[inverse]
+    else:
+        test = rng.random(len(y)) < TEST_FRACTION
+    train_columns = _take(columns, ~test)
+    coef, intercept = fit_logistic(feature_matrix(train_columns), y[~test], l2=l2)
+    probabilities = _sigmoid(feature_matrix(train_columns) @ coef + intercept)
+    rule_scores, _ = kidney_risk_batch(train_columns)
+    model = RiskModel(coef, intercept, band_thresholds(probabilities, rule_scores))
+    model.metadata = {
+        "model_version": MODEL_VERSION,
+        "trained_at": datetime.now().isoformat(timespec="seconds"),
+        "train_rows": int((~test).sum()),
+        "l2": l2,
+        "seed": seed,
+        "holdout": evaluate(model, _take(columns, test), y[test]),
+    }
+    return model
+
+
+# ==================== DATA ====================
+def read_rows(path):
+    """Rows from a CSV (``.csv``/``.csv.gz``) or NDJSON export"""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", newline="") as f:
+        if path.endswith((".ndjson", ".jsonl", ".ndjson.gz", ".jsonl.gz")):
+            return [json.loads(line) for line in f if line.strip()]
+        return list(csv.DictReader(f))
+
+
+def _flag(value):
+    return str(value).strip().lower() in ("true", "t", "1", "yes")
+
+
+def training_set(screenings, outcomes):
+    """``(columns, labels, patient ids)`` for screenings that have a referral outcome"""
+    confirmed = {str(row["screening_id"]): _flag(row["ckd_confirmed"]) for row in outcomes}
+    rows = [row for row in screenings if str(row.get("id")) in confirmed]
+    columns = {}
+    for name in ("systolic_bp", "diastolic_bp", "blood_glucose", "weight", "height", "bmi", "age"):
+        values = [row.get(name) for row in rows]
+        if all(v not in (None, "") for v in values):
+            columns[name] = np.asarray(values, dtype=float)
+    for name in ("urine_protein",) + YES_NO_FEATURES:
+        columns[name] = np.asarray([row.get(name) or "No" for row in rows], dtype=object)
+    labels = np.asarray([confirmed[str(row["id"])] for row in rows], dtype=float)
+    groups = [row.get("patient_id") or row["id"] for row in rows]
+    return columns, labels, groups
+
+
+def synthetic_set(n, seed=0):
+    from healthbridge import synthetic
+
+    columns = synthetic.screenings(n, seed=seed)
+    outcomes = synthetic.outcomes(columns, seed=seed)
+    followed = np.isin(columns["id"], outcomes["screening_id"])
+    return _take(columns, followed), outcomes["ckd_confirmed"].astype(float), outcomes["patient_id"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name in ("train", "evaluate"):
+        command = commands.add_parser(name)
+        command.add_argument("--screenings", help="screening_data export (CSV or NDJSON)")
+        command.add_argument("--outcomes", help="referral_outcomes export (CSV or NDJSON)")
+        command.add_argument("--synthetic", type=int, help="use this many synthetic screenings instead")
+        command.add_argument("--seed", type=int, default=0)
+    commands.choices["train"].add_argument("--output", default=model_path())
+    commands.choices["train"].add_argument("--l2", type=float, default=L2_PENALTY)
+    commands.choices["evaluate"].add_argument("--model", default=model_path())
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        columns, labels, groups = synthetic_set(args.synthetic, args.seed)
+    elif args.screenings and args.outcomes:
+        columns, labels, groups = training_set(read_rows(args.screenings), read_rows(args.outcomes))
+    else:
+        parser.error("give --screenings and --outcomes, or --synthetic")
+    if not len(labels):
+        parser.error("no screenings have a referral outcome")
+
+    if args.command == "train":
+        model = train(columns, labels, groups, seed=args.seed, l2=args.l2)
+        model.save(args.output)
+        report = {"output": args.output, **model.metadata}
+    else:
+        model = RiskModel.load(args.model)
+        report = {"model": args.model, **evaluate(model, columns, labels)}
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
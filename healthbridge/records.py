@@ -0,0 +1,124 @@
+"""Server-side paging for large record tables
+
+A *view* is a hashable description of what the table shows: sort column,
+direction, filters and date window. Pages are read through a caller-supplied
+``fetch(view, offset, limit)`` that pushes sort and filters down to the
+database, so only the visible rows are ever transferred. ``RecordPages``
+keeps recently viewed pages in a small LRU and prefetches the following
+page on a background thread, so "Next" is usually served from memory.
+``invalidate`` starts a new generation: fetches begun before it still answer
+the caller that asked, but their pages are never cached.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+RECORD_COLUMNS = ("patient_id", "name", "age", "location", "blood_glucose", "risk_level", "timestamp")
+RECORD_FIELDS = ", ".join(RECORD_COLUMNS)
+SORTABLE_COLUMNS = ("timestamp", "name", "age", "location", "blood_glucose", "risk_level")
+PAGE_SIZES = (25, 50, 100)
+PAGE_TTL_SECONDS = 60
+
+
+def make_view(sort="timestamp", descending=True, location=None, risk_level=None, search=None,
+              time_range=None):
+    """Normalised, hashable view key; unknown sort columns fall back to timestamp
+
+    ``time_range`` is an optional ``(start, end)`` pair of ISO bounds.
+    """
+    if sort not in SORTABLE_COLUMNS:
+        sort = "timestamp"
+    search = (search or "").strip() or None
+    time_range = tuple(time_range) if time_range else None
+    return (sort, bool(descending), location or None, risk_level or None, search, time_range)
+
+
+class RecordPages:
+    """LRU of fetched pages with background prefetch of the next page"""
+
+    def __init__(self, fetch, capacity=64, ttl=PAGE_TTL_SECONDS, workers=2):
+        self._fetch = fetch
+        self._capacity = capacity
+        self._ttl = ttl
+        self._pages = OrderedDict()
+        self._pending = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self.hits = 0
+        self.misses = 0
+
+    def _cached(self, key):
+        entry = self._pages.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[0] > self._ttl:
+            del self._pages[key]
+            return None
+        self._pages.move_to_end(key)
+        return entry[1]
+
+    def _store(self, key, page, generation):
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._pages[key] = (time.time(), page)
+            self._pages.move_to_end(key)
+            while len(self._pages) > self._capacity:
+                self._pages.popitem(last=False)
+            self._pending.pop(key, None)
+
+    def _load(self, view, page, page_size, generation):
+        key = (view, page, page_size)
+        try:
+            rows, total = self._fetch(view, page * page_size, page_size)
+        except Exception:
+            with self._lock:
+                if generation == self._generation:
+                    self._pending.pop(key, None)
+            raise
+        result = {"rows": rows, "total": total, "page": page, "page_size": page_size}
+        self._store(key, result, generation)
+        return result
+
+    def page(self, view, page, page_size):
+        """``{"rows", "total", "page", "page_size"}`` for one page of ``view``
+
+        ``total`` is whatever the fetcher reports (possibly an estimate, or
+        None when unknown).
+        """
+        key = (view, page, page_size)
+        with self._lock:
+            cached = self._cached(key)
+            pending = self._pending.get(key) if cached is None else None
+            generation = self._generation
+        if cached is not None:
+            self.hits += 1
+        elif pending is not None:
+            self.hits += 1
+            cached = pending.result()
+        else:
+            self.misses += 1
+            cached = self._load(view, page, page_size, generation)
+        if len(cached["rows"]) == page_size:
+            self.prefetch(view, page + 1, page_size)
+        return cached
+
+    def prefetch(self, view, page, page_size):
+        """Fetch a page in the background unless it is cached or already in flight"""
+        key = (view, page, page_size)
+        with self._lock:
+            if self._cached(key) is not None or key in self._pending:
+                return
+            self._pending[key] = self._pool.submit(self._load, view, page, page_size,
+                                                   self._generation)
+
+    def invalidate(self):
+        """Drop all cached pages and in-flight prefetches (after new records are saved)"""
+        with self._lock:
+            self._generation += 1
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._pages.clear()
@@ -0,0 +1,181 @@
+"""Rule-based kidney risk scoring and referral lookup
+
+``kidney_risk`` scores one screening exactly as the screening page always
+has (KDIGO-informed points for blood pressure, proteinuria, glucose, history,
+BMI and age). ``kidney_risk_batch`` applies the same rules to whole columns
+with NumPy, for imports, backfills and benchmarks; both produce identical
+scores and levels. NumPy is imported by the batch path only, so scoring a
+single screening stays cheap to import.
+"""
+URINE_PROTEIN_SCORES = {'Negative': 0, 'Trace': 1, '1+': 2, '2+': 3, '3+': 4}
+YES_NO_POINTS = (
+    ('known_diabetes', 2, "Known Diabetes"),
+    ('known_hypertension', 1, "Known Hypertension"),
+    ('family_history', 1, "Family History"),
+    ('herbal_use', 1, "Herbal Medicine Use"),
+    ('smoking', 1, "Smoking"),
+)
+# (minimum score, level, recommendation, timeline), highest first
+RISK_BANDS = (
+    (6, " CRITICAL RISK 🔴", "Immediate medical attention required", "Within 48 hours"),
+    (5, " HIGH RISK 🔴", "Urgent referral to specialist required", "Within 1 week"),
+    (3, " MODERATE RISK 🟡", "Refer to healthcare facility for evaluation", "Within 1 month"),
+    (float("-inf"), " LOW RISK 🟢", "Lifestyle advice and annual screening", "Annual checkup"),
+)
+
+FACILITIES = {
+    'Lagos': [
+        {'name': 'Lagos University Teaching Hospital (LUTH)', 'type': 'Tertiary',
+         'specialty': 'Nephrology', 'location': 'Idi-Araba', 'contact': '01-3423456',
+         'latitude': 6.5244, 'longitude': 3.3792},
+        {'name': 'Badagry General Hospital', 'type': 'Secondary',
+         'specialty': 'General Medicine', 'location': 'Badagry', 'contact': '09012345678',
+         'latitude': 6.4167, 'longitude': 2.8833},
+        {'name': 'Amuwo Odofin Maternal & Child Centre', 'type': 'Secondary',
+         'specialty': 'Maternal & Child Health', 'location': 'Festac', 'contact': '01-3425678',
+         'latitude': 6.4667, 'longitude': 3.2833}
+    ],
+    'Kano': [
+        {'name': 'Aminu Kano Teaching Hospital', 'type': 'Tertiary',
+         'specialty': 'Nephrology', 'location': 'Kano', 'contact': '064-981234',
+         'latitude': 11.9964, 'longitude': 8.5167}
+    ]
+}
+
+
+def risk_band(score):
+    """``(level, recommendation, timeline)`` for a score"""
+    for minimum, level, recommendation, timeline in RISK_BANDS:
+        if score >= minimum:
+            return level, recommendation, timeline
+    return RISK_BANDS[-1][1:]
+
+
+def kidney_risk(data):
+    """Calculate kidney disease risk based on KDIGO guidelines
+
+    Adds ``bmi`` to ``data`` when weight and height are present.
+    """
+    score = 0
+    risk_factors = []
+
+    # Blood Pressure
+    if data['systolic_bp'] >= 160 or data['diastolic_bp'] >= 100:
+        score += 3
+        risk_factors.append("Severe Hypertension")
+    elif data['systolic_bp'] >= 140 or data['diastolic_bp'] >= 90:
+        score += 2
+        risk_factors.append("Hypertension")
+
+    # Urine Protein
+    urine_score = URINE_PROTEIN_SCORES.get(data['urine_protein'], 0)
+    if urine_score >= 3:
+        score += 3
+        risk_factors.append("Significant Proteinuria")
+    elif urine_score >= 1:
+        score += 1
+        risk_factors.append("Proteinuria")
+
+    # Blood Glucose in mg/dL; a missing reading adds nothing to the score
+    blood_glucose = data.get('blood_glucose')
+    if blood_glucose is None:
+        risk_factors.append("Glucose not measured")
+    elif blood_glucose >= 200:
+        score += 2
+        risk_factors.append(f"Diabetes Risk (Glucose: {blood_glucose} mg/dL)")
+    elif blood_glucose >= 140:
+        score += 1
+        risk_factors.append(f"Pre-diabetes (Glucose: {blood_glucose} mg/dL)")
+    elif blood_glucose >= 70:
+        risk_factors.append(f"Normal Glucose ({blood_glucose} mg/dL)")
+    else:
+        risk_factors.append(f"Low Glucose ({blood_glucose} mg/dL)")
+
+    # Additional Risk Factors
+    for field, points, label in YES_NO_POINTS:
+        if data.get(field) == 'Yes':
+            score += points
+            risk_factors.append(label)
+
+    # BMI Calculation
+    if 'weight' in data and 'height' in data:
+        height_m = data['height'] / 100
+        bmi = data['weight'] / (height_m ** 2)
+        data['bmi'] = round(bmi, 1)
+        if bmi >= 30:
+            score += 1
+            risk_factors.append("Obesity")
+        elif bmi >= 25:
+            score += 0.5
+            risk_factors.append("Overweight")
+
+    # Age Risk
+    if data.get('age', 0) > 60:
+        score += 1
+        risk_factors.append("Age > 60")
+
+    risk_level, recommendation, timeline = risk_band(score)
+    return {
+        'risk_level': risk_level,
+        'score': round(score, 1),
+        'risk_factors': risk_factors,
+        'recommendation': recommendation,
+        'timeline': timeline,
+        'bmi': data.get('bmi', None)
+    }
+
+
+def _column(columns, name, n, default):
+    import numpy as np
+
+    value = columns.get(name)
+    if value is None:
+        return np.full(n, default)
+    return np.asarray(value)
+
+
+def kidney_risk_batch(columns):
+    """Vectorised ``kidney_risk`` over column arrays
+
+    ``columns`` maps field names to equal-length sequences. Returns
+    ``(scores, levels)`` arrays matching ``kidney_risk`` row by row.
+    """
+    import numpy as np
+
+    systolic = np.asarray(columns['systolic_bp'], dtype=float)
+    n = len(systolic)
+    diastolic = np.asarray(columns['diastolic_bp'], dtype=float)
+    score = np.zeros(n)
+
+    severe = (systolic >= 160) | (diastolic >= 100)
+    score += np.where(severe, 3, np.where((systolic >= 140) | (diastolic >= 90), 2, 0))
+
+    urine = np.asarray(columns['urine_protein'], dtype=object)
+    urine_score = np.zeros(n)
+    for label, value in URINE_PROTEIN_SCORES.items():
+        urine_score[urine == label] = value
+    score += np.where(urine_score >= 3, 3, np.where(urine_score >= 1, 1, 0))
+
+    glucose = _column(columns, 'blood_glucose', n, 0).astype(float)
+    score += np.where(glucose >= 200, 2, np.where(glucose >= 140, 1, 0))
+
+    for field, points, _ in YES_NO_POINTS:
+        score += np.where(_column(columns, field, n, 'No') == 'Yes', points, 0)
+
+    if 'weight' in columns and 'height' in columns:
+        height_m = np.asarray(columns['height'], dtype=float) / 100
+        bmi = np.asarray(columns['weight'], dtype=float) / (height_m ** 2)
+        score += np.where(bmi >= 30, 1, np.where(bmi >= 25, 0.5, 0))
+
+    score += np.where(_column(columns, 'age', n, 0).astype(float) > 60, 1, 0)
+
+    levels = np.full(n, RISK_BANDS[-1][1], dtype=object)
+    for minimum, level, _, _ in reversed(RISK_BANDS[:-1]):
+        levels[score >= minimum] = level
+    return np.round(score, 1), levels
+
+
+def referral_facilities(location, risk_level, facilities=FACILITIES):
+    """Facilities in ``location`` of the type the risk level calls for"""
+    facility_type = "Tertiary" if "HIGH RISK" in risk_level or "CRITICAL" in risk_level else "Secondary"
+    return [f for f in facilities.get(location, ()) if f['type'] == facility_type]
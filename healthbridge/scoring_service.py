@@ -0,0 +1,297 @@
+"""Kidney risk scoring and referral lookup as a standalone ASGI service
+
+Lets partner clinics score their own screenings with the same rules as the
+screening page (``healthbridge.risk``) without going through Streamlit::
+
+    python -m healthbridge.scoring_service --port 8600 --workers 4
+
+Endpoints:
+
+* ``POST /score`` - one screening as a JSON object; responds with the
+  ``kidney_risk`` result plus ``referrals`` for its ``location``
+* ``POST /score/batch`` - ``{"records": [...]}`` or a bare JSON array;
+  responds with ``{"results": [...]}`` in input order
+* ``POST /score/stream`` - NDJSON in, NDJSON out: one result line per input
+  line, written while the request body is still arriving, so a client can
+  stream any number of records in bounded memory
+* ``GET /health`` and ``GET /metrics`` (Prometheus, from ``healthbridge.tracing``)
+
+Within a batch or stream a bad record yields ``{"index": i, "error": ...}``
+in its place rather than failing the request. An ``id`` field on a record
+is echoed back. ``?referrals=0`` leaves out facility lookups.
+
+If a fitted model artifact is present (``healthbridge.model``), results
+carry its risk band and probability, with the rule result as baseline;
+batches and streams run the model over each batch or received chunk as one
+NumPy product. ``?method=rule`` returns the rule score only.
+
+``app`` is a plain ASGI 3 callable with no framework; any ASGI server will
+run it. ``main`` uses uvicorn, with one process per ``--workers``. orjson
+is used for JSON when installed, the standard library otherwise.
+"""
+import argparse
+import json
+import math
+from urllib.parse import parse_qs
+
+from healthbridge.model import load_model
+from healthbridge.risk import URINE_PROTEIN_SCORES, kidney_risk, referral_facilities
+from healthbridge.tracing import tracer
+
+REQUIRED_FIELDS = ("systolic_bp", "diastolic_bp", "urine_protein")
+NUMERIC_FIELDS = ("systolic_bp", "diastolic_bp", "blood_glucose", "weight", "height", "age")
+MIN_HEIGHT_CM = 30
+MAX_BODY_BYTES = 16 * 1024 * 1024
+MAX_BATCH = 10000
+STREAM_FLUSH_LINES = 500
+JSON_TYPE = (b"content-type", b"application/json")
+NDJSON_TYPE = (b"content-type", b"application/x-ndjson")
+
+try:
+    import orjson
+
+    loads = orjson.loads
+    dumps = orjson.dumps
+except ImportError:
+    loads = json.loads
+
+    def dumps(value):
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class RequestError(Exception):
+    """Rejects a whole request with an HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def check_record(record):
+    """Raises ValueError if ``record`` cannot be scored"""
+    if not isinstance(record, dict):
+        raise ValueError("record must be a JSON object")
+    missing = [field for field in REQUIRED_FIELDS if field not in record]
+    if missing:
+        raise ValueError(f"missing field(s): {', '.join(missing)}")
+    for field in NUMERIC_FIELDS:
+        value = record.get(field)
+        # Optional readings may be omitted or sent as null
+        if field not in record or (value is None and field not in REQUIRED_FIELDS):
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{field} must be a number")
+        if not math.isfinite(value):
+            raise ValueError(f"{field} must be a finite number")
+    if record.get("height") is not None and record["height"] < MIN_HEIGHT_CM:
+        raise ValueError(f"height must be at least {MIN_HEIGHT_CM} cm")
+    if not isinstance(record["urine_protein"], str) or record["urine_protein"] not in URINE_PROTEIN_SCORES:
+        raise ValueError(f"urine_protein must be one of {', '.join(URINE_PROTEIN_SCORES)}")
+    if record.get("location") is not None and not isinstance(record["location"], str):
+        raise ValueError("location must be a string")
+
+
+def _rule_score(record):
+    """``kidney_risk`` of a checked record, with any failure raised as ValueError"""
+    data = {k: v for k, v in record.items() if v is not None or k not in NUMERIC_FIELDS}
+    try:
+        result = kidney_risk(data)
+    except (TypeError, KeyError, ArithmeticError) as e:
+        raise ValueError(f"record cannot be scored: {e}") from None
+    if result["bmi"] is not None and not math.isfinite(result["bmi"]):
+        raise ValueError("weight and height do not give a finite BMI")
+    return result
+
+
+def _finish(record, result, referrals):
+    if referrals and record.get("location"):
+        result["referrals"] = referral_facilities(record["location"], result["risk_level"])
+    if "id" in record:
+        result["id"] = record["id"]
+    return result
+
+
+def score_record(record, referrals=True, model=None):
+    """Risk result for one submitted record; raises ValueError if it cannot be scored"""
+    check_record(record)
+    result = _rule_score(record)
+    if model is not None:
+        result = model.assess_many([record], [result])[0]
+    return _finish(record, result, referrals)
+
+
+def score_many(records, referrals=True, model=None, start=0):
+    """Results in input order, with ``{"index", "error"}`` for records that cannot be scored"""
+    results, valid = [], []
+    for index, record in enumerate(records):
+        try:
+            check_record(record)
+            results.append(_rule_score(record))
+        except ValueError as e:
+            results.append({"index": start + index, "error": str(e)})
+            continue
+        valid.append(index)
+    if model is not None and valid:
+        rebanded = model.assess_many([records[i] for i in valid], [results[i] for i in valid])
+        for i, result in zip(valid, rebanded):
+            results[i] = result
+    for i in valid:
+        _finish(records[i], results[i], referrals)
+    return results
+
+
+async def _read_body(receive, limit=MAX_BODY_BYTES):
+    chunks, size = [], 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise RequestError(400, "client disconnected")
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > limit:
+            raise RequestError(413, f"request body over {limit} bytes")
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+def _parse(body):
+    try:
+        return loads(body)
+    except ValueError:
+        raise RequestError(400, "request body is not valid JSON") from None
+
+
+async def _respond(send, status, payload, content_type=JSON_TYPE):
+    body = dumps(payload)
+    await send({"type": "http.response.start", "status": status,
+                "headers": [content_type, (b"content-length", str(len(body)).encode())]})
+    await send({"type": "http.response.body", "body": body})
+
+
+class ScoringService:
+    """ASGI application serving ``score_record`` over HTTP"""
+
+    def __init__(self, model=None, max_batch=MAX_BATCH, flush_lines=STREAM_FLUSH_LINES):
+        self.model = model
+        self.max_batch = max_batch
+        self.flush_lines = flush_lines
+        self.routes = {
+            ("POST", "/score"): self.score,
+            ("POST", "/score/batch"): self.batch,
+            ("POST", "/score/stream"): self.stream,
+            ("GET", "/health"): self.health,
+            ("GET", "/metrics"): self.metrics,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+        handler = self.routes.get((scope["method"], scope["path"].rstrip("/") or "/"))
+        if handler is None:
+            known = any(path == scope["path"].rstrip("/") for _, path in self.routes)
+            await _respond(send, 405 if known else 404, {"error": "method not allowed" if known else "not found"})
+            return
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        referrals = query.get("referrals", ["1"])[-1] not in ("0", "false", "no")
+        model = None if query.get("method", ["model"])[-1] == "rule" else self.model
+        try:
+            await handler(receive, send, referrals, model)
+        except RequestError as e:
+            await _respond(send, e.status, {"error": str(e)})
+
+    async def score(self, receive, send, referrals, model):
+        record = _parse(await _read_body(receive))
+        with tracer.span("service.score", rows=1):
+            try:
+                result = score_record(record, referrals, model)
+            except ValueError as e:
+                raise RequestError(422, str(e)) from None
+        await _respond(send, 200, result)
+
+    async def batch(self, receive, send, referrals, model):
+        payload = _parse(await _read_body(receive))
+        records = payload.get("records") if isinstance(payload, dict) else payload
+        if not isinstance(records, list):
+            raise RequestError(400, 'expected {"records": [...]} or a JSON array')
+        if len(records) > self.max_batch:
+            raise RequestError(413, f"at most {self.max_batch} records per batch; use /score/stream")
+        with tracer.span("service.score_batch", rows=len(records)):
+            results = score_many(records, referrals, model)
+        await _respond(send, 200, {"results": results})
+
+    async def stream(self, receive, send, referrals, model):
+        await send({"type": "http.response.start", "status": 200, "headers": [NDJSON_TYPE]})
+        pending, out, index = b"", [], 0
+        more = True
+        with tracer.span("service.score_stream") as span:
+            while more:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                more = message.get("more_body", False)
+                pending += message.get("body", b"")
+                lines = pending.split(b"\n")
+                pending = b"" if not more else lines.pop()
+                # Everything received so far is scored as one batch
+                records, errors = [], {}
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(loads(line))
+                    except ValueError as e:
+                        errors[len(records)] = str(e)
+                        records.append(None)
+                results = score_many(records, referrals, model, start=index)
+                for position, message in errors.items():
+                    results[position] = {"index": index + position, "error": message}
+                index += len(records)
+                out.extend(dumps(result) for result in results)
+                if len(out) >= self.flush_lines:
+                    await send({"type": "http.response.body", "body": b"\n".join(out) + b"\n",
+                                "more_body": True})
+                    out = []
+                if len(pending) > MAX_BODY_BYTES:
+                    out.append(dumps({"index": index, "error": "line too long"}))
+                    break
+            span["rows"] = index
+        await send({"type": "http.response.body", "body": b"\n".join(out) + b"\n" if out else b""})
+
+    async def health(self, receive, send, referrals, model):
+        await _respond(send, 200, {"status": "ok",
+                                   "model": self.model.metadata.get("trained_at") if self.model else None})
+
+    async def metrics(self, receive, send, referrals, model):
+        body = tracer.prometheus().encode("utf-8")
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"text/plain; version=0.0.4; charset=utf-8")]})
+        await send({"type": "http.response.body", "body": body})
+
+
+app = ScoringService(model=load_model())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (one core each)")
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    uvicorn.run("healthbridge.scoring_service:app", host=args.host, port=args.port,
+                workers=args.workers, access_log=False, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""People search: prefix, trigram and fuzzy matching over volunteers and patients"""
+import bisect
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+
+# ==================== NORMALISATION ====================
+_NON_WORD = re.compile(r"[^a-z0-9@.\s]")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_text(value):
+    """Lowercase, strip accents and punctuation, collapse whitespace"""
+    if not value:
+        return ""
+    text = str(value)
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(c for c in text if not unicodedata.combining(c))
+    text = text.lower()
+    text = _NON_WORD.sub(" ", text)
+    return _SPACES.sub(" ", text).strip()
+
+
+def normalize_phone(value):
+    """Reduce a Nigerian phone number to its 11-digit national form (0XXXXXXXXXX)"""
+    digits = re.sub(r"\D", "", str(value or ""))
+    if digits.startswith("234") and len(digits) == 13:
+        digits = "0" + digits[3:]
+    elif len(digits) == 10 and not digits.startswith("0"):
+        digits = "0" + digits
+    return digits
+
+
+def trigrams(text):
+    """Trigrams of each word, padded the same way as Postgres pg_trgm"""
+    return {padded[i:i + 3]
+            for padded in (f"  {word} " for word in text.split())
+            for i in range(len(padded) - 2)}
+
+
+# ==================== SEARCH INDEX ====================
+class SearchIndex:
+    """In-memory people index kept in sync incrementally
+
+    Documents are keyed by ``(kind, id)`` where kind is ``"patient"`` or
+    ``"volunteer"``. Each document contributes searchable keys (name words,
+    full name, phone digits, email) to a sorted prefix list and to trigram
+    posting sets, so a type-ahead query only touches matching postings.
+
+    Building the index over a large table takes seconds, so
+    ``load_in_background`` builds it on a worker thread; until ``loaded`` is
+    set callers use their own fallback (PostgREST ``ilike``).
+    """
+
+    SIMILARITY_THRESHOLD = 0.3
+    CANDIDATE_BUDGET = 20000
+    VERIFY_LIMIT = 5000
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._docs = {}
+        self._doc_keys = {}
+        self._doc_grams = {}
+        self._postings = defaultdict(set)
+        self._prefix = []
+        self._loader = None
+        self._pending = None
+        self.loaded = False
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._docs
+
+    # ---------- maintenance ----------
+    def add(self, kind, doc_id, name, phone=None, email=None, payload=None):
+        """Insert or replace a single document"""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(("add", (kind, doc_id, name, phone, email, payload)))
+            key = (kind, doc_id)
+            if key in self._docs:
+                self._remove_locked(key)
+            keys, grams = self._index_fields(name, phone, email)
+            self._store(key, keys, grams, payload, name)
+            for k in keys:
+                bisect.insort(self._prefix, (k, key))
+
+    def add_many(self, documents):
+        """Bulk insert ``(kind, id, name, phone, email, payload)`` tuples, sorting once"""
+        latest = {}
+        for document in documents:
+            latest[(document[0], document[1])] = document
+        with self._lock:
+            entries = []
+            for kind, doc_id, name, phone, email, payload in latest.values():
+                key = (kind, doc_id)
+                if key in self._docs:
+                    self._remove_locked(key)
+                keys, grams = self._index_fields(name, phone, email)
+                self._store(key, keys, grams, payload, name)
+                entries.extend((k, key) for k in keys)
+            self._prefix.extend(entries)
+            self._prefix.sort()
+
+    def load(self, documents):
+        """Bulk load the initial snapshot once; later changes arrive via add()"""
+        with self._lock:
+            if not self.loaded:
+                self.add_many(documents)
+                self.loaded = True
+
+    def load_in_background(self, documents):
+        """Build the initial snapshot on a daemon thread unless loaded or already building
+
+        ``documents`` is called on that thread and returns the document
+        tuples. Changes made with add()/remove() while it runs are replayed
+        onto the snapshot before it replaces the index. If the build fails
+        the index stays unloaded and the next call starts it again.
+        """
+        with self._lock:
+            if self.loaded or self._loader is not None:
+                return
+            self._pending = []
+            self._loader = threading.Thread(target=self._build, args=(documents,),
+                                            name="search-index-load", daemon=True)
+            self._loader.start()
+
+    def _build(self, documents):
+        staging = SearchIndex()
+        try:
+            staging.add_many(documents())
+        except Exception:
+            with self._lock:
+                if self._loader is threading.current_thread():
+                    self._loader = self._pending = None
+            return
+        with self._lock:
+            if self._loader is not threading.current_thread():
+                return
+            for method, args in self._pending:
+                getattr(staging, method)(*args)
+            self._docs, self._doc_keys = staging._docs, staging._doc_keys
+            self._doc_grams, self._postings = staging._doc_grams, staging._postings
+            self._prefix = staging._prefix
+            self._loader = self._pending = None
+            self.loaded = True
+
+    def remove(self, kind, doc_id):
+        """Drop a document from the index if present"""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(("remove", (kind, doc_id)))
+            key = (kind, doc_id)
+            if key in self._docs:
+                self._remove_locked(key)
+
+    def clear(self):
+        """Empty the index"""
+        with self._lock:
+            self._docs.clear()
+            self._doc_keys.clear()
+            self._doc_grams.clear()
+            self._postings.clear()
+            self._prefix = []
+            self._loader = self._pending = None
+            self.loaded = False
+
+    def _index_fields(self, name, phone, email):
+        keys = []
+        full_name = normalize_text(name)
+        if full_name:
+            keys.append(full_name)
+            keys.extend(w for w in full_name.split()[1:] if w)
+        phone_digits = normalize_phone(phone)
+        if phone_digits:
+            keys.append(phone_digits)
+        email_text = normalize_text(email)
+        if email_text:
+            keys.append(email_text)
+        grams = trigrams(full_name) | trigrams(phone_digits) | trigrams(email_text)
+        return sorted(set(keys)), grams
+
+    def _store(self, key, keys, grams, payload, name):
+        self._docs[key] = document_payload(key[0], key[1], name, payload)
+        self._doc_keys[key] = keys
+        self._doc_grams[key] = len(grams)
+        for gram in grams:
+            self._postings[gram].add(key)
+
+    def _remove_locked(self, key):
+        for k in self._doc_keys.pop(key, []):
+            i = bisect.bisect_left(self._prefix, (k, key))
+            if i < len(self._prefix) and self._prefix[i] == (k, key):
+                del self._prefix[i]
+            for gram in trigrams(k):
+                posting = self._postings.get(gram)
+                if posting is not None:
+                    posting.discard(key)
+                    if not posting:
+                        del self._postings[gram]
+        self._doc_grams.pop(key, None)
+        self._docs.pop(key, None)
+
+    # ---------- queries ----------
+    def search(self, query, kind=None, limit=10, offset=0, fuzzy=True):
+        """Return ranked matches for a type-ahead query
+
+        Prefix hits rank first, followed by trigram matches ordered by
+        pg_trgm-style similarity. Results are the stored payload dicts with
+        an added ``score`` field.
+        """
+        text = normalize_text(query)
+        phone = normalize_phone(query)
+        if not text and not phone:
+            return []
+        wanted = offset + limit
+        with self._lock:
+            scores = {}
+            for needle in {text, phone} - {""}:
+                for key in self._prefix_matches(needle, kind, wanted):
+                    scores[key] = max(scores.get(key, 0), 1.0)
+            if fuzzy and len(scores) < wanted and len(text) >= 3:
+                for key, sim in self._trigram_matches(text, kind):
+                    if sim > scores.get(key, 0):
+                        scores[key] = sim
+            ranked = sorted(scores.items(), key=lambda kv: (-kv[1], self._docs[kv[0]]["name"] or ""))
+            return [dict(self._docs[key], score=round(score, 3))
+                    for key, score in ranked[offset:wanted]]
+
+    def _prefix_matches(self, needle, kind, wanted):
+        found = []
+        seen = set()
+        i = bisect.bisect_left(self._prefix, (needle,))
+        while i < len(self._prefix) and len(found) < wanted:
+            k, key = self._prefix[i]
+            if not k.startswith(needle):
+                break
+            if key not in seen and (kind is None or key[0] == kind):
+                seen.add(key)
+                found.append(key)
+            i += 1
+        return found
+
+    def _trigram_matches(self, text, kind):
+        grams = trigrams(text)
+        postings = sorted((self._postings[g] for g in grams if g in self._postings), key=len)
+        if not postings:
+            return []
+        n = len(grams)
+        min_shared = max(1, math.ceil(self.SIMILARITY_THRESHOLD * n))
+        # Any document reaching the threshold appears in one of the
+        # (n - min_shared + 1) rarest postings. Candidates are drawn from those,
+        # rarest first, until CANDIDATE_BUDGET entries have been scanned, which
+        # keeps very common grams ("  a", "ade") from dominating latency.
+        counts = Counter()
+        scanned = 0
+        used = 0
+        for posting in postings[:n - min_shared + 1]:
+            if used and scanned + len(posting) > self.CANDIDATE_BUDGET:
+                break
+            counts.update(posting)
+            scanned += len(posting)
+            used += 1
+        rest = postings[used:]
+        # Only the candidates sharing the most rare grams are checked against
+        # the common postings; one that cannot reach min_shared even with every
+        # remaining gram is never looked at.
+        needed = min_shared - len(rest)
+        results = []
+        for key, shared in counts.most_common(self.VERIFY_LIMIT):
+            if shared < needed:
+                break
+            if kind is not None and key[0] != kind:
+                continue
+            if rest:
+                shared += sum(1 for posting in rest if key in posting)
+            if shared < min_shared:
+                continue
+            similarity = shared / (n + self._doc_grams[key] - shared)
+            if similarity >= self.SIMILARITY_THRESHOLD:
+                results.append((key, similarity))
+        return results
+
+
+# ==================== RECORD ADAPTERS ====================
+PATIENT_FIELDS = "patient_id, name, phone, location, last_seen"
+PICKER_FIELDS = "patient_id, name, location"
+VOLUNTEER_FIELDS = "id, full_name, email, phone, location, status"
+
+
+def patient_document(record):
+    """Map a patient_identities or screening_data row to an index document tuple"""
+    payload = {
+        "patient_id": record.get("patient_id"),
+        "location": record.get("location"),
+        "last_seen": record.get("last_seen") or record.get("timestamp"),
+    }
+    return ("patient", record.get("patient_id"), record.get("name"),
+            record.get("phone"), None, payload)
+
+
+def volunteer_document(record):
+    """Map a volunteers row to an index document tuple"""
+    payload = {
+        "email": record.get("email"),
+        "location": record.get("location"),
+        "status": record.get("status"),
+    }
+    return ("volunteer", record.get("id") or record.get("email"), record.get("full_name"),
+            record.get("phone"), record.get("email"), payload)
+
+
+def document_payload(kind, doc_id, name, payload):
+    """The dict a search returns for one document (before its ``score``)"""
+    return dict(payload or {}, kind=kind, id=doc_id, name=name)
+
+
+def postgrest_term(query):
+    """Strip characters that would break a PostgREST ``or=(...)`` filter value"""
+    return re.sub(r"[,()*%\\:\"']", " ", str(query or "")).strip()
+
+
+def index_record(index, table, record):
+    """Apply a freshly saved row to the index (called after cloud inserts/updates)"""
+    if table == "screening_data" and record.get("patient_id"):
+        index.add(*patient_document(record))
+    elif table == "volunteers" and (record.get("id") or record.get("email")):
+        index.add(*volunteer_document(record))
@@ -0,0 +1,173 @@
+"""Bounded per-session app state with idle eviction and memory accounting
+
+``st.session_state`` keeps whatever a page puts in it for as long as the
+browser tab stays open, so every open tab holds its own copy of the last
+screening, funding request and so on. ``SessionStore`` keeps that state in
+one ``SessionState`` record per session instead: records use ``__slots__``,
+hold only the fields the pages read back, cap text and list lengths, and
+are dropped after ``idle_seconds`` without a rerun or when more than
+``max_sessions`` are open (least recently seen first).
+
+``stats()`` reports the live sessions, their approximate memory and how
+many were evicted, for the admin panel.
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+MAX_SESSIONS = 2000
+IDLE_SECONDS = 30 * 60
+MAX_TEXT = 200
+MAX_ITEMS = 20
+
+SCREENING_FIELDS = ("name", "location", "language", "timestamp", "systolic_bp", "diastolic_bp",
+                    "blood_glucose", "urine_protein")
+RISK_FIELDS = ("risk_level", "score", "risk_factors", "recommendation", "timeline", "bmi",
+               "probability", "model_risk_level", "rule_risk_level", "method")
+MODEL_ONLY_FIELDS = ("probability", "model_risk_level", "rule_risk_level", "method")
+
+
+def _compact(value):
+    """Caps strings at ``MAX_TEXT`` characters and lists at ``MAX_ITEMS`` entries (as tuples)"""
+    if isinstance(value, str):
+        return value[:MAX_TEXT]
+    if isinstance(value, (list, tuple)):
+        return tuple(_compact(v) for v in value[:MAX_ITEMS])
+    return value
+
+
+def _size(value):
+    """Approximate bytes held by ``value``; tuples and dicts are followed one level per item"""
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(_size(v) for v in value)
+    elif isinstance(value, dict):
+        size += sum(_size(k) + _size(v) for k, v in value.items())
+    elif hasattr(value, "__slots__"):
+        size += sum(_size(getattr(value, name, None)) for name in value.__slots__)
+    return size
+
+
+class ScreeningResult:
+    """The last screening of a session, as the result tabs display it"""
+
+    __slots__ = ("patient_id",) + SCREENING_FIELDS + tuple(f"risk_{name}" for name in RISK_FIELDS)
+
+    def __init__(self, data, risk, patient_id):
+        self.patient_id = _compact(patient_id)
+        for name in SCREENING_FIELDS:
+            setattr(self, name, _compact(data.get(name)))
+        for name in RISK_FIELDS:
+            setattr(self, f"risk_{name}", _compact(risk.get(name)))
+
+    def data(self):
+        """Screening fields as a dict"""
+        return {name: getattr(self, name) for name in SCREENING_FIELDS}
+
+    def risk(self):
+        """Risk assessment as a dict; model-only keys are left out for rule scores"""
+        risk = {name: getattr(self, f"risk_{name}") for name in RISK_FIELDS}
+        risk["risk_factors"] = list(risk["risk_factors"] or ())
+        return {k: v for k, v in risk.items() if v is not None or k not in MODEL_ONLY_FIELDS}
+
+
+class FundingSelection:
+    """The funding request a donor chose to support"""
+
+    __slots__ = ("id", "patient_name")
+
+    def __init__(self, request):
+        self.id = request["id"]
+        self.patient_name = _compact(request.get("patient_name") or "")
+
+
+class SessionState:
+    """App state of one browser session"""
+
+    __slots__ = ("session_id", "created", "last_seen", "screening", "selected_request",
+                 "selected_opportunity", "current_user")
+
+    def __init__(self, session_id, now=None):
+        self.session_id = session_id
+        self.created = self.last_seen = now or time.time()
+        self.screening = None
+        self.selected_request = None
+        self.selected_opportunity = None
+        self.current_user = None
+
+    def set_screening(self, data, risk, patient_id):
+        self.screening = ScreeningResult(data, risk, patient_id)
+
+    def select_request(self, request):
+        self.selected_request = FundingSelection(request) if request else None
+
+    def select_opportunity(self, title):
+        self.selected_opportunity = _compact(title)
+
+    def size(self):
+        return _size(self)
+
+
+class SessionStore:
+    """``SessionState`` per session id, bounded in count and idle time"""
+
+    def __init__(self, max_sessions=MAX_SESSIONS, idle_seconds=IDLE_SECONDS):
+        self.max_sessions = max_sessions
+        self.idle_seconds = idle_seconds
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted_idle = 0
+        self.evicted_capacity = 0
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def _evict(self, now):
+        # Oldest-seen sessions are at the front
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_seen <= self.idle_seconds:
+                break
+            self._sessions.popitem(last=False)
+            self.evicted_idle += 1
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+            self.evicted_capacity += 1
+
+    def session(self, session_id):
+        """The session's state, created on first use; marks it as seen now"""
+        now = time.time()
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self._sessions[session_id] = SessionState(session_id, now)
+            else:
+                session.last_seen = now
+                self._sessions.move_to_end(session_id)
+            self._evict(now)
+            return session
+
+    def end(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def stats(self):
+        """Live sessions, approximate bytes held and eviction counts"""
+        now = time.time()
+        with self._lock:
+            self._evict(now)
+            sessions = list(self._sessions.values())
+            evicted_idle, evicted_capacity = self.evicted_idle, self.evicted_capacity
+        sizes = [s.size() for s in sessions]
+        return {
+            "sessions": len(sessions),
+            "with_screening": sum(s.screening is not None for s in sessions),
+            "bytes": sum(sizes),
+            "largest_bytes": max(sizes, default=0),
+            "oldest_idle_s": max((now - s.last_seen for s in sessions), default=0.0),
+            "evicted_idle": evicted_idle,
+            "evicted_capacity": evicted_capacity,
+            "max_sessions": self.max_sessions,
+            "idle_seconds": self.idle_seconds,
+        }
@@ -0,0 +1,526 @@
+"""Cache shared by every app worker, for query results and aggregates
+
+``st.cache_data`` and ``st.cache_resource`` are per process, so behind a
+load balancer each Streamlit worker warms its own copy and reads Supabase
+on its own. ``SharedCache`` puts the expensive results in one store that
+all workers read, chosen by ``HEALTHBRIDGE_CACHE_URL``:
+
+* ``memory://`` (default) - this process only, the old behaviour
+* ``sqlite:///path/to/cache.db`` - workers on one host; put the file on
+  ``/dev/shm`` to keep it in shared memory
+* ``redis://[:password@]host:port/db`` - workers on any host, through Redis
+  or the stand-in ``python -m healthbridge.shared_cache serve --port 6380``
+
+Keys live in namespaces. ``invalidate(namespace)`` bumps the namespace's
+generation counter in the store; keys are stored under the generation, so
+every worker stops reading the old entries at once and they expire by TTL.
+``watch`` lets a worker drop in-process state when another worker
+invalidates a namespace.
+
+``get_or_compute`` takes a short lock in the store while computing, so a
+cold key is computed by one worker while the others wait for its result.
+Values are pickled, as ``st.cache_data`` does, so the store must only be
+reachable by the app. A store that stops answering is treated as a miss.
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+from urllib.parse import unquote, urlparse
+
+from healthbridge.tracing import tracer
+
+DEFAULT_CACHE_URL = "memory://"
+KEY_PREFIX = "hb"
+DEFAULT_TTL = 300
+LOCK_TTL = 30
+LOCK_POLL_SECONDS = 0.05
+GENERATION_TTL = 1.0
+SOCKET_TIMEOUT = 2.0
+PURGE_EVERY = 500
+
+
+def cache_url():
+    return os.getenv("HEALTHBRIDGE_CACHE_URL", DEFAULT_CACHE_URL)
+
+
+# ==================== BACKENDS ====================
+class MemoryBackend:
+    """Byte store for one process; also the stand-in server's store"""
+
+    shared = False
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _live(self, key, now):
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= now:
+            del self._entries[key]
+            return None
+        return entry
+
+    def _purge(self, now):
+        self._writes += 1
+        if self._writes % PURGE_EVERY == 0:
+            for key in [k for k, (_, expires) in self._entries.items() if expires is not None and expires <= now]:
+                del self._entries[key]
+
+    def get(self, key):
+        with self._lock:
+            entry = self._live(key, time.time())
+            return entry[0] if entry else None
+
+    def set(self, key, value, ttl=None, only_new=False):
+        """Store ``value``; with ``only_new`` only if the key is absent. True if stored"""
+        now = time.time()
+        with self._lock:
+            if only_new and self._live(key, now) is not None:
+                return False
+            self._entries[key] = (value, now + ttl if ttl else None)
+            self._purge(now)
+            return True
+
+    def incr(self, key):
+        with self._lock:
+            entry = self._live(key, time.time())
+            value = int(entry[0]) + 1 if entry else 1
+            self._entries[key] = (str(value).encode(), None)
+            return value
+
+    def delete(self, key):
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteBackend:
+    """Byte store in a WAL-mode SQLite file shared by the processes on one host"""
+
+    shared = True
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        with self._connection() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS cache_entries "
+                       "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)")
+
+    def _connection(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=SOCKET_TIMEOUT, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def _purge(self, db, now):
+        self._writes += 1
+        if self._writes % PURGE_EVERY == 0:
+            db.execute("DELETE FROM cache_entries WHERE expires <= ?", (now,))
+
+    def get(self, key):
+        row = self._connection().execute(
+            "SELECT value FROM cache_entries WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (key, time.time())).fetchone()
+        if row is None:
+            return None
+        # Generation counters come back as text
+        return row[0].encode() if isinstance(row[0], str) else bytes(row[0])
+
+    def set(self, key, value, ttl=None, only_new=False):
+        """Store ``value``; with ``only_new`` only if the key is absent. True if stored"""
+        now = time.time()
+        expires = now + ttl if ttl else None
+        db = self._connection()
+        if only_new:
+            cursor = db.execute(
+                "INSERT INTO cache_entries VALUES (?, ?, ?) ON CONFLICT(key) DO UPDATE "
+                "SET value = excluded.value, expires = excluded.expires "
+                "WHERE cache_entries.expires IS NOT NULL AND cache_entries.expires <= ?",
+                (key, value, expires, now))
+        else:
+            cursor = db.execute("INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?)", (key, value, expires))
+        self._purge(db, now)
+        return cursor.rowcount == 1
+
+    def incr(self, key):
+        row = self._connection().execute(
+            "INSERT INTO cache_entries VALUES (?, '1', NULL) ON CONFLICT(key) DO UPDATE "
+            "SET value = CAST(CAST(value AS TEXT) AS INTEGER) + 1, expires = NULL RETURNING value",
+            (key,)).fetchone()
+        return int(row[0])
+
+    def delete(self, key):
+        return self._connection().execute("DELETE FROM cache_entries WHERE key = ?", (key,)).rowcount == 1
+
+    def clear(self):
+        self._connection().execute("DELETE FROM cache_entries")
+
+
+class RedisError(Exception):
+    """Error reply from a Redis-protocol server"""
+
+
+STORE_ERRORS = (OSError, ConnectionError, RedisError, sqlite3.Error)
+
+
+def _command(*parts):
+    out = [b"*%d\r\n" % len(parts)]
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = str(part).encode()
+        out.append(b"$%d\r\n%s\r\n" % (len(part), part))
+    return b"".join(out)
+
+
+class RedisBackend:
+    """Byte store on a Redis-protocol (RESP2) server, one connection per thread"""
+
+    shared = True
+
+    def __init__(self, host="localhost", port=6379, db=0, password=None, timeout=SOCKET_TIMEOUT):
+        self.address = (host, port)
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self):
+        sock = socket.create_connection(self.address, timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._local.sock, self._local.reader = sock, sock.makefile("rb")
+        if self.password:
+            self._roundtrip("AUTH", self.password)
+        if self.db:
+            self._roundtrip("SELECT", self.db)
+
+    def _reply(self):
+        line = self._local.reader.readline()
+        if not line:
+            raise ConnectionError("connection closed by server")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest
+        if kind == b"-":
+            raise RedisError(rest.decode("utf-8", "replace"))
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            size = int(rest)
+            if size < 0:
+                return None
+            data = self._local.reader.read(size + 2)
+            return data[:-2]
+        if kind == b"*":
+            size = int(rest)
+            return None if size < 0 else [self._reply() for _ in range(size)]
+        raise ConnectionError(f"unexpected reply {line[:20]!r}")
+
+    def _roundtrip(self, *parts):
+        self._local.sock.sendall(_command(*parts))
+        return self._reply()
+
+    def execute(self, *parts):
+        """Send one command, reconnecting once if the connection dropped"""
+        for attempt in (0, 1):
+            if getattr(self._local, "sock", None) is None:
+                self._connect()
+            try:
+                return self._roundtrip(*parts)
+            except (OSError, ConnectionError):
+                self.close()
+                if attempt:
+                    raise
+
+    def close(self):
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            self._local.sock = None
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+    def get(self, key):
+        return self.execute("GET", key)
+
+    def set(self, key, value, ttl=None, only_new=False):
+        """Store ``value``; with ``only_new`` only if the key is absent. True if stored"""
+        parts = ["SET", key, value]
+        if ttl:
+            parts += ["PX", max(1, int(ttl * 1000))]
+        if only_new:
+            parts.append("NX")
+        return self.execute(*parts) is not None
+
+    def incr(self, key):
+        return self.execute("INCR", key)
+
+    def delete(self, key):
+        return self.execute("DEL", key) == 1
+
+    def clear(self):
+        self.execute("FLUSHDB")
+
+
+def open_backend(url=None):
+    """Backend for a ``memory://``, ``sqlite:///path`` or ``redis://`` URL"""
+    url = url or cache_url()
+    parsed = urlparse(url)
+    if parsed.scheme == "memory":
+        return MemoryBackend()
+    if parsed.scheme == "sqlite":
+        path = unquote(parsed.path)
+        if not path or path == "/":
+            raise ValueError("sqlite cache URL needs a file path, e.g. sqlite:////dev/shm/healthbridge.db")
+        return SQLiteBackend(path)
+    if parsed.scheme == "redis":
+        db = parsed.path.strip("/")
+        return RedisBackend(parsed.hostname or "localhost", parsed.port or 6379, int(db) if db else 0,
+                            unquote(parsed.password) if parsed.password else None)
+    raise ValueError(f"unsupported cache URL {url!r}; use memory://, sqlite:///path or redis://host:port")
+
+
+# ==================== SHARED CACHE ====================
+_MISSING = object()
+
+
+class SharedCache:
+    """Namespaced, generation-invalidated object cache over a byte backend"""
+
+    def __init__(self, backend, generation_ttl=GENERATION_TTL, lock_ttl=LOCK_TTL):
+        self.backend = backend
+        self.generation_ttl = generation_ttl if backend.shared else 0
+        self.lock_ttl = lock_ttl
+        self._generations = {}
+        self._watches = {}
+        self._lock = threading.Lock()
+
+    def _store_key(self, namespace, key, generation):
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return f"{KEY_PREFIX}:{namespace}:{generation}:{digest}"
+
+    def generation(self, namespace):
+        """Current generation of ``namespace``, re-read from the store at most every ``generation_ttl``
+
+        If the store is unreachable the last known generation (or 0) is used,
+        so reads simply miss.
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._generations.get(namespace)
+        if cached and now - cached[1] < self.generation_ttl:
+            return cached[0]
+        try:
+            value = self.backend.get(f"{KEY_PREFIX}:gen:{namespace}")
+        except STORE_ERRORS:
+            value = cached[0] if cached else 0
+        generation = int(value) if value else 0
+        with self._lock:
+            self._generations[namespace] = (generation, now)
+        return generation
+
+    def get(self, namespace, key, default=None):
+        return self._get(namespace, key, default, self.generation(namespace))
+
+    def _get(self, namespace, key, default, generation):
+        try:
+            with tracer.span("cache.get", namespace=namespace) as span:
+                data = self.backend.get(self._store_key(namespace, key, generation))
+                span["hit"] = data is not None
+        except STORE_ERRORS:
+            return default
+        return default if data is None else pickle.loads(data)
+
+    def set(self, namespace, key, value, ttl=DEFAULT_TTL):
+        self._put(namespace, key, value, ttl, self.generation(namespace))
+
+    def _put(self, namespace, key, value, ttl, generation):
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            with tracer.span("cache.set", namespace=namespace, bytes=len(data)):
+                self.backend.set(self._store_key(namespace, key, generation), data, ttl)
+        except STORE_ERRORS:
+            pass
+
+    def get_or_compute(self, namespace, key, compute, ttl=DEFAULT_TTL):
+        """Cached value, or ``compute()`` stored for ``ttl`` seconds; one worker computes at a time
+
+        The value is stored under the generation read before ``compute()``
+        ran, so an ``invalidate`` during the computation leaves it unreachable
+        instead of filing data read before the change under the new generation.
+        """
+        generation = self.generation(namespace)
+        value = self._get(namespace, key, _MISSING, generation)
+        if value is not _MISSING:
+            return value
+        lock_key = self._store_key(namespace, key, "lock")
+        try:
+            locked = self.backend.set(lock_key, b"1", self.lock_ttl, only_new=True)
+        except STORE_ERRORS:
+            return compute()
+        if not locked:
+            # Another worker is computing it; wait for its result, up to the lock's lifetime
+            deadline = time.monotonic() + self.lock_ttl
+            while time.monotonic() < deadline:
+                time.sleep(LOCK_POLL_SECONDS)
+                value = self.get(namespace, key, _MISSING)
+                if value is not _MISSING:
+                    return value
+            return compute()
+        try:
+            value = compute()
+            self._put(namespace, key, value, ttl, generation)
+            return value
+        finally:
+            try:
+                self.backend.delete(lock_key)
+            except STORE_ERRORS:
+                pass
+
+    def invalidate(self, namespace):
+        """Drop every entry of ``namespace`` for all workers"""
+        try:
+            generation = self.backend.incr(f"{KEY_PREFIX}:gen:{namespace}")
+        except STORE_ERRORS:
+            return
+        with self._lock:
+            self._generations[namespace] = (generation, time.monotonic())
+
+    def watch(self, namespace, callback):
+        """Call ``callback()`` from ``poll`` whenever ``namespace`` is invalidated"""
+        with self._lock:
+            self._watches.setdefault(namespace, [None, []])[1].append(callback)
+
+    def poll(self):
+        """Run the callbacks of watched namespaces whose generation moved since the last poll"""
+        with self._lock:
+            watched = list(self._watches.items())
+        for namespace, entry in watched:
+            generation = self.generation(namespace)
+            seen, entry[0] = entry[0], generation
+            if seen is not None and seen != generation:
+                for callback in entry[1]:
+                    callback()
+
+
+def open_cache(url=None):
+    """``SharedCache`` on the backend ``url`` names (default ``HEALTHBRIDGE_CACHE_URL``)"""
+    return SharedCache(open_backend(url))
+
+
+# ==================== STAND-IN SERVER ====================
+class RespServer:
+    """Enough of the Redis protocol for ``RedisBackend``, over a ``MemoryBackend``
+
+    Serves PING, GET, SET (EX/PX/NX), INCR, DEL, EXISTS, FLUSHDB, SELECT and
+    AUTH, so workers can share a cache without a Redis install.
+    """
+
+    def __init__(self, store=None, password=None):
+        self.store = store or MemoryBackend()
+        self.password = password
+
+    async def handle(self, reader, writer):
+        authed = not self.password
+        try:
+            while True:
+                command = await self._read_command(reader)
+                if command is None:
+                    break
+                name = command[0].upper() if command else b""
+                if not authed and name != b"AUTH":
+                    reply = b"-NOAUTH Authentication required.\r\n"
+                elif name == b"AUTH":
+                    authed = len(command) > 1 and command[-1].decode() == self.password
+                    reply = b"+OK\r\n" if authed else b"-WRONGPASS invalid password\r\n"
+                else:
+                    reply = self.dispatch(name, command[1:])
+                writer.write(reply)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_command(self, reader):
+        line = await reader.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.split()
+        parts = []
+        for _ in range(int(line[1:])):
+            size = int((await reader.readline())[1:])
+            parts.append((await reader.readexactly(size + 2))[:-2])
+        return parts
+
+    def dispatch(self, name, args):
+        try:
+            if name == b"PING":
+                return b"+PONG\r\n"
+            if name == b"GET" and len(args) == 1:
+                value = self.store.get(args[0].decode())
+                return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+            if name == b"SET" and len(args) >= 2:
+                ttl, only_new, options = None, False, [a.upper() for a in args[2:]]
+                for i, option in enumerate(options):
+                    if option == b"EX":
+                        ttl = float(options[i + 1])
+                    elif option == b"PX":
+                        ttl = float(options[i + 1]) / 1000
+                    elif option == b"NX":
+                        only_new = True
+                stored = self.store.set(args[0].decode(), args[1], ttl, only_new)
+                return b"+OK\r\n" if stored else b"$-1\r\n"
+            if name == b"INCR" and len(args) == 1:
+                return b":%d\r\n" % self.store.incr(args[0].decode())
+            if name in (b"DEL", b"EXISTS") and args:
+                check = self.store.delete if name == b"DEL" else self.store.get
+                return b":%d\r\n" % sum(check(a.decode()) not in (None, False) for a in args)
+            if name == b"FLUSHDB":
+                self.store.clear()
+                return b"+OK\r\n"
+            if name == b"SELECT":
+                return b"+OK\r\n"
+        except (ValueError, IndexError):
+            return b"-ERR syntax error\r\n"
+        return b"-ERR unknown command or wrong number of arguments\r\n"
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="run the Redis-protocol stand-in")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=6380)
+    serve.add_argument("--password", default=os.getenv("HEALTHBRIDGE_CACHE_PASSWORD"))
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(RespServer(password=args.password).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
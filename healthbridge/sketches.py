@@ -0,0 +1,271 @@
+"""Mergeable streaming sketches for distinct counts and quantiles
+
+``HyperLogLog`` estimates distinct patients and ``KLLSketch`` estimates
+vitals quantiles (median, p95). Both merge losslessly with sketches of the
+same parameters, so ``SketchStore`` keeps one small cell per (day, location)
+on ingest and answers any date window or state by merging cells instead of
+rescanning screenings.
+
+Error bounds:
+
+* HyperLogLog with precision ``p`` uses ``2**p`` one-byte registers. Its
+  relative standard error is ``1.04 / sqrt(2**p)``: 3.25% at the default
+  p=10 (1 KiB per cell), 1.6% at p=12. Counts below ``2.5 * 2**p`` use
+  linear counting and are close to exact.
+* KLL with parameter ``k`` returns a value whose rank is within about
+  ``1.7 / k * 100`` percent of the requested rank with 99% probability
+  (k=200: within 0.85% of rank; the median is between the 49.15th and
+  50.85th percentiles). Sketches holding fewer than ``k`` items are exact.
+"""
+import hashlib
+import math
+import random
+import threading
+import time
+
+import numpy as np
+
+HLL_PRECISION = 10
+KLL_K = 200
+SKETCH_FIELDS = "patient_id, location, timestamp, blood_glucose, systolic_bp, diastolic_bp"
+QUANTILE_VITALS = ("blood_glucose", "systolic_bp", "diastolic_bp")
+
+
+def _hash64(value):
+    return int.from_bytes(hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    """Distinct-count sketch (relative error ``1.04 / sqrt(2**p)``)"""
+
+    __slots__ = ("p", "registers")
+
+    def __init__(self, p=HLL_PRECISION):
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    def add(self, value):
+        x = _hash64(value)
+        index = x >> (64 - self.p)
+        rest = x & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        """Union with another sketch of the same precision (returns self)"""
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        """Estimated number of distinct values added"""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / float(np.ldexp(1.0, -self.registers.astype(np.int32)).sum())
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    @property
+    def relative_error(self):
+        return 1.04 / math.sqrt(1 << self.p)
+
+
+class KLLSketch:
+    """Quantile sketch (rank error about ``1.7 / k`` with 99% probability)"""
+
+    __slots__ = ("k", "compactors", "count", "min", "max", "_size", "_capacity")
+
+    def __init__(self, k=KLL_K):
+        self.k = k
+        self.compactors = [[]]
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._size = 0
+        self._capacity = self._level_capacity(0)
+
+    def _level_capacity(self, level):
+        depth = len(self.compactors) - level - 1
+        return int(math.ceil(self.k * (2 / 3) ** depth)) + 1
+
+    def _grow(self):
+        self.compactors.append([])
+        self._capacity = sum(self._level_capacity(h) for h in range(len(self.compactors)))
+
+    def add(self, value):
+        if value is None:
+            return
+        value = float(value)
+        if math.isnan(value):
+            return
+        self.compactors[0].append(value)
+        self.count += 1
+        self._size += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if self._size >= self._capacity:
+            self._compress()
+
+    def _compress(self):
+        while self._size >= self._capacity:
+            for level, items in enumerate(self.compactors):
+                if len(items) >= self._level_capacity(level):
+                    if level + 1 == len(self.compactors):
+                        self._grow()
+                    items.sort()
+                    keep = [items.pop()] if len(items) % 2 else []
+                    self.compactors[level + 1].extend(items[random.getrandbits(1)::2])
+                    self.compactors[level] = keep
+                    break
+            else:
+                return
+            self._size = sum(len(items) for items in self.compactors)
+
+    def merge(self, other):
+        """Fold another sketch into this one (returns self)"""
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for level, items in enumerate(other.compactors):
+            self.compactors[level].extend(items)
+        self.count += other.count
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+        self._size = sum(len(items) for items in self.compactors)
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """Approximate value at rank ``q`` (0-1), or None when empty"""
+        if not self.count:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        weighted = sorted((value, 1 << level)
+                          for level, items in enumerate(self.compactors) for value in items)
+        total = sum(weight for _, weight in weighted)
+        target = q * total
+        seen = 0
+        for value, weight in weighted:
+            seen += weight
+            if seen >= target:
+                return value
+        return self.max
+
+    @property
+    def rank_error(self):
+        return 1.7 / self.k
+
+
+class CellSketch:
+    """Distinct patients and vitals quantiles for one (day, location) cell"""
+
+    __slots__ = ("patients", "screenings", "vitals")
+
+    def __init__(self, p=HLL_PRECISION, k=KLL_K):
+        self.patients = HyperLogLog(p)
+        self.screenings = 0
+        self.vitals = {vital: KLLSketch(k) for vital in QUANTILE_VITALS}
+
+    def add(self, row):
+        self.screenings += 1
+        if row.get("patient_id"):
+            self.patients.add(row["patient_id"])
+        for vital, sketch in self.vitals.items():
+            try:
+                sketch.add(row.get(vital))
+            except (TypeError, ValueError):
+                pass
+
+    def merge(self, other):
+        self.patients.merge(other.patients)
+        self.screenings += other.screenings
+        for vital, sketch in self.vitals.items():
+            sketch.merge(other.vitals[vital])
+        return self
+
+    def indicators(self):
+        """Distinct patients plus median and p95 of each vital"""
+        result = {"screenings": self.screenings, "distinct_patients": self.patients.count()}
+        for vital, sketch in self.vitals.items():
+            result[f"{vital}_median"] = sketch.quantile(0.5)
+            result[f"{vital}_p95"] = sketch.quantile(0.95)
+        return result
+
+
+class SketchStore:
+    """Per-(day, location) sketches kept current on ingest"""
+
+    def __init__(self, p=HLL_PRECISION, k=KLL_K):
+        self._p = p
+        self._k = k
+        self._cells = {}
+        self._lock = threading.Lock()
+        self.loaded = False
+        self.built_at = None
+
+    @staticmethod
+    def _cell_key(row):
+        return str(row.get("timestamp") or "")[:10], row.get("location") or "Unknown"
+
+    def _add(self, cells, row):
+        key = self._cell_key(row)
+        cell = cells.get(key)
+        if cell is None:
+            cell = cells[key] = CellSketch(self._p, self._k)
+        cell.add(row)
+
+    def add(self, row):
+        """Fold a newly saved screening into its cell"""
+        with self._lock:
+            self._add(self._cells, row)
+
+    def load(self, rows):
+        """Build cells from a stream of rows (rows added meanwhile are kept)
+
+        ``rows`` is usually a scan of the whole table, so the cells are built
+        without the lock and merged in at the end; ``add`` is never held up,
+        and nothing is kept if the scan fails.
+        """
+        cells = {}
+        for row in rows:
+            self._add(cells, row)
+        with self._lock:
+            for key, cell in cells.items():
+                current = self._cells.get(key)
+                self._cells[key] = cell if current is None else cell.merge(current)
+            self.loaded = True
+            self.built_at = time.time()
+
+    def _matching(self, time_range, location):
+        for (day, cell_location), cell in self._cells.items():
+            if time_range and not (time_range[0] <= day < time_range[1]):
+                continue
+            if location is not None and cell_location != location:
+                continue
+            yield cell_location, cell
+
+    def merged(self, time_range=None, location=None):
+        """One sketch for a date window (ISO bounds, end exclusive) and optional location"""
+        result = CellSketch(self._p, self._k)
+        with self._lock:
+            for _, cell in self._matching(time_range, location):
+                result.merge(cell)
+        return result
+
+    def by_location(self, time_range=None):
+        """Merged sketch per location for a date window"""
+        result = {}
+        with self._lock:
+            for cell_location, cell in self._matching(time_range, None):
+                result.setdefault(cell_location, CellSketch(self._p, self._k)).merge(cell)
+        return result
@@ -0,0 +1,267 @@
+"""Single-pass summary statistics for dashboards and text reports
+
+``SummaryStats`` folds screening rows into counters in one pass and merges
+with other instances, so per-state aggregates can be kept incrementally and
+combined on demand. Reports render from the aggregates alone.
+"""
+import math
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+HIGH_RISK_SCORE = 5
+GLUCOSE_BANDS = (
+    ("Low (<70)", 70),
+    ("Normal (70-139)", 140),
+    ("Pre-diabetes (140-199)", 200),
+    ("Diabetes (≥200)", math.inf),
+)
+SUMMARY_FIELDS = "age, blood_glucose, risk_score, risk_level, location, timestamp"
+
+
+def glucose_band(value):
+    """Label of the glucose band a reading (mg/dL) falls in"""
+    for label, upper in GLUCOSE_BANDS:
+        if value < upper:
+            return label
+    return GLUCOSE_BANDS[-1][0]
+
+
+def is_high_risk(row):
+    """High or critical risk, by the saved level when present, else by rule score
+
+    The level is what the screening showed and what referral used; the
+    fitted model can raise it above the band of the stored rule score.
+    """
+    level = row.get("risk_level")
+    if level:
+        return "HIGH RISK" in level or "CRITICAL" in level
+    try:
+        return float(row.get("risk_score")) >= HIGH_RISK_SCORE
+    except (TypeError, ValueError):
+        return False
+
+
+def _number(value):
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class SummaryStats:
+    """Mergeable counters behind every dashboard KPI and report line"""
+
+    __slots__ = ("total", "high_risk", "age_sum", "age_count", "glucose_bands",
+                 "risk_levels", "locations", "daily", "first_timestamp", "last_timestamp")
+
+    def __init__(self):
+        self.total = 0
+        self.high_risk = 0
+        self.age_sum = 0.0
+        self.age_count = 0
+        self.glucose_bands = Counter()
+        self.risk_levels = Counter()
+        self.locations = Counter()
+        self.daily = Counter()
+        self.first_timestamp = None
+        self.last_timestamp = None
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Summarise rows in a single pass"""
+        stats = cls()
+        for row in rows:
+            stats.add(row)
+        return stats
+
+    def add(self, row):
+        """Fold one screening row into the counters"""
+        self.total += 1
+        if is_high_risk(row):
+            self.high_risk += 1
+        age = _number(row.get("age"))
+        if age is not None:
+            self.age_sum += age
+            self.age_count += 1
+        glucose = _number(row.get("blood_glucose"))
+        if glucose is not None:
+            self.glucose_bands[glucose_band(glucose)] += 1
+        if row.get("risk_level"):
+            self.risk_levels[row["risk_level"]] += 1
+        if row.get("location"):
+            self.locations[row["location"]] += 1
+        timestamp = row.get("timestamp")
+        if timestamp:
+            timestamp = str(timestamp)
+            self.daily[timestamp[:10]] += 1
+            if self.first_timestamp is None or timestamp < self.first_timestamp:
+                self.first_timestamp = timestamp
+            if self.last_timestamp is None or timestamp > self.last_timestamp:
+                self.last_timestamp = timestamp
+
+    def merge(self, other):
+        """Add another summary into this one (returns self)"""
+        self.total += other.total
+        self.high_risk += other.high_risk
+        self.age_sum += other.age_sum
+        self.age_count += other.age_count
+        self.glucose_bands.update(other.glucose_bands)
+        self.risk_levels.update(other.risk_levels)
+        self.locations.update(other.locations)
+        self.daily.update(other.daily)
+        first, last = other.first_timestamp, other.last_timestamp
+        if first and (self.first_timestamp is None or first < self.first_timestamp):
+            self.first_timestamp = first
+        if last and (self.last_timestamp is None or last > self.last_timestamp):
+            self.last_timestamp = last
+        return self
+
+    @property
+    def average_age(self):
+        return self.age_sum / self.age_count if self.age_count else None
+
+    @property
+    def high_risk_rate(self):
+        return self.high_risk / self.total if self.total else 0.0
+
+    @property
+    def most_common_location(self):
+        return self.locations.most_common(1)[0][0] if self.locations else None
+
+    @property
+    def average_daily(self):
+        """Screenings per day over the observed span"""
+        if not self.daily:
+            return 0.0
+        days = sorted(self.daily)
+        try:
+            span = (date.fromisoformat(days[-1]) - date.fromisoformat(days[0])).days + 1
+        except ValueError:
+            return 0.0
+        return self.total / span
+
+    def glucose_counts(self):
+        """Glucose band counts in band order"""
+        return [(label, self.glucose_bands.get(label, 0)) for label, _ in GLUCOSE_BANDS]
+
+
+# ==================== PARTITIONED AGGREGATION ====================
+def summarize_by(rows, key="location"):
+    """Per-key summaries, folding each row into its key's counters in one pass
+
+    Rows are not grouped or copied first, so memory stays at one summary
+    per key however many rows stream through.
+    """
+    by_key = {}
+    for row in rows:
+        group = row.get(key) or "Unknown"
+        stats = by_key.get(group)
+        if stats is None:
+            stats = by_key[group] = SummaryStats()
+        stats.add(row)
+    return by_key
+
+
+def overall(by_key):
+    """Merge per-key summaries into one"""
+    merged = SummaryStats()
+    for stats in by_key.values():
+        merged.merge(stats)
+    return merged
+
+
+class SummaryAggregates:
+    """Per-location summaries kept current by incremental ``add`` calls"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_location = {}
+        self.loaded = False
+        self.built_at = None
+
+    def load(self, by_location, built_at=None):
+        """Install the initial per-location snapshot, keeping rows added meanwhile
+
+        ``built_at`` is when the snapshot was read, if it came from a cache.
+        """
+        with self._lock:
+            for key, stats in by_location.items():
+                self._by_location.setdefault(key, SummaryStats()).merge(stats)
+            self.loaded = True
+            self.built_at = built_at or time.time()
+
+    def add(self, row):
+        """Fold a newly saved screening into its location's summary"""
+        with self._lock:
+            key = row.get("location") or "Unknown"
+            self._by_location.setdefault(key, SummaryStats()).add(row)
+
+    def by_location(self):
+        """Copy of the per-location summaries"""
+        with self._lock:
+            return {k: SummaryStats().merge(v) for k, v in self._by_location.items()}
+
+    def overall(self):
+        """All locations merged"""
+        with self._lock:
+            return overall(self._by_location)
+
+
+# ==================== REPORTS ====================
+def _counts_block(counter):
+    if not counter:
+        return "N/A"
+    width = max(len(str(k)) for k in counter)
+    return "\n".join(f"{str(k):<{width}}    {v}" for k, v in counter.most_common())
+
+
+def render_report(stats, title=None, generated_at=None):
+    """Plain-text dashboard report from a summary (no row access)"""
+    generated_at = generated_at or datetime.now()
+    average_age = f"{stats.average_age:.1f}" if stats.average_age is not None else "N/A"
+    glucose = dict(stats.glucose_counts())
+    heading = "HEALTH BRIDGE INITIATIVE - DASHBOARD REPORT"
+    if title:
+        heading += f" - {title.upper()}"
+    return f"""
+{heading}
+Generated: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}
+===================================================
+
+SUMMARY STATISTICS:
+• Total Screenings: {stats.total}
+• High Risk Cases: {stats.high_risk} ({stats.high_risk_rate * 100:.1f}%)
+• Average Age: {average_age}
+• Most Common Location: {stats.most_common_location or 'N/A'}
+
+GLUCOSE ANALYSIS:
+• Low (<70 mg/dL): {glucose[GLUCOSE_BANDS[0][0]]}
+• Normal (70-139 mg/dL): {glucose[GLUCOSE_BANDS[1][0]]}
+• Pre-diabetes (140-199 mg/dL): {glucose[GLUCOSE_BANDS[2][0]]}
+• Diabetes (≥200 mg/dL): {glucose[GLUCOSE_BANDS[3][0]]}
+
+RISK DISTRIBUTION:
+{_counts_block(stats.risk_levels)}
+
+GEOGRAPHIC DISTRIBUTION:
+{_counts_block(stats.locations)}
+
+TIMELINE:
+• First Record: {stats.first_timestamp or 'N/A'}
+• Last Record: {stats.last_timestamp or 'N/A'}
+• Average Daily: {stats.average_daily:.1f} screenings/day
+
+===================================================
+Report generated by Health Bridge Analytics System
+"""
+
+
+def render_reports(by_key, workers=4):
+    """Render one report per key (e.g. per state) concurrently"""
+    generated_at = datetime.now()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {k: pool.submit(render_report, v, k, generated_at) for k, v in by_key.items()}
+        return {k: f.result() for k, f in futures.items()}
@@ -0,0 +1,180 @@
+"""Deterministic synthetic screenings, volunteers and payments
+
+Every generator is vectorised with NumPy and driven by a seeded
+``numpy.random.Generator``, so the same ``(n, seed)`` always yields the same
+rows. Millions of rows take seconds. Output is columnar (a dict of arrays);
+``records`` turns it into the list-of-dicts shape Supabase returns.
+
+Screenings model repeat visits: rows are drawn from a pool of patients whose
+name, phone, sex, state and baseline age are fixed, and vitals correlate
+with age. Risk scores come from ``kidney_risk_batch`` so they match the app.
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from healthbridge.risk import URINE_PROTEIN_SCORES, kidney_risk_batch
+
+STATES = ("Lagos", "Kano", "Abuja", "Port Harcourt", "Ibadan", "Ogun", "Oyo", "Others")
+STATE_WEIGHTS = (0.28, 0.17, 0.12, 0.1, 0.1, 0.08, 0.08, 0.07)
+FIRST_NAMES = ("Adaeze", "Adebayo", "Aisha", "Amina", "Chidi", "Chinedu", "Emeka", "Fatima",
+               "Funmilayo", "Ibrahim", "Ifeoma", "Kemi", "Musa", "Ngozi", "Nkechi", "Oluwaseun",
+               "Segun", "Tunde", "Uche", "Yusuf", "Zainab", "Bola", "Halima", "Obinna")
+LAST_NAMES = ("Abubakar", "Adeyemi", "Afolabi", "Bello", "Eze", "Ibrahim", "Nwachukwu", "Obi",
+              "Odunsi", "Ogunleye", "Okafor", "Okonkwo", "Olawale", "Onyeka", "Sani", "Usman",
+              "Yakubu", "Balogun", "Danjuma", "Chukwu")
+PHONE_PREFIXES = ("0803", "0806", "0813", "0816", "0703", "0706", "0805", "0807", "0815", "0905", "0802", "0808")
+URINE_WEIGHTS = (0.7, 0.12, 0.1, 0.05, 0.03)
+DEFAULT_START = datetime(2025, 10, 1)
+
+
+def _rng(seed, stream):
+    return np.random.default_rng([seed, stream])
+
+
+def _pick(rng, options, n, weights=None):
+    return np.asarray(options, dtype=object)[rng.choice(len(options), size=n, p=weights)]
+
+
+def _names(rng, n):
+    first = np.asarray(FIRST_NAMES, dtype=object)[rng.integers(0, len(FIRST_NAMES), n)]
+    last = np.asarray(LAST_NAMES, dtype=object)[rng.integers(0, len(LAST_NAMES), n)]
+    return first + " " + last
+
+
+def _phones(rng, n):
+    prefixes = np.asarray(PHONE_PREFIXES, dtype=object)[rng.integers(0, len(PHONE_PREFIXES), n)]
+    digits = np.char.zfill(rng.integers(0, 10 ** 7, n).astype(str), 7).astype(object)
+    return prefixes + digits
+
+
+def _timestamps(rng, n, start, days):
+    seconds = np.sort(rng.integers(0, days * 86400, n))
+    base = np.datetime64(start, "s")
+    return np.datetime_as_string(base + seconds.astype("timedelta64[s]"), unit="s").astype(object)
+
+
+def _yes_no(flags):
+    return np.where(flags, "Yes", "No").astype(object)
+
+
+def screenings(n, seed=0, patients=None, start=DEFAULT_START, days=365):
+    """Columns for ``n`` screenings drawn from ``patients`` people (default 0.8 n)"""
+    patients = max(1, int(patients or n * 0.8))
+    people = _rng(seed, 1)
+    rng = _rng(seed, 2)
+
+    patient_names = _names(people, patients)
+    patient_phones = _phones(people, patients)
+    patient_sex = _pick(people, ("Male", "Female"), patients)
+    patient_state = _pick(people, STATES, patients, STATE_WEIGHTS)
+    patient_age = np.clip(people.normal(42, 16, patients), 18, 95).astype(int)
+    patient_family = people.random(patients) < 0.15
+
+    who = rng.integers(0, patients, n)
+    age = patient_age[who]
+    systolic = np.clip(95 + 0.6 * age + rng.normal(0, 15, n), 80, 250).round().astype(int)
+    diastolic = np.clip(0.55 * systolic + 12 + rng.normal(0, 8, n), 50, 150).round().astype(int)
+    glucose = np.clip(rng.lognormal(np.log(105) + 0.004 * (age - 40), 0.32, n), 20, 600).round().astype(int)
+    weight = np.clip(rng.normal(72, 14, n), 35, 200).round(1)
+    height = np.clip(rng.normal(167, 9, n), 120, 210).round().astype(int)
+
+    columns = {
+        "id": np.arange(1, n + 1),
+        "patient_id": np.char.add("HB", np.char.zfill(who.astype(str), 8)).astype(object),
+        "name": patient_names[who],
+        "age": age,
+        "phone": patient_phones[who],
+        "location": patient_state[who],
+        "sex": patient_sex[who],
+        "systolic_bp": systolic,
+        "diastolic_bp": diastolic,
+        "blood_glucose": glucose,
+        "weight": weight,
+        "height": height,
+        "urine_protein": _pick(rng, tuple(URINE_PROTEIN_SCORES), n, URINE_WEIGHTS),
+        "known_diabetes": _yes_no(rng.random(n) < np.where(glucose >= 200, 0.55, 0.04)),
+        "known_hypertension": _yes_no(rng.random(n) < np.where(systolic >= 140, 0.5, 0.06)),
+        "family_history": _yes_no(patient_family[who]),
+        "herbal_use": _yes_no(rng.random(n) < 0.25),
+        "smoking": _yes_no(rng.random(n) < 0.09),
+        "timestamp": _timestamps(rng, n, start, days),
+    }
+    scores, levels = kidney_risk_batch(columns)
+    columns["bmi"] = (weight / (height / 100) ** 2).round(1)
+    columns["risk_score"] = scores
+    columns["risk_level"] = levels
+    return columns
+
+
+def volunteers(n, seed=0, start=DEFAULT_START, days=365):
+    """Columns for ``n`` volunteer registrations"""
+    rng = _rng(seed, 3)
+    names = _names(rng, n)
+    handles = np.char.lower(np.char.replace(names.astype(str), " ", ".")).astype(object)
+    return {
+        "id": np.arange(1, n + 1),
+        "full_name": names,
+        "email": handles + np.char.mod("%d@example.org", np.arange(n)).astype(object),
+        "phone": _phones(rng, n),
+        "location": _pick(rng, STATES, n, STATE_WEIGHTS),
+        "profession": _pick(rng, ("Nurse", "Doctor", "Pharmacist", "Community Health Worker",
+                                  "Student", "Lab Scientist"), n, (0.3, 0.1, 0.1, 0.3, 0.15, 0.05)),
+        "availability": _pick(rng, ("Weekends", "Weekdays", "Flexible"), n),
+        "status": _pick(rng, ("active", "pending", "inactive"), n, (0.6, 0.3, 0.1)),
+        "timestamp": _timestamps(rng, n, start, days),
+    }
+
+
+def payments(n, seed=0, funding_requests=50, start=DEFAULT_START, days=365):
+    """Columns for ``n`` Paystack payments (mostly successful, Naira amounts)"""
+    rng = _rng(seed, 4)
+    amounts = np.asarray((1000, 2000, 5000, 10000, 20000, 50000, 100000), dtype=float)
+    names = _names(rng, n)
+    return {
+        "id": np.arange(1, n + 1),
+        "reference": np.char.add("HB-", np.char.zfill(np.arange(n).astype(str), 10)).astype(object),
+        "email": np.char.mod("donor%d@example.org", rng.integers(0, max(1, n // 3), n)).astype(object),
+        "donor_name": names,
+        "amount": amounts[rng.choice(len(amounts), n, p=(0.2, 0.2, 0.25, 0.15, 0.1, 0.07, 0.03))],
+        "status": _pick(rng, ("success", "failed", "abandoned"), n, (0.9, 0.06, 0.04)),
+        "funding_request_id": np.char.mod("%d", rng.integers(1, funding_requests + 1, n)).astype(object),
+        "timestamp": _timestamps(rng, n, start, days),
+    }
+
+
+def outcomes(columns, seed=0):
+    """Referral outcomes for some of the screenings in ``columns``
+
+    Whether CKD is confirmed follows a hidden logistic model of the vitals
+    and history, so a fitted model has real signal to find. Higher rule
+    scores are more likely to be followed up, as referred patients are.
+    """
+    rng = _rng(seed, 5)
+    n = len(columns["id"])
+    age = np.asarray(columns["age"], dtype=float)
+    systolic = np.asarray(columns["systolic_bp"], dtype=float)
+    glucose = np.asarray(columns["blood_glucose"], dtype=float)
+    bmi = np.asarray(columns["weight"], dtype=float) / (np.asarray(columns["height"], dtype=float) / 100) ** 2
+    urine = np.zeros(n)
+    for label, value in URINE_PROTEIN_SCORES.items():
+        urine[columns["urine_protein"] == label] = value
+    yes = {field: (columns[field] == "Yes").astype(float)
+           for field in ("known_diabetes", "known_hypertension", "family_history", "herbal_use", "smoking")}
+    logit = (-4.2 + 0.035 * (systolic - 125) + 0.008 * (glucose - 105) + 0.85 * urine
+             + 0.9 * yes["known_diabetes"] + 0.4 * yes["known_hypertension"] + 0.7 * yes["family_history"]
+             + 0.45 * yes["herbal_use"] + 0.25 * yes["smoking"] + 0.045 * (age - 42) + 0.04 * (bmi - 25))
+    confirmed = rng.random(n) < 1 / (1 + np.exp(-logit))
+    followed = rng.random(n) < np.clip(0.25 + 0.1 * np.asarray(columns["risk_score"], dtype=float), 0, 0.95)
+    return {
+        "screening_id": np.asarray(columns["id"])[followed],
+        "patient_id": np.asarray(columns["patient_id"])[followed],
+        "ckd_confirmed": confirmed[followed],
+    }
+
+
+def records(columns):
+    """Row dicts (Supabase response shape) from generator columns"""
+    names = list(columns)
+    values = [np.asarray(columns[name]).tolist() for name in names]
+    return [dict(zip(names, row)) for row in zip(*values)]
@@ -0,0 +1,50 @@
+"""Date-range windows for dashboards
+
+A window is a ``(start, end)`` pair of dates, both inclusive, or ``None``
+for all time. ``bounds`` turns it into the half-open ISO strings used for
+``timestamp >= start and timestamp < end`` filters, which Postgres answers
+from the timestamp index and the matching monthly partitions only.
+"""
+from datetime import date, timedelta
+
+PRESETS = ("All time", "Today", "Last 7 days", "Last 30 days", "Last 90 days", "This year", "Custom")
+_PRESET_DAYS = {"Today": 1, "Last 7 days": 7, "Last 30 days": 30, "Last 90 days": 90}
+
+
+def preset_window(preset, today=None):
+    """Window for a named preset (``None`` for all time and custom)"""
+    today = today or date.today()
+    if preset in _PRESET_DAYS:
+        return today - timedelta(days=_PRESET_DAYS[preset] - 1), today
+    if preset == "This year":
+        return date(today.year, 1, 1), today
+    return None
+
+
+def bounds(window):
+    """``(start, end)`` ISO strings with an exclusive end, or ``None`` for all time"""
+    if window is None:
+        return None
+    start, end = window
+    if end < start:
+        start, end = end, start
+    return start.isoformat(), (end + timedelta(days=1)).isoformat()
+
+
+def describe(window):
+    """Short label such as '2026-10-13 – 2026-10-19'"""
+    if window is None:
+        return "All time"
+    start, end = window
+    return start.isoformat() if start == end else f"{start.isoformat()} – {end.isoformat()}"
+
+
+def month_starts(window):
+    """First day of every month the window touches (the partitions a query reads)"""
+    start, end = window
+    month = date(start.year, start.month, 1)
+    months = []
+    while month <= end:
+        months.append(month)
+        month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+    return months
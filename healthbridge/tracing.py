@@ -0,0 +1,245 @@
+"""Lightweight request tracing: spans, a JSON-lines log and Prometheus metrics
+
+``tracer.span(name, **attrs)`` times a block. Each finished span is counted
+in a fixed-bucket latency histogram exported in Prometheus text format, kept
+in a short per-span window for p50/p95 display, and queued for a background
+thread that appends it to a JSON-lines log. The log is per process
+(``HEALTHBRIDGE_TRACE_LOG`` with the process id before the extension), so
+app or service workers never rotate each other's file; lines are dropped,
+not waited for, if the writer falls behind. Attributes such as ``rows`` and
+``bytes`` can be set while the span is open via the yielded dict and are
+summed into counters.
+
+``serve_metrics(port)`` exposes ``/metrics`` from a daemon thread for
+Prometheus to scrape; Streamlit itself cannot serve extra routes. It listens
+on localhost only unless ``HEALTHBRIDGE_METRICS_HOST`` names another
+interface (e.g. ``0.0.0.0`` behind a firewall that admits only the scraper).
+"""
+import functools
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+WINDOW = 2048
+LOG_MAX_BYTES = 50 * 1024 * 1024
+LOG_QUEUE_MAX = 50000
+COUNTED_ATTRS = ("rows", "bytes")
+
+
+def default_log_path():
+    """``HEALTHBRIDGE_TRACE_LOG`` for this process, e.g. healthbridge-trace.4242.jsonl"""
+    base, extension = os.path.splitext(os.getenv("HEALTHBRIDGE_TRACE_LOG",
+                                                 os.path.join(tempfile.gettempdir(), "healthbridge-trace.jsonl")))
+    return f"{base}.{os.getpid()}{extension}"
+
+
+class _SpanStats:
+    __slots__ = ("buckets", "count", "total", "errors", "recent", "counters")
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.errors = 0
+        self.recent = deque(maxlen=WINDOW)
+        self.counters = dict.fromkeys(COUNTED_ATTRS, 0)
+
+
+class Tracer:
+    """Span recorder shared by the whole process"""
+
+    def __init__(self, log_path=None, enabled=True):
+        self.enabled = enabled
+        self._fixed_log_path = log_path
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._lines = None
+        self._writer_pid = None
+        self.dropped_lines = 0
+
+    @property
+    def log_path(self):
+        return self._fixed_log_path or default_log_path()
+
+    def _queue_line(self, record):
+        # The writer thread does not survive a fork, so each process starts its own
+        if self._writer_pid != os.getpid():
+            with self._lock:
+                if self._writer_pid != os.getpid():
+                    self._lines = queue.Queue(maxsize=LOG_QUEUE_MAX)
+                    threading.Thread(target=self._write_lines, args=(self._lines, self.log_path),
+                                     name="trace-log", daemon=True).start()
+                    self._writer_pid = os.getpid()
+        try:
+            self._lines.put_nowait(record)
+        except queue.Full:
+            self.dropped_lines += 1
+
+    @staticmethod
+    def _write_lines(lines, path):
+        """Writer thread: appends queued records to ``path``, rotating it past ``LOG_MAX_BYTES``"""
+        log = None
+        while True:
+            batch = [lines.get()]
+            try:
+                while len(batch) < 1000:
+                    batch.append(lines.get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                if log is None:
+                    log = open(path, "a", encoding="utf-8")
+                log.write("".join(json.dumps(record, default=str) + "\n" for record in batch))
+                log.flush()
+                if log.tell() > LOG_MAX_BYTES:
+                    log.close()
+                    log = None
+                    os.replace(path, path + ".1")
+            except OSError:
+                log = None
+
+    def record(self, name, duration, attrs=None, error=None):
+        """Record a finished span"""
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = _SpanStats()
+            stats.count += 1
+            stats.total += duration
+            stats.recent.append(duration)
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if duration <= bound:
+                    stats.buckets[i] += 1
+                    break
+            if error:
+                stats.errors += 1
+            for key in COUNTED_ATTRS:
+                value = (attrs or {}).get(key)
+                if isinstance(value, (int, float)):
+                    stats.counters[key] += value
+        self._queue_line({"ts": time.time(), "span": name, "duration_ms": round(duration * 1000, 3),
+                          "thread": threading.current_thread().name, "error": error, **(attrs or {})})
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """Time a block; the yielded dict collects extra attributes"""
+        if not self.enabled:
+            yield attrs
+            return
+        start = time.perf_counter()
+        error = None
+        try:
+            yield attrs
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.record(name, time.perf_counter() - start, attrs, error)
+
+    def summary(self):
+        """Per-span count, mean, p50, p95 and max over the recent window"""
+        import numpy as np
+
+        with self._lock:
+            items = [(name, stats.count, stats.total, stats.errors, list(stats.recent), dict(stats.counters))
+                     for name, stats in self._stats.items()]
+        rows = []
+        for name, count, total, errors, recent, counters in sorted(items):
+            p50, p95 = np.percentile(recent, [50, 95]) if recent else (0.0, 0.0)
+            rows.append({"span": name, "count": count, "errors": errors,
+                         "mean_ms": total / count * 1000 if count else 0.0,
+                         "p50_ms": float(p50) * 1000, "p95_ms": float(p95) * 1000,
+                         "max_ms": max(recent) * 1000 if recent else 0.0, **counters})
+        return rows
+
+    def prometheus(self):
+        """All span metrics in Prometheus text exposition format"""
+        lines = ["# HELP healthbridge_span_duration_seconds Span latency",
+                 "# TYPE healthbridge_span_duration_seconds histogram"]
+        with self._lock:
+            items = sorted(self._stats.items())
+            for name, stats in items:
+                label = name.replace("\\", "\\\\").replace('"', '\\"')
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                    cumulative += count
+                    lines.append(f'healthbridge_span_duration_seconds_bucket{{span="{label}",le="{bound}"}} {cumulative}')
+                lines.append(f'healthbridge_span_duration_seconds_bucket{{span="{label}",le="+Inf"}} {stats.count}')
+                lines.append(f'healthbridge_span_duration_seconds_sum{{span="{label}"}} {stats.total}')
+                lines.append(f'healthbridge_span_duration_seconds_count{{span="{label}"}} {stats.count}')
+            for metric, help_text in (("errors", "Spans that raised"), ("rows", "Rows handled"),
+                                      ("bytes", "Payload bytes handled")):
+                lines.append(f"# HELP healthbridge_span_{metric}_total {help_text}")
+                lines.append(f"# TYPE healthbridge_span_{metric}_total counter")
+                for name, stats in items:
+                    label = name.replace("\\", "\\\\").replace('"', '\\"')
+                    value = stats.errors if metric == "errors" else stats.counters[metric]
+                    lines.append(f'healthbridge_span_{metric}_total{{span="{label}"}} {value}')
+        lines += ["# HELP healthbridge_trace_log_dropped_total Span log lines dropped while the writer was behind",
+                  "# TYPE healthbridge_trace_log_dropped_total counter",
+                  f"healthbridge_trace_log_dropped_total {self.dropped_lines}"]
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+tracer = Tracer(enabled=os.getenv("HEALTHBRIDGE_TRACING", "1") != "0")
+
+
+def traced(name):
+    """Decorator wrapping every call of a function in a span"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def payload_bytes(value):
+    """Approximate wire size of a JSON payload"""
+    try:
+        return len(json.dumps(value, default=str, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return None
+
+
+def metrics_host():
+    """Interface for the metrics endpoint: ``HEALTHBRIDGE_METRICS_HOST``, default localhost"""
+    return os.getenv("HEALTHBRIDGE_METRICS_HOST", "127.0.0.1")
+
+
+def serve_metrics(port, host=None, source=None):
+    """Serve ``/metrics`` in a daemon thread; returns the server"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    host = host or metrics_host()
+    source = source or tracer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = source.prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
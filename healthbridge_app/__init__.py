@@ -0,0 +1,8 @@
+"""Streamlit front end for the Health Bridge Initiative
+
+``engine`` holds data access and process-wide stores, ``components`` the
+widgets several pages share, ``pages`` one module per page and ``registry``
+the page table the navigation and the ``pages/`` scripts are built from.
+Page modules are imported the first time their page is shown, so opening one
+page never loads the code (or the Plotly/pandas imports) of the others.
+"""
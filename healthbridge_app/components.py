@@ -0,0 +1,520 @@
+"""Streamlit widgets and cached loaders shared by several pages"""
+import io
+import os
+import zipfile
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from healthbridge.lazy import lazy_import
+from healthbridge.tracing import tracer, serve_metrics
+from healthbridge.export import FORMATS as EXPORT_FORMATS, export_rows, export_filename
+from healthbridge.summary import render_report, render_reports
+from healthbridge.figures import FigureCache, data_version
+from healthbridge.lite import wants_lite, figure_svg, figure_summary, qr_svg
+from healthbridge.records import RECORD_COLUMNS, SORTABLE_COLUMNS, PAGE_SIZES, make_view
+from healthbridge.timerange import PRESETS, preset_window, bounds, describe, month_starts
+from healthbridge.identity import IDENTITY_TABLE
+from healthbridge_app.engine import (HealthBridgeAI, ANALYTICS, SUMMARY_TTL_SECONDS, CloudReadError,
+                                     analytics_cache, get_history_store,
+                                     get_gates, get_record_pages, get_session_store, get_shared_cache,
+                                     load_sketches)
+
+pd = lazy_import("pandas")
+go = lazy_import("plotly.graph_objects")
+plotly_subplots = lazy_import("plotly.subplots")
+charts = lazy_import("healthbridge.charts")
+sketches = lazy_import("healthbridge.sketches")
+epi = lazy_import("healthbridge.epi")
+
+# ==================== LITE MODE ====================
+LITE_STATE_KEY = "lite_mode"
+
+def request_headers():
+    """Headers of the browser request behind this session ({} when unavailable)"""
+    context = getattr(st, "context", None)
+    if context is not None:
+        return dict(context.headers)
+    try:
+        from streamlit.web.server.websocket_headers import _get_websocket_headers
+        return dict(_get_websocket_headers() or {})
+    except Exception:
+        return {}
+
+def lite_mode():
+    """Whether this session renders in lite mode
+
+    Decided once per session: ``?lite=1`` / ``?lite=0`` in the URL wins,
+    otherwise Save-Data, slow-connection hints or a feature-phone browser
+    switch it on. The sidebar toggle changes it afterwards.
+    """
+    if LITE_STATE_KEY not in st.session_state:
+        requested = st.query_params.get("lite")
+        if requested in ("0", "1"):
+            st.session_state[LITE_STATE_KEY] = requested == "1"
+        else:
+            st.session_state[LITE_STATE_KEY] = wants_lite(request_headers())
+    return st.session_state[LITE_STATE_KEY]
+
+def lite_toggle():
+    """Sidebar switch between full and lite rendering"""
+    def store_choice():
+        st.session_state[LITE_STATE_KEY] = st.session_state.lite_mode_toggle
+    
+    st.checkbox("📶 Lite mode (low data)", value=lite_mode(), key="lite_mode_toggle", on_change=store_choice,
+                help="Static images instead of interactive charts and no decorative styling")
+
+def styled(html, plain=None):
+    """Styled HTML block; in lite mode its plain Markdown version, or nothing if purely decorative"""
+    if not lite_mode():
+        st.markdown(html, unsafe_allow_html=True)
+    elif plain:
+        st.markdown(plain)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def lite_chart(kind, version, _spec):
+    """Static SVG for a cached figure spec (None if the chart has no lite form)"""
+    return figure_svg(_spec)
+
+@st.cache_data(show_spinner=False)
+def qr_code(data):
+    """Locally generated QR code SVG, or None without the segno package"""
+    try:
+        return qr_svg(data)
+    except ImportError:
+        return None
+
+# ==================== TRACING ====================
+METRICS_PORT = int(os.getenv("HEALTHBRIDGE_METRICS_PORT", "9464"))
+
+@st.cache_resource
+def start_metrics_server():
+    """Prometheus /metrics endpoint for this process (None if the port is taken)"""
+    try:
+        return serve_metrics(METRICS_PORT)
+    except OSError:
+        return None
+
+def show_performance_panel():
+    """p50/p95 latency per span recorded by this process"""
+    st.subheader("Performance")
+    rows = tracer.summary()
+    if not rows:
+        st.info("No spans recorded yet.")
+        return
+    table = pd.DataFrame(rows)
+    st.dataframe(table.round(2), use_container_width=True, hide_index=True)
+    slowest = table.sort_values("p95_ms", ascending=False).head(15)
+    fig = go.Figure([
+        go.Bar(name="p50", x=slowest["span"], y=slowest["p50_ms"]),
+        go.Bar(name="p95", x=slowest["span"], y=slowest["p95_ms"]),
+    ])
+    fig.update_layout(barmode="group", yaxis_title="ms", title="Slowest spans (p95)")
+    st.plotly_chart(fig, use_container_width=True)
+    server = start_metrics_server()
+    st.caption(f"Trace log: {tracer.log_path} · "
+               + (f"Prometheus metrics at {server.server_address[0]}:{METRICS_PORT}/metrics" if server
+                  else "metrics endpoint not running in this process"))
+    if st.button("Reset span statistics"):
+        tracer.reset()
+        st.rerun()
+
+# ==================== SESSION STATE ====================
+def show_session_panel():
+    """Open sessions in this worker and the memory their state holds"""
+    stats = get_session_store().stats()
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Open Sessions", f"{stats['sessions']:,}", f"of {stats['max_sessions']:,} max", delta_color="off")
+    with col2:
+        st.metric("Session Memory", f"{stats['bytes'] / 1024:,.1f} KB",
+                  f"largest {stats['largest_bytes'] / 1024:,.1f} KB", delta_color="off")
+    with col3:
+        st.metric("Idle Evictions", f"{stats['evicted_idle']:,}")
+    with col4:
+        st.metric("Capacity Evictions", f"{stats['evicted_capacity']:,}")
+    st.caption(f"{stats['with_screening']:,} sessions hold a screening result. Sessions idle for "
+               f"{stats['idle_seconds'] // 60:.0f} minutes are dropped; the longest idle now is "
+               f"{stats['oldest_idle_s'] / 60:.1f} minutes. Counts are for this app worker only.")
+
+# ==================== ADMISSION CONTROL ====================
+def show_admission_panel():
+    """Calls admitted, queued and turned away by each rate limiter in this worker"""
+    for gate in get_gates().values():
+        stats = gate.stats()
+        st.write(f"**{stats['gate'].title()}** · {stats['rate']:g} calls/s, {stats['client_rate']:g} per session, "
+                 f"{stats['max_concurrent']} at a time")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Admitted", f"{stats['admitted']:,}", f"{stats['in_flight']} in flight", delta_color="off")
+        with col2:
+            st.metric("Throttled", f"{stats['throttled']:,}", f"avg wait {stats['avg_wait_s']:.1f}s",
+                      delta_color="off")
+        with col3:
+            st.metric("Gave Up", f"{stats['rejected']:,}")
+        with col4:
+            st.metric("Waiting Now", f"{stats['queued']:,}")
+    st.caption("Submissions over a limit wait in line with a progress bar instead of failing; "
+               "they give up only after the upstream's maximum wait. Counts are for this app worker only.")
+
+# ==================== CHART CACHE ====================
+@st.cache_resource
+def get_figure_cache():
+    """Process-wide cache of serialised Plotly figure specs"""
+    return FigureCache()
+
+def show_chart(kind, version, build):
+    """Render a chart from the figure cache, building it only when its data changed"""
+    def traced_build():
+        with tracer.span("chart.build", chart=kind):
+            return build()
+    
+    with tracer.span("chart.render", chart=kind):
+        spec = get_figure_cache().spec(kind, version, traced_build)
+        if not lite_mode():
+            st.plotly_chart(spec, use_container_width=True)
+            return
+        svg = lite_chart(kind, version, spec)
+        if svg:
+            st.image(svg)
+        else:
+            st.caption(figure_summary(spec))
+
+def build_glucose_gauge():
+    """Glucose gauge template; the needle value is patched per screening"""
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=0,
+        title={'text': "Blood Glucose (mg/dL)"},
+        number={'suffix': " mg/dL"},
+        gauge={
+            'axis': {'range': [40, 300]},
+            'bar': {'color': "#1f77b4"},
+            'steps': [
+                {'range': [40, 70], 'color': "#e6f3ff"},
+                {'range': [70, 140], 'color': "#d4edda"},
+                {'range': [140, 200], 'color': "#fff3cd"},
+                {'range': [200, 300], 'color': "#f8d7da"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 200
+            }
+        }
+    ))
+    fig.update_layout(height=300)
+    return fig
+
+GLUCOSE_BANDS = ((70, "Low"), (140, "Normal"), (200, "High"), (float("inf"), "Very high"))
+
+def show_glucose_gauge(glucose):
+    """Glucose gauge built once per process with only its value patched"""
+    if lite_mode():
+        band = next(label for limit, label in GLUCOSE_BANDS if glucose < limit)
+        st.metric("Blood Glucose", f"{glucose} mg/dL", band, delta_color="off")
+        return
+    spec = get_figure_cache().template("glucose_gauge", build_glucose_gauge)
+    spec['data'][0]['value'] = glucose
+    st.plotly_chart(spec, use_container_width=True)
+
+@analytics_cache
+@st.cache_data(ttl=300, show_spinner=False)
+def load_chart_columns(time_range=None):
+    """Columns behind the analytics charts as NumPy arrays (age, glucose, risk score, risk level)"""
+    def compute():
+        ai_engine = HealthBridgeAI()
+        rows = ai_engine.iter_from_cloud("screening_data", charts.CHART_FIELDS, time_range=time_range)
+        frame = pd.DataFrame(rows, columns=['age', 'blood_glucose', 'risk_score', 'risk_level'])
+        return {
+            'age': pd.to_numeric(frame['age'], errors='coerce').to_numpy(dtype=float),
+            'blood_glucose': pd.to_numeric(frame['blood_glucose'], errors='coerce').to_numpy(dtype=float),
+            'risk_score': pd.to_numeric(frame['risk_score'], errors='coerce').to_numpy(dtype=float),
+            'risk_level': frame['risk_level'].fillna("Unknown").astype(str).to_numpy(),
+        }
+    return get_shared_cache().get_or_compute(ANALYTICS, ("chart_columns", time_range), compute, ttl=300)
+
+# ==================== PATIENT HISTORY ====================
+def show_patient_trends(patient_id, latest):
+    """Trend metrics and chart for a patient's recent screenings"""
+    series = get_history_store().series(patient_id)
+    series.append(latest)  # no-op if the saved row already reached the cache
+    if len(series) < 2:
+        st.caption("📉 Your trends will appear here after your next screening.")
+        return
+    
+    deltas = series.deltas()
+    cols = st.columns(4)
+    labels = [("systolic_bp", "Systolic BP", "mmHg"), ("diastolic_bp", "Diastolic BP", "mmHg"),
+              ("blood_glucose", "Blood Glucose", "mg/dL"), ("risk_score", "Risk Score", "")]
+    for col, (vital, label, unit) in zip(cols, labels):
+        with col:
+            change = deltas[vital]
+            st.metric(label, f"{change['latest']:.0f} {unit}".strip(),
+                      f"{change['since_previous']:+.1f} since last visit", delta_color="inverse")
+    
+    points = series.last(10)
+    
+    def build_trends():
+        dates = [p['timestamp'] for p in points]
+        fig = plotly_subplots.make_subplots(rows=3, cols=1, shared_xaxes=True, vertical_spacing=0.08,
+                            subplot_titles=("Blood Pressure (mmHg)", "Blood Glucose (mg/dL)", "Risk Score"))
+        fig.add_trace(go.Scatter(x=dates, y=[p['systolic_bp'] for p in points], name="Systolic", mode="lines+markers"), row=1, col=1)
+        fig.add_trace(go.Scatter(x=dates, y=[p['diastolic_bp'] for p in points], name="Diastolic", mode="lines+markers"), row=1, col=1)
+        fig.add_trace(go.Scatter(x=dates, y=[p['blood_glucose'] for p in points], name="Glucose", mode="lines+markers"), row=2, col=1)
+        fig.add_trace(go.Scatter(x=dates, y=[p['risk_score'] for p in points], name="Risk Score", mode="lines+markers"), row=3, col=1)
+        fig.update_layout(height=600, showlegend=False)
+        return fig
+    
+    show_chart("patient_trends", data_version(patient_id, points), build_trends)
+
+# ==================== PROGRAM SKETCHES ====================
+def show_program_indicators(ai_engine, time_range=None):
+    """Distinct patients and vitals quantiles merged from the sketches"""
+    store = load_sketches(ai_engine)
+    indicators = store.merged(time_range).indicators()
+    
+    def median_p95(vital, unit):
+        median, p95 = indicators[f"{vital}_median"], indicators[f"{vital}_p95"]
+        return f"{median:.0f} / {p95:.0f} {unit}" if median is not None else "N/A"
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Distinct Patients", f"~{indicators['distinct_patients']:,}")
+    with col2:
+        st.metric("Median / P95 Glucose", median_p95("blood_glucose", "mg/dL"))
+    with col3:
+        st.metric("Median / P95 Systolic", median_p95("systolic_bp", "mmHg"))
+    with col4:
+        st.metric("Median / P95 Diastolic", median_p95("diastolic_bp", "mmHg"))
+    
+    by_state = store.by_location(time_range)
+    if by_state:
+        with st.expander("Distinct patients by state"):
+            st.dataframe(pd.DataFrame(
+                [{"State": state, "Screenings": cell.screenings,
+                  "Distinct Patients (est.)": cell.patients.count()}
+                 for state, cell in sorted(by_state.items())]
+            ), use_container_width=True, hide_index=True)
+    hll_error = sketches.HyperLogLog().relative_error * 100
+    rank_error = sketches.KLLSketch().rank_error * 100
+    st.caption(f"Estimated from sketches: distinct counts ±{hll_error:.1f}% (one standard error), "
+               f"quantiles within ±{rank_error:.2f} percentile points (99% confidence).")
+
+# ==================== PREVALENCE ESTIMATES ====================
+@analytics_cache
+@st.cache_data(ttl=SUMMARY_TTL_SECONDS, show_spinner="Computing confidence intervals...")
+def prevalence_estimates(time_range, strata, outcome):
+    """Per-stratum prevalence with bootstrap (or Wilson) intervals for one outcome"""
+    def compute():
+        ai_engine = HealthBridgeAI()
+        keys = epi.STRATA[strata]
+        counts = epi.stratum_counts(ai_engine.iter_from_cloud("screening_data", epi.EPI_FIELDS, time_range=time_range),
+                                keys, epi.OUTCOMES[outcome])
+        # fixed seed keeps the displayed intervals stable between reruns
+        return epi.prevalence_table(counts, keys, seed=0, workers=os.cpu_count())
+    return get_shared_cache().get_or_compute(ANALYTICS, ("prevalence", time_range, strata, outcome), compute,
+                                             ttl=SUMMARY_TTL_SECONDS)
+
+def show_prevalence_estimates(time_range=None):
+    """Outcome and stratification pickers plus the interval table"""
+    col1, col2 = st.columns(2)
+    with col1:
+        outcome = st.selectbox("Outcome", list(epi.OUTCOMES), key="prevalence_outcome")
+    with col2:
+        strata = st.selectbox("Stratify by", list(epi.STRATA), key="prevalence_strata")
+    try:
+        records = prevalence_estimates(time_range, strata, outcome)
+    except CloudReadError as e:
+        st.error(f"Could not compute prevalence estimates: {str(e)}")
+        return
+    if not records:
+        st.info("No screenings to estimate from.")
+        return
+    labels = {"location": "State", "age_band": "Age Band"}
+    table = pd.DataFrame(records).rename(columns=labels)
+    for column in ("estimate", "lower", "upper"):
+        table[column] = (table[column] * 100).round(1)
+    table = table.rename(columns={"screened": "Screened", "cases": "Cases", "estimate": "Prevalence %",
+                                  "lower": "95% CI Lower %", "upper": "95% CI Upper %", "method": "Method"})
+    st.dataframe(table, use_container_width=True, hide_index=True)
+    st.caption(f"Percentile bootstrap ({epi.BOOTSTRAP_DRAWS:,} resamples) per stratum; Wilson score interval "
+               f"for strata under {epi.MIN_BOOTSTRAP_N} screenings or with 0% / 100% prevalence.")
+
+# ==================== DATA EXPORT ====================
+def stream_export(ai_engine, table, fmt):
+    """Page through a cloud table into a spooled export file; returns (file, row_count)
+
+    Returns ``(None, 0)`` after showing an error if a page could not be read.
+    """
+    try:
+        return export_rows(ai_engine.iter_from_cloud(table, order="id"), fmt)
+    except CloudReadError as e:
+        st.error(f"Export failed: {e}")
+        return None, 0
+
+def export_format_selector(key):
+    """Export format dropdown"""
+    return st.selectbox("Export Format", list(EXPORT_FORMATS),
+                        format_func=lambda fmt: EXPORT_FORMATS[fmt]['label'], key=key)
+
+def export_download_button(export_file, row_count, name, fmt, key=None):
+    """Download button for a finished export file
+
+    ``st.download_button`` does not accept spooled temp files, so the
+    export is handed over as bytes and the spool is closed.
+    """
+    with export_file:
+        data = export_file.read()
+    st.download_button(
+        label=f"Download {EXPORT_FORMATS[fmt]['label']} ({row_count:,} rows)",
+        data=data,
+        file_name=export_filename(name, fmt),
+        mime=EXPORT_FORMATS[fmt]['mime'],
+        key=key
+    )
+
+# ==================== PATIENT PICKER ====================
+PICKER_PAGE_SIZE = 10
+PICKER_MIN_CHARS = 2
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_patient_search(query, page):
+    """Cache one page of picker results; asks for one extra row to detect a next page"""
+    def compute():
+        ai_engine = HealthBridgeAI()
+        return ai_engine.find_patients(query, limit=PICKER_PAGE_SIZE + 1, offset=page * PICKER_PAGE_SIZE)
+    return get_shared_cache().get_or_compute(IDENTITY_TABLE, ("picker", query, page), compute, ttl=30)
+
+def patient_picker(key):
+    """Search-driven, paginated patient selector; returns the chosen patient_id or None"""
+    page_key = f"{key}_page"
+    query = st.text_input("Search Patient to Support", key=f"{key}_query",
+                          placeholder="Type a name or phone number, then press Enter").strip()
+    # text_input only reruns on Enter/blur, so each search is already debounced
+    if st.session_state.get(f"{key}_last_query") != query:
+        st.session_state[f"{key}_last_query"] = query
+        st.session_state[page_key] = 0
+    if len(query) < PICKER_MIN_CHARS:
+        st.caption(f"Enter at least {PICKER_MIN_CHARS} characters to find a patient")
+        return None
+    
+    page = st.session_state.get(page_key, 0)
+    results = cached_patient_search(query, page)
+    has_next = len(results) > PICKER_PAGE_SIZE
+    results = results[:PICKER_PAGE_SIZE]
+    if not results:
+        st.info("No matching patients")
+        return None
+    
+    options = {f"{p['name']} (ID: {p['patient_id']}) - {p.get('location') or 'Unknown'}": p['patient_id']
+               for p in results}
+    selected = st.selectbox("Select Patient to Support", list(options.keys()), key=f"{key}_select")
+    
+    nav = st.columns([1, 2, 1])
+    with nav[0]:
+        if page > 0 and st.button("◀ Previous", key=f"{key}_prev", use_container_width=True):
+            st.session_state[page_key] = page - 1
+            st.rerun()
+    with nav[1]:
+        st.caption(f"Page {page + 1}")
+    with nav[2]:
+        if has_next and st.button("Next ▶", key=f"{key}_next", use_container_width=True):
+            st.session_state[page_key] = page + 1
+            st.rerun()
+    return options[selected]
+
+# ==================== DATE RANGE ====================
+def date_range_filter():
+    """Sidebar date window shared by the dashboard and admin pages
+
+    Returns ``(start, end)`` ISO bounds for timestamp queries, or None for
+    all time. The choice lives in session state so it follows the user
+    between pages.
+    """
+    st.session_state.setdefault("date_range_preset", "All time")
+    with st.sidebar:
+        st.markdown("### 📅 Date Range")
+        preset = st.selectbox("Show screenings from", PRESETS,
+                              index=PRESETS.index(st.session_state.date_range_preset))
+        st.session_state.date_range_preset = preset
+        window = preset_window(preset)
+        if preset == "Custom":
+            today = datetime.now().date()
+            default = st.session_state.get("date_range_custom", (today - timedelta(days=29), today))
+            picked = st.date_input("Dates", value=default, max_value=today)
+            if isinstance(picked, (tuple, list)) and len(picked) == 2:
+                st.session_state.date_range_custom = tuple(picked)
+            window = st.session_state.get("date_range_custom", default)
+        if window is not None:
+            st.caption(f"{describe(window)} · {len(month_starts(window))} monthly partition(s)")
+    return bounds(window)
+
+# ==================== RECORD TABLE ====================
+def record_table(key, locations=(), risk_levels=(), time_range=None):
+    """Paged screening table: only the visible page is fetched and sent to the browser"""
+    page_key = f"{key}_page"
+    cols = st.columns([2, 1, 1, 1, 1])
+    with cols[0]:
+        search = st.text_input("Search records", key=f"{key}_search",
+                               placeholder="Name or patient ID")
+    with cols[1]:
+        location = st.selectbox("Location", ["All", *locations], key=f"{key}_location")
+    with cols[2]:
+        risk_level = st.selectbox("Risk Level", ["All", *risk_levels], key=f"{key}_risk")
+    with cols[3]:
+        sort = st.selectbox("Sort by", SORTABLE_COLUMNS, key=f"{key}_sort")
+    with cols[4]:
+        page_size = st.selectbox("Rows", PAGE_SIZES, key=f"{key}_page_size")
+    descending = st.checkbox("Descending", value=True, key=f"{key}_desc")
+    
+    view = make_view(sort, descending,
+                     None if location == "All" else location,
+                     None if risk_level == "All" else risk_level,
+                     search, time_range)
+    if st.session_state.get(f"{key}_view") != (view, page_size):
+        st.session_state[f"{key}_view"] = (view, page_size)
+        st.session_state[page_key] = 0
+    page = st.session_state.get(page_key, 0)
+    
+    try:
+        result = get_record_pages().page(view, page, page_size)
+    except Exception as e:
+        st.error(f"Could not load records: {e}")
+        return
+    if not result["rows"]:
+        st.info("No matching records")
+        return
+    
+    st.dataframe(pd.DataFrame(result["rows"], columns=RECORD_COLUMNS),
+                 use_container_width=True, hide_index=True)
+    
+    total = result["total"]
+    last_page = (total - 1) // page_size if total else None
+    has_next = len(result["rows"]) == page_size and (last_page is None or page < last_page)
+    nav = st.columns([1, 2, 1])
+    with nav[0]:
+        if page > 0 and st.button("◀ Previous", key=f"{key}_prev", use_container_width=True):
+            st.session_state[page_key] = page - 1
+            st.rerun()
+    with nav[1]:
+        of_pages = f" of ~{last_page + 1:,}" if last_page is not None else ""
+        st.caption(f"Page {page + 1:,}{of_pages} · {page_size} rows per page")
+    with nav[2]:
+        if has_next and st.button("Next ▶", key=f"{key}_next", use_container_width=True):
+            st.session_state[page_key] = page + 1
+            st.rerun()
+
+# ==================== REPORTS ====================
+def generate_dashboard_report(summary):
+    """Generate comprehensive dashboard report from precomputed summary statistics"""
+    return render_report(summary)
+
+def generate_state_reports(aggregates):
+    """Render one report per state in parallel and bundle them as a ZIP"""
+    reports = render_reports(aggregates.by_location())
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for state, report in reports.items():
+            archive.writestr(f"report_{state.replace(' ', '_')}.txt", report)
+    return buffer.getvalue()
@@ -0,0 +1,675 @@
+"""Data access shared by every page: Supabase, Paystack and in-process stores
+
+``HealthBridgeAI`` wraps the Supabase client and the Paystack API; the
+``get_*`` functions are ``st.cache_resource`` singletons (search index,
+identity registry, patient history, summaries, sketches, funding ledger,
+export jobs, record pages) that ``sync_caches`` keeps in step with writes.
+Query results and summary snapshots also go through ``get_shared_cache``,
+so several app workers share them and each other's invalidations. Writes
+and payment calls pass through the ``get_gates`` rate limiters.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+from dotenv import load_dotenv
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from healthbridge.lazy import lazy_import
+from healthbridge.admission import Gate, Throttled
+from healthbridge.tracing import tracer, traced, payload_bytes
+from healthbridge.risk import FACILITIES, kidney_risk
+from healthbridge.search import (SearchIndex, PATIENT_FIELDS, VOLUNTEER_FIELDS, PICKER_FIELDS,
+                                 patient_document, volunteer_document, document_payload,
+                                 index_record, postgrest_term)
+from healthbridge.identity import (IdentityIndex, IDENTITY_TABLE, IDENTITY_FIELDS,
+                                   deterministic_patient_id)
+from healthbridge.history import PatientHistoryStore, HISTORY_FIELDS
+from healthbridge.ledger import FundingLedger, TOTALS_TABLE, totals_from_rows
+from healthbridge.export import ExportJobs
+from healthbridge.summary import SummaryAggregates, SUMMARY_FIELDS, summarize_by
+from healthbridge.records import RecordPages, RECORD_FIELDS
+from healthbridge.shared_cache import MemoryBackend, SharedCache, STORE_ERRORS, open_cache
+from healthbridge.sessions import SessionStore
+
+# The Supabase client is imported inside init_supabase()
+requests = lazy_import("requests")
+sketches = lazy_import("healthbridge.sketches")
+risk_model = lazy_import("healthbridge.model")
+
+# ==================== ENVIRONMENT SETUP ====================
+load_dotenv()
+
+# ==================== SUPABASE DATABASE SETUP ====================
+@st.cache_resource
+def init_supabase():
+    """Initialize Supabase connection"""
+    try:
+        # Get credentials from Streamlit secrets or environment
+        supabase_url = st.secrets.get("SUPABASE_URL", os.getenv("SUPABASE_URL"))
+        supabase_key = st.secrets.get("SUPABASE_KEY", os.getenv("SUPABASE_KEY"))
+        
+        if supabase_url and supabase_key:
+            from supabase import create_client
+            supabase = create_client(supabase_url, supabase_key)
+            st.success(" Connected to cloud database ✅")
+            return supabase
+        else:
+            st.warning(" Database credentials not found. Using session storage only. ⚠")
+            return None
+    except Exception as e:  # <-- THIS LINE WAS MISSING
+        st.error(f" Database connection failed: {str(e)} ❌")
+        return None
+
+# ==================== PAYSTACK PAYMENT SETUP ====================
+class PaymentManager:
+    def __init__(self):
+        self.public_key = st.secrets.get("PAYSTACK_PUBLIC_KEY", os.getenv("PAYSTACK_PUBLIC_KEY"))
+        self.secret_key = st.secrets.get("PAYSTACK_SECRET_KEY", os.getenv("PAYSTACK_SECRET_KEY"))
+        self.base_url = "https://api.paystack.co"
+    
+    def initialize_transaction(self, email, amount, metadata=None):
+        """Initialize Paystack payment"""
+        if not self.secret_key:
+            return None
+        
+        headers = {
+            "Authorization": f"Bearer {self.secret_key}",
+            "Content-Type": "application/json"
+        }
+        
+        data = {
+            "email": email,
+            "amount": int(amount * 100),  # Convert to kobo
+            "currency": "NGN",
+            "metadata": metadata or {}
+        }
+        
+        try:
+            with admitted("paystack"), tracer.span("paystack.initialize_transaction") as span:
+                response = requests.post(
+                    f"{self.base_url}/transaction/initialize",
+                    headers=headers,
+                    json=data
+                )
+                span.update(status=response.status_code, bytes=len(response.content))
+            return response.json()
+        except Throttled:
+            st.warning("Payments are very busy right now. Please try again in a minute.")
+            return None
+        except:
+            return None
+    
+    def verify_transaction(self, reference):
+        """Verify Paystack payment"""
+        if not self.secret_key:
+            return None
+        
+        headers = {
+            "Authorization": f"Bearer {self.secret_key}"
+        }
+        
+        try:
+            with admitted("paystack"), tracer.span("paystack.verify_transaction") as span:
+                response = requests.get(
+                    f"{self.base_url}/transaction/verify/{reference}",
+                    headers=headers
+                )
+                span.update(status=response.status_code, bytes=len(response.content))
+            return response.json()
+        except:
+            return None
+
+# ==================== HEALTH BRIDGE AI ENGINE ====================
+class CloudReadError(Exception):
+    """A page of a multi-page Supabase read failed; the rows read so far are incomplete"""
+
+class HealthBridgeAI:
+    def __init__(self):
+        self.supabase = init_supabase()
+        self.payment_manager = PaymentManager()
+        self.load_facilities()
+        self.load_guidelines()
+    
+    def load_facilities(self):
+        """Load healthcare facilities database"""
+        self.facilities = FACILITIES
+    
+    def load_guidelines(self):
+        """Load medical guidelines for risk assessment"""
+        self.guidelines = {
+            'kidney': {
+                'eGFR_stages': {'G1': '≥90', 'G2': '60-89', 'G3a': '45-59',
+                              'G3b': '30-44', 'G4': '15-29', 'G5': '<15'},
+                'ACR_categories': {'A1': '<30', 'A2': '30-300', 'A3': '>300'},
+                'risk_factors': ['Hypertension', 'Diabetes', 'Family History',
+                               'Age >60', 'Obesity', 'Smoking']
+            },
+            'liver': {
+                'ALT_normal': '7-56 U/L',
+                'AST_normal': '10-40 U/L',
+                'risk_factors': ['Alcohol', 'Hepatitis B/C', 'Obesity',
+                               'Diabetes', 'Herbal Medicine Use']
+            }
+        }
+    
+    @traced("risk.calculate_kidney_risk")
+    def calculate_kidney_risk(self, data):
+        """Kidney disease risk: the fitted model if one is deployed, else the KDIGO-based rule score"""
+        model = get_risk_model()
+        if model is None:
+            return kidney_risk(data)
+        return model.assess(data)
+    
+    def save_to_cloud(self, table, data, on_conflict=None):
+        """Save data to Supabase
+
+        With ``on_conflict`` (unique columns, e.g. ``"client_id,timestamp"``)
+        a row that already exists is left alone and None is returned.
+        """
+        if self.supabase:
+            try:
+                # Convert data to dictionary if needed
+                if not isinstance(data, dict):
+                    data = dict(data)
+                
+                # Remove None values
+                clean_data = {k: v for k, v in data.items() if v is not None}
+                
+                # Insert into database
+                with admitted("supabase"), tracer.span("supabase.insert", table=table, rows=1,
+                                                       bytes=payload_bytes(clean_data)):
+                    request = self.supabase.table(table)
+                    if on_conflict:
+                        request = request.upsert(clean_data, on_conflict=on_conflict, ignore_duplicates=True)
+                    else:
+                        request = request.insert(clean_data)
+                    response = request.execute()
+                saved = response.data[0] if response.data else None
+                if saved:
+                    sync_caches(table, saved)
+                return saved
+            except Throttled:
+                st.warning("The database is very busy right now. Please try again in a minute.")
+                return None
+            except Exception as e:
+                st.error(f"Database error: {str(e)}")
+                return None
+        return None
+    
+    def get_from_cloud(self, table, query="*"):
+        """Retrieve data from Supabase"""
+        if self.supabase:
+            try:
+                with tracer.span("supabase.select", table=table) as span:
+                    response = self.supabase.table(table).select(query).execute()
+                    span.update(rows=len(response.data or []), bytes=payload_bytes(response.data))
+                return response.data
+            except:
+                return []
+        return []
+    
+    def iter_from_cloud(self, table, query="*", page_size=1000, order=None, time_range=None):
+        """Yield rows from Supabase page by page (PostgREST caps a single select)
+
+        ``time_range`` is an optional ``(start, end)`` pair of ISO strings
+        applied as ``timestamp >= start and timestamp < end``. A failed page
+        raises ``CloudReadError`` rather than ending the iteration early, so
+        exports and aggregates are never silently truncated.
+        """
+        if not self.supabase:
+            return
+        start = 0
+        while True:
+            try:
+                request = self.supabase.table(table).select(query)
+                if time_range:
+                    request = request.gte("timestamp", time_range[0]).lt("timestamp", time_range[1])
+                if order:
+                    request = request.order(order)
+                with tracer.span("supabase.select_page", table=table) as span:
+                    response = request.range(start, start + page_size - 1).execute()
+                    span.update(rows=len(response.data or []))
+            except Exception as e:
+                raise CloudReadError(f"Reading {table} failed after {start:,} rows: {e}") from e
+            rows = response.data or []
+            yield from rows
+            if len(rows) < page_size:
+                return
+            start += page_size
+    
+    def find_patients(self, query, limit=10, offset=0):
+        """Indexed patient lookup returning only the fields the picker needs"""
+        index = get_search_index()
+        if index.loaded or not self.supabase:
+            return [{k: m.get(k) for k in ('patient_id', 'name', 'location')}
+                    for m in index.search(query, kind='patient', limit=limit, offset=offset)]
+        term = postgrest_term(query)
+        if not term:
+            return []
+        try:
+            # One row per patient; name/phone ILIKE is served by the pg_trgm GIN indexes
+            response = (self.supabase.table(IDENTITY_TABLE)
+                        .select(PICKER_FIELDS)
+                        .or_(f"name.ilike.*{term}*,phone.ilike.*{term}*")
+                        .order("last_seen", desc=True)
+                        .range(offset, offset + limit - 1)
+                        .execute())
+            return response.data or []
+        except Exception:
+            return []
+    
+    def search_cloud(self, query, kind=None, limit=10, offset=0):
+        """People search with PostgREST ILIKE, used while the in-memory index is loading
+
+        Returns the same dicts as ``SearchIndex.search``; patients come
+        before volunteers and every match gets a score of 1.0.
+        """
+        term = postgrest_term(query)
+        if not self.supabase or not term:
+            return []
+        sources = [("patient", IDENTITY_TABLE, PATIENT_FIELDS, "name", patient_document),
+                   ("volunteer", "volunteers", VOLUNTEER_FIELDS, "full_name", volunteer_document)]
+        matches = []
+        for source_kind, table, fields, name_column, to_document in sources:
+            if kind is not None and kind != source_kind:
+                continue
+            filters = f"{name_column}.ilike.*{term}*,phone.ilike.*{term}*"
+            if source_kind == "volunteer":
+                filters += f",email.ilike.*{term}*"
+            try:
+                response = (self.supabase.table(table)
+                            .select(fields)
+                            .or_(filters)
+                            .range(0, offset + limit - 1)
+                            .execute())
+            except Exception:
+                continue
+            for row in response.data or []:
+                doc_kind, doc_id, name, _, _, payload = to_document(row)
+                matches.append(dict(document_payload(doc_kind, doc_id, name, payload), score=1.0))
+        return matches[offset:offset + limit]
+    
+    def get_records_page(self, view, offset, limit):
+        """One page of screening records with sort and filters pushed down to Postgres
+
+        Returns ``(rows, total)``; ``total`` is PostgREST's estimated count,
+        exact for small tables and planner-based for very large ones.
+        """
+        if not self.supabase:
+            return [], 0
+        sort, descending, location, risk_level, search, time_range = view
+        request = self.supabase.table("screening_data").select(RECORD_FIELDS, count="estimated")
+        if time_range:
+            # Only the monthly partitions overlapping the window are scanned
+            request = request.gte("timestamp", time_range[0]).lt("timestamp", time_range[1])
+        if location:
+            request = request.eq("location", location)
+        if risk_level:
+            request = request.eq("risk_level", risk_level)
+        term = postgrest_term(search)
+        if term:
+            request = request.or_(f"name.ilike.*{term}*,patient_id.ilike.*{term}*")
+        # id breaks ties so rows never repeat or vanish between pages
+        response = (request.order(sort, desc=descending)
+                    .order("id", desc=descending)
+                    .range(offset, offset + limit - 1)
+                    .execute())
+        return response.data or [], response.count
+    
+    def get_patient_history(self, patient_id, limit=20):
+        """Last screenings for one patient (single query on the (patient_id, timestamp) index)"""
+        if self.supabase:
+            try:
+                response = (self.supabase.table("screening_data")
+                            .select(HISTORY_FIELDS)
+                            .eq("patient_id", patient_id)
+                            .order("timestamp", desc=True)
+                            .limit(limit)
+                            .execute())
+                return response.data
+            except Exception:
+                return []
+        return []
+    
+    def get_funding_totals(self):
+        """Running donation totals from the funding ledger (no scan of payments)"""
+        if self.supabase:
+            return totals_from_rows(self.get_from_cloud(TOTALS_TABLE))
+        return get_funding_ledger().snapshot()
+    
+    def confirm_payment(self, reference):
+        """Verify a Paystack payment and apply it to the funding ledger exactly once"""
+        result = self.payment_manager.verify_transaction(reference)
+        if not result or not result.get('status') or result['data'].get('status') != 'success':
+            return False
+        data = result['data']
+        amount = data['amount'] / 100  # Paystack reports kobo
+        request_id = (data.get('metadata') or {}).get('funding_request_id')
+        get_funding_ledger().apply(reference, amount, request_id, data.get('paid_at'))
+        if self.supabase:
+            try:
+                self.supabase.table("payments").update({"status": "success"}).eq("reference", reference).execute()
+                # apply_payment() is idempotent per reference and runs in one transaction
+                self.supabase.rpc("apply_payment", {
+                    "p_reference": reference,
+                    "p_amount": amount,
+                    "p_request_id": str(request_id) if request_id is not None else None,
+                    "p_paid_at": data.get('paid_at')
+                }).execute()
+            except Exception as e:
+                st.error(f"Database error: {str(e)}")
+                return False
+        return True
+    
+    def rebuild_funding_ledger(self):
+        """Recompute all running totals from the raw payments table
+
+        Offline there is no payments table; the in-process ledger recomputes
+        its totals from the payments it has applied.
+        """
+        if self.supabase:
+            self.supabase.rpc("rebuild_funding_ledger", {}).execute()
+        else:
+            get_funding_ledger().recompute()
+    
+    def generate_patient_id(self, name, phone):
+        """Generate stable patient ID from the normalised name and phone"""
+        return deterministic_patient_id(name, phone)
+    
+    def link_patient(self, data):
+        """Link a screening to its patient, registering a new identity if needed
+
+        If the identity registry cannot be read, the screening keeps the
+        deterministic ID of its name and phone so it is still saved.
+        """
+        try:
+            index = get_identity_index()
+        except CloudReadError as e:
+            st.warning(f"Patient registry unavailable, using the name/phone patient ID: {str(e)}")
+            return self.generate_patient_id(data.get('name'), data.get('phone'))
+        patient_id, identity, is_new = index.link(data)
+        if self.supabase:
+            try:
+                with admitted("supabase"):
+                    self.supabase.table(IDENTITY_TABLE).upsert(identity).execute()
+                if is_new:
+                    get_shared_cache().invalidate(IDENTITY_TABLE)
+            except Exception as e:
+                st.error(f"Database error: {str(e)}")
+        return patient_id
+
+    def find_queued_screening(self, client_id, timestamp):
+        """The saved screening of an offline-queue submission, or None (also when offline)"""
+        if not self.supabase:
+            return None
+        try:
+            response = (self.supabase.table("screening_data")
+                        .select("id, patient_id, risk_score, risk_level")
+                        .eq("client_id", client_id)
+                        .eq("timestamp", timestamp)
+                        .limit(1)
+                        .execute())
+        except Exception:
+            return None
+        return response.data[0] if response.data else None
+    
+    def record_screening(self, screening_data, client_id=None):
+        """Score, link and save one screening; returns (risk assessment, patient id, saved row)
+
+        ``client_id`` marks an offline-queue submission; it is saved with the
+        row, and a submission already saved under the same id and timestamp
+        is not inserted again (the saved row is then None).
+        """
+        risk_assessment = self.calculate_kidney_risk(screening_data)
+        patient_id = self.link_patient(screening_data)
+        cloud_data = {
+            **screening_data,
+            'patient_id': patient_id,
+            'risk_score': risk_assessment['score'],
+            'risk_level': risk_assessment['risk_level'],
+            'recommendation': risk_assessment['recommendation'],
+            'bmi': risk_assessment.get('bmi'),
+            'risk_factors': ', '.join(risk_assessment['risk_factors']),
+            'client_id': client_id
+        }
+        on_conflict = "client_id,timestamp" if client_id else None
+        return risk_assessment, patient_id, self.save_to_cloud("screening_data", cloud_data, on_conflict)
+
+# ==================== ADMISSION CONTROL ====================
+# Per worker: global and per-session token buckets (calls/s, burst), concurrent calls, seconds queued at most
+ADMISSION_LIMITS = {
+    "supabase": {"rate": 20, "burst": 40, "client_rate": 1, "client_burst": 5,
+                 "max_concurrent": 8, "max_wait": 60},
+    "paystack": {"rate": 5, "burst": 10, "client_rate": 0.2, "client_burst": 3,
+                 "max_concurrent": 4, "max_wait": 30},
+}
+
+@st.cache_resource
+def get_gates():
+    """Admission gates in front of Supabase writes and Paystack calls"""
+    return {name: Gate(name, **limits) for name, limits in ADMISSION_LIMITS.items()}
+
+@contextmanager
+def admitted(name):
+    """Hold a slot of gate ``name`` for this session, showing queue progress while waiting
+
+    Raises ``Throttled`` if the gate stays full for its ``max_wait``.
+    """
+    ctx = get_script_run_ctx()
+    gate = get_gates()[name]
+    placeholder = None
+    
+    def show_progress(position, waited, eta):
+        nonlocal placeholder
+        if placeholder is None:
+            placeholder = st.empty()
+        placeholder.progress(min(waited / (waited + eta), 1.0),
+                             text=f"⏳ Many submissions right now: you are number {position} in line, "
+                                  f"about {eta:.0f}s to go. Please keep this page open.")
+    
+    try:
+        # Calls from server threads (the offline queue) only count against the global limits
+        admitted_at = gate.acquire(ctx.session_id if ctx else None, show_progress if ctx else None)
+    finally:
+        if placeholder is not None:
+            placeholder.empty()
+    try:
+        yield
+    finally:
+        gate.release(admitted_at)
+
+# ==================== RISK MODEL ====================
+@st.cache_resource
+def get_risk_model():
+    """Fitted risk model artifact (``healthbridge.model``), loaded once per process; None uses the rule score"""
+    try:
+        return risk_model.load_model()
+    except (OSError, ValueError) as e:
+        st.warning(f"Risk model not loaded, using the rule score: {str(e)}")
+        return None
+
+# ==================== SHARED CACHE ====================
+ANALYTICS = "analytics"
+ANALYTICS_CACHES = []
+
+def analytics_cache(func):
+    """Register an ``st.cache_data`` function of ``ANALYTICS`` data, cleared by ``drop_analytics``"""
+    ANALYTICS_CACHES.append(func)
+    return func
+
+@st.cache_resource
+def get_shared_cache():
+    """Cache shared by all app workers (``HEALTHBRIDGE_CACHE_URL``); this process only if unset
+
+    Namespaces are cloud table names, invalidated by ``sync_caches`` on every
+    write, plus ``ANALYTICS`` for dashboard aggregates, which expire by TTL
+    (they are too costly to rebuild per screening) or ``refresh_analytics``.
+    """
+    try:
+        cache = open_cache()
+    except (ValueError, *STORE_ERRORS) as e:
+        st.warning(f"Shared cache unavailable, caching in this worker only: {str(e)}")
+        cache = SharedCache(MemoryBackend())
+    # Drop in-process copies when another worker invalidates
+    cache.watch("screening_data", lambda: get_record_pages().invalidate())
+    cache.watch(ANALYTICS, drop_analytics)
+    return cache
+
+def drop_analytics():
+    """Forget this worker's analytics so the next view reads the shared snapshot"""
+    for func in ANALYTICS_CACHES:
+        func.clear()
+    get_summary_aggregates.clear()
+
+def refresh_analytics():
+    """Rebuild dashboard aggregates on every worker at their next view, and this worker's sketches"""
+    get_shared_cache().invalidate(ANALYTICS)
+    drop_analytics()
+    get_sketch_store.clear()
+
+# ==================== SESSION STATE ====================
+@st.cache_resource
+def get_session_store():
+    """Bounded app state of every browser session served by this process"""
+    return SessionStore()
+
+def current_session():
+    """This browser session's ``SessionState``, marked as seen"""
+    ctx = get_script_run_ctx()
+    return get_session_store().session(ctx.session_id if ctx else None)
+
+# ==================== PEOPLE SEARCH ====================
+@st.cache_resource
+def get_search_index():
+    """Shared in-memory index for volunteer and patient search"""
+    return SearchIndex()
+
+def search_people(ai_engine, query, kind=None, limit=10, offset=0):
+    """Type-ahead search over volunteers and patients
+
+    The first search starts building the index in the background; until it
+    is ready, queries go to PostgREST instead of waiting for the build.
+    """
+    index = get_search_index()
+    if not index.loaded and ai_engine.supabase:
+        index.load_in_background(lambda: [patient_document(r) for r in
+                                          ai_engine.iter_from_cloud(IDENTITY_TABLE, PATIENT_FIELDS)]
+                                         + [volunteer_document(r) for r in
+                                            ai_engine.iter_from_cloud("volunteers", VOLUNTEER_FIELDS)])
+        return ai_engine.search_cloud(query, kind=kind, limit=limit, offset=offset)
+    return index.search(query, kind=kind, limit=limit, offset=offset)
+
+# ==================== PATIENT IDENTITY ====================
+@st.cache_resource
+def get_identity_index():
+    """Shared identity registry, loaded once per process from patient_identities"""
+    return IdentityIndex(HealthBridgeAI().iter_from_cloud(IDENTITY_TABLE, ", ".join(IDENTITY_FIELDS)))
+
+# ==================== PATIENT HISTORY ====================
+@st.cache_resource
+def get_history_store():
+    """Shared LRU of per-patient vitals series"""
+    return PatientHistoryStore(lambda patient_id, limit: HealthBridgeAI().get_patient_history(patient_id, limit))
+
+def sync_caches(table, record):
+    """Apply a freshly written row to the in-process indexes and the shared cache"""
+    get_shared_cache().invalidate(table)
+    index_record(get_search_index(), table, record)
+    if table == "screening_data":
+        get_history_store().record(record)
+        get_summary_aggregates().add(record)
+        get_sketch_store().add(record)
+        get_record_pages().invalidate()
+
+# ==================== SUMMARY AGGREGATES ====================
+SUMMARY_TTL_SECONDS = 300
+
+@st.cache_resource
+def get_summary_aggregates():
+    """Per-location screening summaries shared by dashboards and reports"""
+    return SummaryAggregates()
+
+@analytics_cache
+@st.cache_data(ttl=60, show_spinner=False)
+def summarize_window(time_range):
+    """Per-location summaries of one date window, read with a pushed-down timestamp filter"""
+    def compute():
+        ai_engine = HealthBridgeAI()
+        return summarize_by(ai_engine.iter_from_cloud("screening_data", SUMMARY_FIELDS, time_range=time_range))
+    return get_shared_cache().get_or_compute(ANALYTICS, ("summary_window", time_range), compute, ttl=60)
+
+def load_summary(ai_engine, time_range=None):
+    """Current aggregates, built in one pass on first use and refreshed after the TTL
+
+    Screenings saved by this process are added incrementally; the TTL picks
+    up rows written by other workers. The snapshot is shared, so one worker
+    reads the table per TTL. With a ``time_range`` only that window is read
+    and summarised (cached briefly per window). If the table cannot be read
+    a warning is shown and the aggregates stay unloaded (retried next view).
+    """
+    if time_range:
+        windowed = SummaryAggregates()
+        try:
+            windowed.load(summarize_window(time_range))
+        except CloudReadError as e:
+            st.warning(f"Screening summary unavailable: {str(e)}")
+        return windowed
+    aggregates = get_summary_aggregates()
+    if aggregates.loaded and time.time() - aggregates.built_at > SUMMARY_TTL_SECONDS:
+        get_summary_aggregates.clear()
+        aggregates = get_summary_aggregates()
+    if not aggregates.loaded:
+        def snapshot():
+            return time.time(), summarize_by(ai_engine.iter_from_cloud("screening_data", SUMMARY_FIELDS))
+        try:
+            built_at, by_location = get_shared_cache().get_or_compute(ANALYTICS, "summary", snapshot,
+                                                                      ttl=SUMMARY_TTL_SECONDS)
+        except CloudReadError as e:
+            st.warning(f"Screening summary unavailable: {str(e)}")
+            return aggregates
+        aggregates.load(by_location, built_at)
+    return aggregates
+
+# ==================== PROGRAM SKETCHES ====================
+@st.cache_resource
+def get_sketch_store():
+    """Per-day, per-location distinct-patient and vitals-quantile sketches"""
+    return sketches.SketchStore()
+
+def load_sketches(ai_engine):
+    """Sketch store, built in one pass on first use and refreshed after the summary TTL
+
+    If the table cannot be read a warning is shown and the store stays
+    unloaded (retried next view).
+    """
+    store = get_sketch_store()
+    if store.loaded and time.time() - store.built_at > SUMMARY_TTL_SECONDS:
+        get_sketch_store.clear()
+        store = get_sketch_store()
+    if not store.loaded:
+        try:
+            store.load(ai_engine.iter_from_cloud("screening_data", sketches.SKETCH_FIELDS))
+        except CloudReadError as e:
+            st.warning(f"Program indicators unavailable: {str(e)}")
+    return store
+
+# ==================== FUNDING LEDGER ====================
+@st.cache_resource
+def get_funding_ledger():
+    """In-process funding ledger used when the cloud ledger is unavailable"""
+    return FundingLedger()
+
+# ==================== DATA EXPORT ====================
+@st.cache_resource
+def get_export_jobs():
+    """Background export runner shared by admin sessions"""
+    return ExportJobs()
+
+# ==================== RECORD TABLE ====================
+@st.cache_resource
+def get_record_pages():
+    """Shared page cache and prefetcher for the screening records table"""
+    ai_engine = HealthBridgeAI()
+    return RecordPages(ai_engine.get_records_page)
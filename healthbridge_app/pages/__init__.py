@@ -0,0 +1 @@
+"""One module per page; loaded on demand by ``healthbridge_app.registry``"""
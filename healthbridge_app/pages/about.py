@@ -0,0 +1,145 @@
+"""About page: programme background, partners and contacts"""
+import streamlit as st
+
+from healthbridge.tracing import traced
+from healthbridge_app.components import styled
+
+@traced("page.show_about_page")
+def show_about_page():
+    """About page with organization information"""
+    st.title("📚 About Health Bridge Initiative")
+    tabs = st.tabs(["🏢 Our Story", "👥 Our Team", "🤝 Partners", "📞 Contact"])
+    
+    with tabs[0]:
+        st.markdown("""
+        ## Our Mission
+        To eradicate preventable deaths from chronic kidney and liver disease in Nigeria by building a
+        **community-driven early detection system** that bridges the gap between risk identification and
+        affordable, accessible care.
+        
+        ## Our Vision
+        A Nigeria where no one dies from preventable chronic diseases because of late diagnosis or lack of access to care.
+        
+        ## Our Story
+        Founded in 2025, Health Bridge Initiative was born out of a simple observation:
+        **too many Nigerians were dying from diseases that could have been managed if detected early.**
+        
+        Our founder, MR ALABI RIDWAN OPEYEMI, witnessed firsthand the devastating impact of late-stage kidney disease diagnosis in his community. What started as a small community screening program in Lagos has grown into a nationwide movement.
+        
+        ## What Makes Us Different
+        1. **Community-First Approach**: We meet people where they are, in their communities
+        2. **Technology-Enabled**: AI-powered risk assessment and mobile app
+        3. **Sustainable Model**: Integrated funding system with minimal fees
+        4. **Data-Driven**: Continuous improvement based on real data
+        5. **Local Solutions**: Designed specifically for Nigerian contexts
+        
+        ## Our Values
+        - **Compassion**: Every life matters
+        - **Innovation**: Finding better ways to serve
+        - **Integrity**: Transparent in all we do
+        - **Collaboration**: Working together for impact
+        - **Excellence**: Striving for the highest standards
+        """)
+    
+    with tabs[1]:
+        st.subheader("Leadership Team")
+        team_members = [
+            {"name": "Mr ALABI RIDWAN OPEYEMI", "role": "Founder & CEO",
+             "bio": "BIOMEDICAL EPIDEMIOLGIST  with 5+ years experience in public health"},
+            {"name": "IBRAHEEM RUQOYA", "role": "Chief Medical Partner ",
+             "bio": "Nephrological Nurse  specializing in community health"},
+            {"name": "SALAAM RAHEEM OLATUNJI", "role": "CTO",
+             "bio": "Technology entrepreneur focused on health tech and User Experience and Interface"},
+            {"name": "MR ISSA NAFIU", "role": "CFO",
+             "bio": "AUDITOR,LAGOS STATE MINISTRY OF FINANCE"}
+        ]
+        
+        for member in team_members:
+            with st.expander(f"{member['name']} - {member['role']}"):
+                st.write(member['bio'])
+        
+        st.markdown("---")
+        st.subheader("Board of Advisors")
+        advisors = [
+            "DR. OYELEYE HASSAN - Lagos University Teaching Hospital",
+            "Dr. ABUBAKR ASHIRU - Federal Ministry of Health",
+            "DR. OYEYEMI OGUNJOBI - LAGOS STATE MINISTRY OF HEALTH(SWAp DESK )",
+            "Mrs. Bola Adekunle - Nigerian Health Foundation"
+        ]
+        
+        for advisor in advisors:
+            st.write(f"• {advisor}")
+    
+    with tabs[2]:
+        st.subheader("Our Partners")
+        partners = [
+            {"name": "Lagos State Ministry of Health", "type": "Government"},
+            {"name": "Nigerian Medical Association", "type": "Professional Body"},
+            {"name": "Paystack", "type": "Technology Partner"},
+            {"name": "Supabase", "type": "Database Partner"},
+            {"name": "Google for Nonprofits", "type": "Technology Partner"},
+            {"name": "Rotary Club Nigeria", "type": "Community Partner"}
+        ]
+        
+        col1, col2 = st.columns(2)
+        for i, partner in enumerate(partners):
+            with col1 if i % 2 == 0 else col2:
+                styled(f"""
+                <div style='padding: 15px; border: 1px solid #ddd; border-radius: 10px; margin: 10px 0;'>
+                    <strong>{partner['name']}</strong><br>
+                    <small>{partner['type']}</small>
+                </div>
+                """, plain=f"**{partner['name']}** · {partner['type']}")
+        
+        st.markdown("---")
+        st.subheader("Become a Partner")
+        st.write("We're always looking for organizations to join our mission.")
+        if st.button("Partner With Us"):
+            st.info("Email us at partners@healthbridge.ng")
+    
+    with tabs[3]:
+        st.subheader("Contact Information")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("""
+            ### Headquarters
+            **Address:**
+            Health Bridge Initiative
+           27, MAGBON BADAGRY
+            LAGOS, Nigeria
+            
+            **Phone:**
+            +234 817 937 1170
+            
+            **Email:**
+            info@healthbridge.ng
+            
+            **Emergency Hotline:**
+            112 or 767
+            """)
+        with col2:
+            st.markdown("""
+            ### Regional Offices
+            **Lagos Office**
+           
+            
+            **Kano Office**
+           
+            
+            **Abuja Office**
+         
+            
+            **Port Harcourt Office**
+            
+            """)
+        
+        st.markdown("---")
+        st.subheader("Send us a Message")
+        with st.form("contact_form"):
+            name = st.text_input("Your Name")
+            email = st.text_input("Your Email")
+            subject = st.selectbox("Subject",
+                                 ["General Inquiry", "Partnership", "Volunteering", "Technical Support", "Media"])
+            message = st.text_area("Message", height=150)
+            if st.form_submit_button("Send Message"):
+                st.success("Message sent! We'll respond within 48 hours.")
@@ -0,0 +1,357 @@
+"""Admin panel: overview, people search, analytics, exports and performance"""
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from healthbridge.lazy import lazy_import
+from healthbridge.tracing import traced
+from healthbridge.export import FORMATS as EXPORT_FORMATS
+from healthbridge.figures import data_version
+from healthbridge.records import make_view
+from healthbridge.search import index_record
+from healthbridge_app.components import (date_range_filter, export_download_button,
+                                         export_format_selector, load_chart_columns,
+                                         show_admission_panel, show_chart, show_performance_panel,
+                                         show_session_panel, stream_export)
+from healthbridge_app.engine import (HealthBridgeAI, CloudReadError, get_export_jobs, get_search_index,
+                                     load_summary, refresh_analytics, search_people)
+
+pd = lazy_import("pandas")
+px = lazy_import("plotly.express")
+charts = lazy_import("healthbridge.charts")
+
+@traced("page.show_admin_panel")
+def show_admin_panel():
+    """Admin panel for data management and system control"""
+    # Password protection
+    if 'admin_authenticated' not in st.session_state:
+        st.session_state.admin_authenticated = False
+    
+    if not st.session_state.admin_authenticated:
+        st.title("🔐 Admin Login")
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            with st.form("admin_login"):
+                username = st.text_input("Username")
+                password = st.text_input("Password", type="password")
+                if st.form_submit_button("Login"):
+                    # Check credentials (in production, use secure authentication)
+                    admin_user = st.secrets.get("ADMIN_USERNAME", "admin")
+                    admin_pass = st.secrets.get("ADMIN_PASSWORD", "HealthBridge2024!")
+                    if username == admin_user and password == admin_pass:
+                        st.session_state.admin_authenticated = True
+                        st.rerun()
+                    else:
+                        st.error("Invalid credentials")
+        st.markdown("---")
+        st.info("For emergency access, contact system administrator.")
+        return
+    
+    ai_engine = HealthBridgeAI()
+    st.title("🔧 Admin Control Panel")
+    time_range = date_range_filter()
+    
+    # Logout button
+    if st.button("🚪 Logout", type="secondary"):
+        st.session_state.admin_authenticated = False
+        st.rerun()
+    
+    # Admin tabs
+    tab_names = ["📊 System Overview", "👥 User Management", "💾 Data Management", "⚙ System Settings", "📈 Analytics", "🔐 Security"]
+    # Hidden unless the admin URL carries ?perf=1
+    show_performance = st.query_params.get("perf") == "1"
+    if show_performance:
+        tab_names.append("⏱ Performance")
+    tabs = st.tabs(tab_names)
+    
+    with tabs[0]:
+        st.subheader("System Status")
+        # Screening counts come from the summaries; no per-row timestamp parsing
+        summary = load_summary(ai_engine, time_range).overall()
+        today_summary = load_summary(ai_engine).overall()
+        volunteers = ai_engine.get_from_cloud("volunteers")
+        funding_totals = ai_engine.get_funding_totals()
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Total Screenings", summary.total)
+        with col2:
+            active_volunteers = len([v for v in volunteers if v.get('status') == 'active']) if volunteers else 0
+            st.metric("Active Volunteers", active_volunteers)
+        with col3:
+            st.metric("Total Donations", f"₦{funding_totals['amount_raised']:,.0f}")
+        with col4:
+            today = datetime.now().date().isoformat()
+            st.metric("Today's Screenings", today_summary.daily.get(today, 0))
+        
+        # System health
+        st.subheader("System Health")
+        health_items = [
+            {"component": "Database", "status": "✅ Online" if ai_engine.supabase else "❌ Offline"},
+            {"component": "Payment Gateway", "status": "✅ Online" if ai_engine.payment_manager.secret_key else "❌ Offline"},
+            {"component": "Storage", "status": "🟢 Healthy"},
+            {"component": "API Services", "status": "✅ Online"}
+        ]
+        
+        for item in health_items:
+            col1, col2 = st.columns([1, 3])
+            with col1:
+                st.write(item['component'])
+            with col2:
+                st.write(item['status'])
+        
+        st.subheader("Sessions")
+        show_session_panel()
+        
+        st.subheader("Rate Limits")
+        show_admission_panel()
+        
+        # Recent activity
+        st.subheader("Recent Activity")
+        try:
+            recent, _ = ai_engine.get_records_page(make_view(time_range=time_range), 0, 5)
+        except Exception:
+            recent = []
+        if recent:
+            for item in recent:
+                st.write(f"**{item.get('name', 'Unknown')}** - {item.get('location', 'Unknown')} - {item.get('risk_level', 'Unknown')}")
+    
+    with tabs[1]:
+        st.subheader("User Management")
+        volunteers = ai_engine.get_from_cloud("volunteers")
+        
+        # People search
+        people_query = st.text_input("🔎 Search volunteers and patients",
+                                     placeholder="Name, phone number or email")
+        matched_volunteer_ids = None
+        if people_query:
+            matches = search_people(ai_engine, people_query, limit=25)
+            matched_volunteer_ids = {m['id'] for m in matches if m['kind'] == 'volunteer'}
+            patient_matches = [m for m in matches if m['kind'] == 'patient']
+            if patient_matches:
+                st.write("**Matching patients**")
+                st.dataframe(
+                    pd.DataFrame(patient_matches)[['patient_id', 'name', 'location', 'last_seen']],
+                    use_container_width=True,
+                    hide_index=True
+                )
+            if not matches:
+                st.info("No matching volunteers or patients")
+        
+        if volunteers:
+            # Filter options
+            col1, col2 = st.columns(2)
+            with col1:
+                status_filter = st.multiselect("Filter by Status", 
+                                             ["pending", "approved", "active", "inactive", "rejected"])
+            with col2:
+                location_filter = st.multiselect("Filter by Location",
+                                               list(set([v.get('location', 'Unknown') for v in volunteers])))
+            
+            # Apply filters
+            filtered_volunteers = volunteers
+            if status_filter:
+                filtered_volunteers = [v for v in filtered_volunteers if v.get('status') in status_filter]
+            if location_filter:
+                filtered_volunteers = [v for v in filtered_volunteers if v.get('location') in location_filter]
+            if matched_volunteer_ids is not None:
+                filtered_volunteers = [v for v in filtered_volunteers
+                                       if (v.get('id') or v.get('email')) in matched_volunteer_ids]
+            
+            # Display table
+            for volunteer in filtered_volunteers:
+                with st.expander(f"{volunteer['full_name']} - {volunteer['status']}"):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.write(f"**Email:** {volunteer.get('email')}")
+                        st.write(f"**Phone:** {volunteer.get('phone')}")
+                        st.write(f"**Location:** {volunteer.get('location')}")
+                        st.write(f"**Skills:** {volunteer.get('skills', 'None')}")
+                    with col2:
+                        st.write(f"**Applied:** {volunteer.get('applied_date', 'Unknown')[:10]}")
+                        st.write(f"**Experience:** {volunteer.get('experience_years', 0)} years")
+                        st.write(f"**Availability:** {volunteer.get('availability')}")
+                    
+                    # Status update
+                    new_status = st.selectbox("Update Status",
+                                            ["pending", "approved", "active", "inactive", "rejected"],
+                                            index=["pending", "approved", "active", "inactive", "rejected"]
+                                            .index(volunteer.get('status', 'pending')),
+                                            key=f"status_{volunteer.get('id')}")
+                    
+                    if st.button("Update", key=f"update_{volunteer.get('id')}"):
+                        # Update in database
+                        try:
+                            ai_engine.supabase.table("volunteers").update(
+                                {"status": new_status}
+                            ).eq("id", volunteer['id']).execute()
+                            index_record(get_search_index(), "volunteers", {**volunteer, "status": new_status})
+                            st.success("Status updated!")
+                            st.rerun()
+                        except:
+                            st.error("Update failed")
+        else:
+            st.info("No volunteer data")
+    
+    with tabs[2]:
+        st.subheader("Data Management")
+        # Export all data
+        st.write("### Export Data")
+        export_format = export_format_selector("admin_export_format")
+        run_in_background = st.checkbox("Run as background job (recommended for large tables)")
+        export_cols = st.columns(3)
+        export_tables = [
+            ("📥 Export Screenings", "screening_data", "screenings_export"),
+            ("📥 Export Volunteers", "volunteers", "volunteers_export"),
+            ("📥 Export Payments", "payments", "payments_export")
+        ]
+        for col, (label, table, name) in zip(export_cols, export_tables):
+            with col:
+                if st.button(label, use_container_width=True):
+                    if run_in_background:
+                        get_export_jobs().submit(
+                            name, export_format,
+                            lambda table=table: ai_engine.iter_from_cloud(table, order="id")
+                        )
+                        st.info("Export queued. It will appear under Export Jobs below.")
+                    else:
+                        export_file, row_count = stream_export(ai_engine, table, export_format)
+                        if export_file is not None:
+                            export_download_button(export_file, row_count, name, export_format)
+        
+        export_jobs = get_export_jobs().jobs()
+        if export_jobs:
+            st.write("### Export Jobs")
+            if st.button("🔄 Refresh Jobs"):
+                st.rerun()
+            for job in export_jobs[:10]:
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    st.write(f"**{job['filename']}** - {job['status']} - {job['rows']:,} rows")
+                    if job['error']:
+                        st.error(job['error'])
+                with col2:
+                    # Only the artifact the admin asked for is read into the page
+                    if job['status'] == 'done':
+                        if st.session_state.get('export_job_ready') == job['id']:
+                            with get_export_jobs().open(job['id']) as artifact:
+                                st.download_button("Download", data=artifact, file_name=job['filename'],
+                                                   mime=EXPORT_FORMATS[job['format']]['mime'],
+                                                   key=f"export_job_{job['id']}")
+                        elif st.button("Prepare download", key=f"prepare_export_{job['id']}"):
+                            st.session_state.export_job_ready = job['id']
+                            st.rerun()
+        
+        # Funding ledger maintenance
+        st.markdown("---")
+        st.subheader("Funding Ledger")
+        st.caption("Running totals are updated as payments are confirmed. Rebuild them from the payments table if they ever drift.")
+        if st.button("🔄 Rebuild Funding Totals", use_container_width=True):
+            try:
+                ai_engine.rebuild_funding_ledger()
+                st.success("Funding totals rebuilt from payments")
+            except Exception as e:
+                st.error(f"Rebuild failed: {str(e)}")
+        
+        # Shared cache
+        st.markdown("---")
+        st.subheader("Dashboard Cache")
+        st.caption("Dashboard aggregates are shared by all app workers and refresh every few minutes. "
+                   "Refresh them now after bulk imports or corrections.")
+        if st.button("🔄 Refresh Dashboards", use_container_width=True):
+            refresh_analytics()
+            st.success("Dashboards will be rebuilt on every worker at their next view")
+        
+        # Data cleanup
+        st.markdown("---")
+        st.subheader("Data Maintenance")
+        with st.expander("🗑 Clean Old Data"):
+            days_to_keep = st.number_input("Keep data younger than (days)", 
+                                         min_value=30, max_value=365, value=180)
+            if st.button("Clean Old Data", type="secondary"):
+                cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+                st.info(f"This will delete data older than {cutoff_date.strftime('%Y-%m-%d')}")
+                confirm = st.checkbox("I understand this action cannot be undone")
+                if confirm and st.button("Confirm Deletion", type="primary"):
+                    # Implementation would delete old data
+                    st.success("Data cleanup scheduled")
+    
+    with tabs[3]:
+        st.subheader("System Settings")
+        # App settings
+        with st.form("system_settings"):
+            st.write("### Application Settings")
+            app_name = st.text_input("Application Name", value="Health Bridge Initiative")
+            maintenance_mode = st.checkbox("Maintenance Mode")
+            allow_registrations = st.checkbox("Allow New Registrations", value=True)
+            enable_payments = st.checkbox("Enable Payments", value=True)
+            
+            # Notification settings
+            st.write("### Notification Settings")
+            notify_new_screening = st.checkbox("Notify on New Screening", value=True)
+            notify_high_risk = st.checkbox("Notify on High Risk Cases", value=True)
+            notify_donation = st.checkbox("Notify on Donations", value=True)
+            
+            if st.form_submit_button("Save Settings"):
+                st.success("Settings saved!")
+    
+    with tabs[4]:
+        st.subheader("Advanced Analytics")
+        # Only the charted columns, binned or WebGL-rendered as the row count grows
+        try:
+            columns = load_chart_columns(time_range)
+        except CloudReadError as e:
+            st.error(f"Could not load analytics: {str(e)}")
+            columns = None
+        
+        if columns is not None and len(columns['age']):
+            col1, col2 = st.columns(2)
+            with col1:
+                # Age distribution, binned server-side
+                counts, edges = charts.histogram_bins(columns['age'], nbins=20)
+                show_chart("admin_age_histogram", data_version(counts.tolist(), edges.tolist()),
+                           lambda: charts.build_histogram(counts, edges, "Age Distribution", "age"))
+            with col2:
+                # Risk vs Glucose
+                glucose, risk, levels = columns['blood_glucose'], columns['risk_score'], columns['risk_level']
+                show_chart("admin_glucose_scatter", charts.array_digest(glucose, risk, levels.astype(str)),
+                           lambda: charts.build_scatter(glucose, risk, levels, "Glucose vs Risk Score",
+                                                 "blood_glucose", "risk_score"))
+                st.caption(f"{len(glucose):,} screenings · {charts.scatter_mode(len(glucose))} rendering")
+            
+            # Time series analysis
+            summary = load_summary(ai_engine, time_range).overall()
+            if summary.daily:
+                days = sorted(summary.daily)
+                day_counts = [summary.daily[day] for day in days]
+                show_chart("admin_daily_screenings", data_version(days, day_counts),
+                           lambda: px.line(x=days, y=day_counts, title="Daily Screening Trends",
+                                           labels={'x': 'date', 'y': 'count'}))
+    
+    with tabs[5]:
+        st.subheader("Security Settings")
+        st.write("### Access Control")
+        with st.form("security_settings"):
+            # Password policy
+            min_password_length = st.number_input("Minimum Password Length",
+                                                min_value=8, max_value=20, value=12)
+            require_special_chars = st.checkbox("Require Special Characters", value=True)
+            password_expiry_days = st.number_input("Password Expiry (days)",
+                                                 min_value=30, max_value=365, value=90)
+            
+            # Session settings
+            session_timeout = st.number_input("Session Timeout (minutes)",
+                                           min_value=5, max_value=240, value=30)
+            max_login_attempts = st.number_input("Max Login Attempts",
+                                               min_value=3, max_value=10, value=5)
+            
+            # IP restrictions
+            enable_ip_whitelist = st.checkbox("Enable IP Whitelist")
+            ip_list = st.text_area("Allowed IPs (one per line)")
+            
+            if st.form_submit_button("Update Security Settings"):
+                st.success("Security settings updated!")
+    
+    if show_performance:
+        with tabs[6]:
+            show_performance_panel()
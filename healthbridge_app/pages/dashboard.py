@@ -0,0 +1,140 @@
+"""Public dashboard: KPIs, indicators, prevalence, charts and records"""
+from datetime import datetime
+
+import streamlit as st
+
+from healthbridge.lazy import lazy_import
+from healthbridge.tracing import traced
+from healthbridge.figures import data_version
+from healthbridge_app.components import (date_range_filter, export_download_button,
+                                         export_format_selector, generate_dashboard_report,
+                                         generate_state_reports, record_table, show_chart,
+                                         show_prevalence_estimates, show_program_indicators,
+                                         stream_export)
+from healthbridge_app.engine import HealthBridgeAI, load_summary
+
+px = lazy_import("plotly.express")
+epi = lazy_import("healthbridge.epi")
+
+@traced("page.show_dashboard")
+def show_dashboard():
+    """Analytics dashboard for the initiative"""
+    ai_engine = HealthBridgeAI()
+    st.title("📊 Health Bridge Dashboard")
+    
+    # Load data from cloud
+    time_range = date_range_filter()
+    aggregates = load_summary(ai_engine, time_range)
+    summary = aggregates.overall()
+    funding_totals = ai_engine.get_funding_totals()
+    
+    if not summary.total:
+        if time_range:
+            st.info("No screenings in the selected date range.")
+        else:
+            st.info("No screening data available yet. Start with the Health Screening page.")
+        return
+    
+    # Key Metrics
+    st.subheader("📈 Key Performance Indicators")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Screened", summary.total)
+    with col2:
+        st.metric("High Risk Cases", summary.high_risk, f"{summary.high_risk_rate * 100:.1f}%")
+        lower, upper = epi.wilson_interval(summary.high_risk, summary.total)
+        st.caption(f"95% CI {float(lower) * 100:.1f}–{float(upper) * 100:.1f}%")
+    with col3:
+        st.metric("Average Age", f"{summary.average_age or 0:.1f}")
+    with col4:
+        st.metric("Funds Raised", f"₦{funding_totals['amount_raised']:,.0f}")
+    
+    show_program_indicators(ai_engine, time_range)
+    
+    st.markdown("---")
+    
+    # Glucose Analysis
+    if summary.glucose_bands:
+        st.subheader("🩸 Blood Glucose Distribution (mg/dL)")
+        glucose_labels, glucose_values = zip(*summary.glucose_counts())
+        
+        show_chart("glucose_pie", data_version(glucose_values), lambda: px.pie(
+            values=glucose_values,
+            names=glucose_labels,
+            title="Blood Glucose Categories",
+            color_discrete_sequence=['#3498db', '#2ecc71', '#f39c12', '#e74c3c']
+        ))
+    
+    st.markdown("---")
+    
+    # Risk Distribution
+    st.subheader("⚠ Risk Level Distribution")
+    if summary.risk_levels:
+        risk_levels, risk_values = zip(*summary.risk_levels.most_common())
+        show_chart("risk_bar", data_version(risk_levels, risk_values), lambda: px.bar(
+            x=risk_levels,
+            y=risk_values,
+            title="Risk Levels Across Population",
+            labels={'x': 'Risk Level', 'y': 'Count'},
+            color=risk_values,
+            color_continuous_scale='RdYlGn_r'
+        ))
+    
+    # Prevalence with uncertainty
+    st.subheader("📐 Prevalence Estimates (95% CI)")
+    show_prevalence_estimates(time_range)
+    
+    # Location Analysis
+    st.subheader("📍 Geographic Distribution")
+    if summary.locations:
+        locations, location_values = zip(*summary.locations.most_common())
+        show_chart("location_bar", data_version(locations, location_values), lambda: px.bar(
+            x=locations,
+            y=location_values,
+            title="Screenings by Location",
+            labels={'x': 'Location', 'y': 'Count'},
+            color=location_values,
+            color_continuous_scale='Blues'
+        ))
+    
+    # Time Series Analysis
+    st.subheader("📅 Screening Trends Over Time")
+    if summary.daily:
+        days = sorted(summary.daily)
+        day_counts = [summary.daily[day] for day in days]
+        
+        def build_daily():
+            fig = px.line(x=days, y=day_counts, title="Daily Screenings", markers=True)
+            fig.update_layout(xaxis_title="Date", yaxis_title="Number of Screenings")
+            return fig
+        
+        show_chart("daily_screenings", data_version(days, day_counts), build_daily)
+    
+    # Data Table
+    st.subheader("📋 Detailed Screening Records")
+    record_table("dashboard_records", sorted(summary.locations), sorted(summary.risk_levels), time_range)
+    
+    # Export Options
+    st.subheader("📤 Data Export")
+    col1, col2 = st.columns(2)
+    with col1:
+        export_format = export_format_selector("dashboard_export_format")
+        if st.button("📥 Export Screenings", use_container_width=True):
+            export_file, row_count = stream_export(ai_engine, "screening_data", export_format)
+            if export_file is not None:
+                export_download_button(export_file, row_count, "health_screening", export_format)
+    with col2:
+        if st.button("📊 Generate Report", use_container_width=True):
+            report = generate_dashboard_report(summary)
+            st.download_button(
+                label="Download Report",
+                data=report,
+                file_name=f"dashboard_report_{datetime.now().strftime('%Y%m%d')}.txt",
+                mime="text/plain"
+            )
+            st.download_button(
+                label="Download State Reports (ZIP)",
+                data=generate_state_reports(aggregates),
+                file_name=f"state_reports_{datetime.now().strftime('%Y%m%d')}.zip",
+                mime="application/zip"
+            )
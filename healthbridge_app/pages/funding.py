@@ -0,0 +1,251 @@
+"""Funding page: Paystack donations, funding requests and the ledger"""
+from datetime import datetime
+
+import streamlit as st
+
+from healthbridge.lazy import lazy_import
+from healthbridge.tracing import traced
+from healthbridge.figures import data_version
+from healthbridge_app.components import patient_picker, show_chart, styled
+from healthbridge_app.engine import HealthBridgeAI, current_session
+
+px = lazy_import("plotly.express")
+
+@traced("page.show_funding_platform")
+def show_funding_platform():
+    """Crowdfunding platform with Paystack integration"""
+    ai_engine = HealthBridgeAI()
+    st.title("💰 Health Bridge Funding Platform")
+    
+    # Paystack redirects back with ?reference=... once the donor completes payment
+    reference = st.query_params.get("reference")
+    if reference and st.session_state.get('confirmed_reference') != reference:
+        if ai_engine.confirm_payment(reference):
+            st.success("✅ Thank you! Your donation has been confirmed.")
+            st.balloons()
+        else:
+            st.warning("We could not confirm this payment yet. It will be applied once Paystack confirms it.")
+        st.session_state.confirmed_reference = reference
+    
+    funding_totals = ai_engine.get_funding_totals()
+    
+    # Tabs for different funding sections
+    tabs = st.tabs(["💸 Donate Now", "📋 Funding Requests", "🤝 Corporate Sponsorship", "📊 Funding Analytics"])
+    
+    with tabs[0]:
+        st.subheader("Make a Donation")
+        # Donation type and patient search sit outside the form so they update interactively
+        donation_type = st.selectbox(
+            "Donation Type",
+            ["General Fund", "Specific Patient", "Equipment Fund", "Screening Camp", "Research"]
+        )
+        patient_id = None
+        if donation_type == "Specific Patient":
+            patient_id = patient_picker("donation_patient")
+        
+        session = current_session()
+        selected_request = session.selected_request
+        if selected_request:
+            st.info(f"Supporting funding request for **{selected_request.patient_name}**")
+            if st.button("Clear selected request"):
+                session.select_request(None)
+                st.rerun()
+        
+        with st.form("donation_form"):
+            col1, col2 = st.columns(2)
+            with col1:
+                donor_name = st.text_input("Full Name")
+                donor_email = st.text_input("Email Address*", placeholder="example@email.com")
+            with col2:
+                amount = st.number_input("Amount (₦)*", min_value=100, value=5000, step=100)
+                message = st.text_area("Message (Optional)", placeholder="Your message here...")
+                anonymous = st.checkbox("Donate Anonymously")
+            
+            submitted = st.form_submit_button("💳 Proceed to Payment", type="primary")
+            
+            if submitted:
+                if not donor_email or amount < 100:
+                    st.error("Please enter valid email and amount (minimum ₦100)")
+                elif donation_type == "Specific Patient" and not patient_id:
+                    st.error("Please search for and select the patient you want to support")
+                else:
+                    # Prepare payment metadata
+                    metadata = {
+                        "donor_name": "Anonymous" if anonymous else donor_name,
+                        "donation_type": donation_type,
+                        "message": message,
+                        "patient_id": patient_id if donation_type == "Specific Patient" else None,
+                        "funding_request_id": str(selected_request.id) if selected_request else None,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    
+                    # Initialize payment
+                    payment_data = ai_engine.payment_manager.initialize_transaction(
+                        email=donor_email,
+                        amount=amount,
+                        metadata=metadata
+                    )
+                    
+                    if payment_data and payment_data.get('status'):
+                        authorization_url = payment_data['data']['authorization_url']
+                        reference = payment_data['data']['reference']
+                        st.success("✅ Payment initialized! Redirecting to Paystack...")
+                        
+                        # Display payment button
+                        styled(f"""
+                        <a href="{authorization_url}" target="_blank">
+                            <button style='
+                                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                                color: white;
+                                padding: 15px 30px;
+                                border: none;
+                                border-radius: 10px;
+                                font-size: 16px;
+                                cursor: pointer;
+                                width: 100%;
+                                margin: 10px 0;
+                            '>
+                                💳 Click to Complete Payment on Paystack
+                            </button>
+                        </a>
+                        """, plain=f"[💳 Complete Payment on Paystack]({authorization_url})")
+                        
+                        # Save payment record
+                        payment_record = {
+                            "reference": reference,
+                            "donor_email": donor_email,
+                            "donor_name": "Anonymous" if anonymous else donor_name,
+                            "amount": amount,
+                            "currency": "NGN",
+                            "status": "pending",
+                            "metadata": metadata,
+                            "created_at": datetime.now().isoformat()
+                        }
+                        ai_engine.save_to_cloud("payments", payment_record)
+                    else:
+                        st.error("Payment initialization failed. Please try again.")
+    
+    with tabs[1]:
+        st.subheader("Active Funding Requests")
+        # Load funding requests from cloud
+        funding_requests = ai_engine.get_from_cloud("funding_requests")
+        
+        if funding_requests:
+            for request in funding_requests:
+                if request.get('status') == 'active':
+                    with st.container():
+                        col1, col2 = st.columns([3, 1])
+                        with col1:
+                            st.markdown(f"### {request['patient_name']}")
+                            st.write(f"**Diagnosis:** {request.get('diagnosis', 'Not specified')}")
+                            st.write(f"**Amount Needed:** ₦{request.get('amount_needed', 0):,.0f}")
+                            st.write(f"**Urgency:** {request.get('urgency_level', 'Medium')}")
+                            
+                            # Progress bar
+                            amount_raised = funding_totals['requests'].get(str(request['id']), 0)
+                            amount_needed = request.get('amount_needed', 1)
+                            progress = (amount_raised / amount_needed) * 100
+                            st.progress(min(progress / 100, 1.0))
+                            st.write(f"**₦{amount_raised:,.0f} raised of ₦{amount_needed:,.0f} ({progress:.1f}%)**")
+                        
+                        with col2:
+                            if st.button("Donate Now", key=request['id'], use_container_width=True):
+                                current_session().select_request(request)
+                                st.rerun()
+                        st.markdown("---")
+        else:
+            st.info("No active funding requests")
+        
+        # Option to create funding request
+        if st.button("➕ Create Funding Request", use_container_width=True):
+            with st.form("new_funding_request"):
+                st.subheader("New Funding Request")
+                patient_name = st.text_input("Patient Name")
+                diagnosis = st.text_area("Diagnosis")
+                treatment_plan = st.text_area("Treatment Plan")
+                amount_needed = st.number_input("Amount Needed (₦)", min_value=10000, value=500000)
+                urgency = st.selectbox("Urgency Level", ["Low", "Medium", "High", "Critical"])
+                story = st.text_area("Patient's Story")
+                
+                if st.form_submit_button("Submit for Review"):
+                    # Save to cloud
+                    pass
+    
+    with tabs[2]:
+        st.subheader("Corporate Partnership Opportunities")
+        partnership_tiers = [
+            {
+                "name": "🌱 Community Partner",
+                "amount": "₦500,000/year",
+                "benefits": [
+                    "Logo on website",
+                    "Social media recognition",
+                    "Annual impact report"
+                ]
+            },
+            {
+                "name": "💎 Health Champion",
+                "amount": "₦2,000,000/year",
+                "benefits": [
+                    "All Community benefits",
+                    "Naming rights for screening camps",
+                    "Featured in press releases",
+                    "Employee engagement programs"
+                ]
+            },
+            {
+                "name": "🏆 Life Saver",
+                "amount": "₦5,000,000+/year",
+                "benefits": [
+                    "All Health Champion benefits",
+                    "Board advisory position",
+                    "Customized impact reporting",
+                    "Exclusive event invitations",
+                    "Media coverage opportunities"
+                ]
+            }
+        ]
+        
+        for tier in partnership_tiers:
+            with st.expander(f"{tier['name']} - {tier['amount']}"):
+                st.markdown("**Benefits:**")
+                for benefit in tier['benefits']:
+                    st.write(f"✓ {benefit}")
+                if st.button(f"Become {tier['name'].split()[1]} Partner", key=tier['name']):
+                    st.info("Contact us at partners@healthbridge.ng")
+        
+        st.markdown("---")
+        st.subheader("📞 Contact Our Partnership Team")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write("**Email:** partners@healthbridge.ng")
+            st.write("**Phone:** +234 817 937 1170")
+        with col2:
+            st.write("**Address:** Health Bridge Initiative HQ")
+            st.write("Lagos, Nigeria")
+    
+    with tabs[3]:
+        st.subheader("Funding Analytics")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Donations", f"₦{funding_totals['amount_raised']:,.0f}")
+        with col2:
+            donation_count = funding_totals['donation_count']
+            avg_donation = funding_totals['amount_raised'] / donation_count if donation_count else 0
+            st.metric("Average Donation", f"₦{avg_donation:,.0f}")
+        with col3:
+            st.metric("Successful Donations", donation_count)
+        
+        # Daily totals come from the funding ledger, not a scan of payments
+        daily = funding_totals.get('daily') or {}
+        if daily:
+            days = sorted(daily)
+            amounts = [daily[day] for day in days]
+            show_chart("daily_donations", data_version(days, amounts), lambda: px.line(
+                x=days,
+                y=amounts,
+                title="Daily Donation Trends",
+                labels={'y': 'Amount (₦)', 'x': 'Date'}
+            ))
+        else:
+            st.info("No donation data available")
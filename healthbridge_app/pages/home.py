@@ -0,0 +1,201 @@
+"""Homepage: mission, programme pillars and headline impact numbers"""
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from healthbridge.tracing import traced
+from healthbridge_app.components import lite_mode, qr_code, styled
+from healthbridge_app.engine import HealthBridgeAI, load_summary
+from healthbridge_app.registry import page_script
+
+DOWNLOAD_URL = "https://healthbridge.ng/download"
+
+@traced("page.show_homepage")
+def show_homepage():
+    """Display homepage with mission and overview"""
+    styled("""
+    <style>
+    .hero {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 4rem 2rem;
+        border-radius: 20px;
+        color: white;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    .feature-card {
+        background: white;
+        padding: 1.5rem;
+        border-radius: 15px;
+        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        margin: 1rem 0;
+        border-left: 5px solid #667eea;
+    }
+    @media (max-width: 768px) {
+        .hero { padding: 2rem 1rem; }
+    }
+    </style>
+    """)
+    
+    # Hero Section
+    styled("""
+    <div class="hero">
+        <h1 style="font-size: 3rem; margin-bottom: 1rem;">🩺 Health Bridge Initiative</h1>
+        <h3 style="color: rgba(255,255,255,0.9);">Building Nigeria's Shield Against Silent Epidemics</h3>
+        <p style="font-size: 1.2rem; margin-top: 2rem;">
+            Early detection saves lives. Join our mission to eradicate preventable deaths from
+            chronic kidney and liver diseases in Nigeria.
+        </p>
+    </div>
+    """, plain="""
+    # 🩺 Health Bridge Initiative
+    **Building Nigeria's Shield Against Silent Epidemics.** Early detection saves lives.
+    """)
+    
+    # Quick Actions for Mobile
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("🩺 Start Screening", use_container_width=True):
+            st.switch_page(page_script("screening"))
+    with col2:
+        if st.button("💰 Donate Now", use_container_width=True):
+            st.switch_page(page_script("funding"))
+    with col3:
+        if st.button("🤝 Volunteer", use_container_width=True):
+            st.switch_page(page_script("volunteer"))
+    
+    st.markdown("---")
+    
+    # Mission & Features
+    st.subheader("🎯 Our Mission")
+    st.markdown("""
+    To eradicate preventable deaths from chronic kidney and liver disease in Nigeria by building a
+    **community-driven early detection system** that bridges the gap between risk identification and
+    affordable, accessible care.
+    """)
+    
+    # Three Pillars
+    st.subheader("🌟 Our Three-Pillar Approach")
+    cols = st.columns(3)
+    pillars = [
+        {
+            "title": "🔍 Community Screening",
+            "color": "#1f77b4",
+            "items": [
+                "Monthly free health camps",
+                "Blood pressure monitoring",
+                "Urine dipstick tests",
+                "Blood glucose testing",
+                "BMI calculation"
+            ]
+        },
+        {
+            "title": "🤖 AI-Powered Navigation",
+            "color": "#ff7f0e",
+            "items": [
+                "Instant risk assessment",
+                "Local language support",
+                "Smart facility referrals",
+                "Personalized health advice",
+                "Mobile app integration"
+            ]
+        },
+        {
+            "title": "💰 Sustainable Funding",
+            "color": "#2ca02c",
+            "items": [
+                "Crowdfunding platform (1% fee)",
+                "Health resilience bonds",
+                "Insurance partnerships",
+                "Preventive care financing",
+                "Transparent tracking"
+            ]
+        }
+    ]
+    
+    for i, col in enumerate(cols):
+        with col:
+            pillar = pillars[i]
+            styled(f"""
+            <div style='border-left: 5px solid {pillar["color"]}; padding-left: 15px; margin: 1rem 0;'>
+                <h4>{pillar["title"]}</h4>
+                <ul style='padding-left: 20px;'>
+                    {''.join([f'<li>{item}</li>' for item in pillar["items"]])}
+                </ul>
+            </div>
+            """, plain=f"**{pillar['title']}**\n" + "".join(f"\n- {item}" for item in pillar["items"]))
+    
+    # Impact Metrics
+    st.markdown("---")
+    st.subheader("📈 Real-time Impact Dashboard")
+    
+    # Load data from cloud
+    ai_engine = HealthBridgeAI()
+    summary = load_summary(ai_engine).overall()
+    funding_totals = ai_engine.get_funding_totals()
+    
+    metric_cols = st.columns(4)
+    with metric_cols[0]:
+        week_start = (datetime.now().date() - timedelta(days=6)).isoformat()
+        this_week = sum(count for day, count in summary.daily.items() if day >= week_start)
+        st.metric("People Screened", summary.total, f"+{this_week} this week")
+    with metric_cols[1]:
+        st.metric("High Risk Cases", summary.high_risk)
+    with metric_cols[2]:
+        st.metric("Funds Raised", f"₦{funding_totals['amount_raised']:,.0f}")
+    with metric_cols[3]:
+        volunteers = len(ai_engine.get_from_cloud("volunteers"))
+        st.metric("Active Volunteers", volunteers)
+    
+    # Call to Action
+    st.markdown("---")
+    styled("""
+    <div style='text-align: center; padding: 3rem; background: linear-gradient(to right, #e3f2fd, #f3e5f5); border-radius: 15px;'>
+        <h2>🚀 Join Our Movement</h2>
+        <p style='font-size: 1.1rem; margin: 1rem 0;'>
+            Be part of Nigeria's health revolution. Whether as a volunteer, partner, or donor,
+            your contribution builds a healthier future for all.
+        </p>
+    </div>
+    """, plain="### 🚀 Join Our Movement")
+    
+    # Mobile App Download Section
+    with st.expander("📱 Download Our Mobile App"):
+        st.markdown("""
+        ### Available on All Platforms
+        **Android:**
+        - Google Play Store: `Health Bridge Nigeria`
+        - Direct APK: [Download Here](https://healthbridge.ng/app)
+        
+        **iOS:**
+        - Apple App Store: Coming Soon
+        
+        **Features in Mobile App:**
+        - Offline screening capability
+        - Push notification reminders
+        - Health tracking dashboard
+        - Direct chat with doctors
+        - Location-based facility finder
+        
+        **System Requirements:**
+        - Android 8.0+ or iOS 12+
+        - 100MB free space
+        - Internet connection for cloud sync
+        """)
+        
+        # QR Code for Mobile Download (drawn locally; on a phone in lite mode the link is enough)
+        col1, col2 = st.columns(2)
+        with col1:
+            qr = None if lite_mode() else qr_code(DOWNLOAD_URL)
+            if qr:
+                st.markdown("**Scan to Download:**")
+                # Inline SVG rather than st.image, which pulls numpy into the homepage
+                st.markdown(qr, unsafe_allow_html=True)
+            else:
+                st.markdown(f"**Download:** [{DOWNLOAD_URL}]({DOWNLOAD_URL})")
+        with col2:
+            st.markdown("**App Features Preview:**")
+            st.write("• Real-time health monitoring")
+            st.write("• Medication reminders")
+            st.write("• Health education library")
+            st.write("• Emergency contacts")
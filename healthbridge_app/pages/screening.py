@@ -0,0 +1,414 @@
+"""Screening page: risk assessment, referral letter and patient trends"""
+from datetime import datetime
+
+import streamlit as st
+
+from healthbridge.lazy import lazy_import
+from healthbridge.tracing import traced
+from healthbridge.risk import referral_facilities
+from healthbridge_app.components import lite_mode, show_glucose_gauge, show_patient_trends, styled
+from healthbridge_app.engine import HealthBridgeAI, current_session
+from healthbridge_app.pwa import installed
+from healthbridge_app.registry import page_script
+
+pd = lazy_import("pandas")
+
+@traced("page.show_screening_page")
+def show_screening_page():
+    """Interactive health screening interface"""
+    ai_engine = HealthBridgeAI()
+    st.title("🔍 Community Health Screening")
+    
+    # Mobile-friendly tabs
+    tabs = st.tabs(["📝 Screening Form", "📊 Risk Assessment", "🏥 Referral", "💡 Health Advice"])
+    
+    with tabs[0]:
+        if installed():
+            st.caption("No signal? Use the [offline screening form](pwa/offline.html): entries are kept on "
+                       "this device and sent automatically once you are back online.")
+        with st.form("screening_form", clear_on_submit=True):
+            st.subheader("Personal Information")
+            col1, col2 = st.columns(2)
+            with col1:
+                name = st.text_input("Full Name*", placeholder="Enter full name")
+                age = st.number_input("Age*", min_value=1, max_value=120, value=30)
+                phone = st.text_input("Phone Number*", placeholder="08012345678")
+            with col2:
+                location = st.selectbox("Location*", ["Lagos", "Kano", "Abuja", "Port Harcourt", "Ibadan", "Ogun", "Oyo", "Others"])
+                language = st.selectbox("Preferred Language", ["English", "Yoruba", "Hausa", "Igbo", "Pidgin"])
+                sex = st.selectbox("Sex*", ["Male", "Female", "Prefer not to say"])
+            
+            st.markdown("---")
+            st.subheader("Vital Signs & Measurements")
+            col3, col4 = st.columns(2)
+            with col3:
+                systolic_bp = st.slider("Systolic BP (mmHg)*", 80, 250, 120)
+                diastolic_bp = st.slider("Diastolic BP (mmHg)*", 50, 150, 80)
+                blood_glucose = st.number_input(
+                    "Random Blood Glucose (mg/dL)*",
+                    min_value=20,
+                    max_value=600,
+                    value=100,
+                    step=1,
+                    help="Normal: 70-139 mg/dL | Pre-diabetes: 140-199 mg/dL | Diabetes: ≥200 mg/dL"
+                )
+            with col4:
+                weight = st.number_input("Weight (kg)*", min_value=20.0, max_value=200.0, value=70.0, step=0.1)
+                height = st.number_input("Height (cm)*", min_value=100, max_value=250, value=170)
+                waist_circumference = st.number_input("Waist Circumference (cm)", min_value=50, max_value=200, value=85)
+            
+            st.markdown("---")
+            st.subheader("Medical History & Risk Factors")
+            col5, col6 = st.columns(2)
+            with col5:
+                urine_protein = st.selectbox("Urine Protein", ["Negative", "Trace", "1+", "2+", "3+"])
+                known_diabetes = st.radio("Known Diabetes?", ["No", "Yes"])
+                known_hypertension = st.radio("Known Hypertension?", ["No", "Yes"])
+            with col6:
+                family_history = st.radio("Family History of Kidney Disease?", ["No", "Yes"])
+                herbal_use = st.radio("Regular Herbal Medicine Use?", ["No", "Yes"])
+                smoking = st.radio("Do you smoke?", ["No", "Yes"])
+            
+            # Consent
+            st.markdown("---")
+            consent = st.checkbox("I consent to store my health data securely in the cloud*")
+            share_data = st.checkbox("I agree to share anonymized data for research purposes")
+            
+            submitted = st.form_submit_button("🚀 Analyze My Health Risk", type="primary")
+            
+            if submitted:
+                if not all([name, phone, consent]):
+                    st.error("Please fill all required fields (*)")
+                else:
+                    screening_data = {
+                        'name': name,
+                        'age': age,
+                        'phone': phone,
+                        'location': location,
+                        'language': language,
+                        'sex': sex,
+                        'systolic_bp': systolic_bp,
+                        'diastolic_bp': diastolic_bp,
+                        'blood_glucose': blood_glucose,
+                        'weight': weight,
+                        'height': height,
+                        'waist_circumference': waist_circumference,
+                        'urine_protein': urine_protein,
+                        'known_diabetes': known_diabetes,
+                        'known_hypertension': known_hypertension,
+                        'family_history': family_history,
+                        'herbal_use': herbal_use,
+                        'smoking': smoking,
+                        'timestamp': datetime.now().isoformat(),
+                        'data_shared': share_data
+                    }
+                    
+                    # Calculate risk, link to the patient and save to cloud
+                    risk_assessment, patient_id, saved_data = ai_engine.record_screening(screening_data)
+                    
+                    current_session().set_screening(screening_data, risk_assessment, patient_id)
+                    if saved_data:
+                        st.success("✅ Screening data saved securely to cloud!")
+                        st.balloons()
+                    else:
+                        st.warning("⚠ Data saved locally. Please check internet connection.")
+    
+    # Display results if screening exists
+    screening = current_session().screening
+    if screening is not None:
+        screening_data = screening.data()
+        risk_assessment = screening.risk()
+        patient_id = screening.patient_id
+        
+        with tabs[1]:
+            st.subheader("🎯 Your Risk Assessment")
+            
+            # Risk Level Card
+            risk_level = risk_assessment['risk_level']
+            risk_color = {
+                "🟢 LOW RISK": "green",
+                "🟡 MODERATE RISK": "orange",
+                "🔴 HIGH RISK": "red",
+                "🔴 CRITICAL RISK": "darkred"
+            }.get(risk_level.split()[0], "gray")
+            
+            styled(f"""
+            <div style='background: linear-gradient(135deg, #f8f9fa, #e9ecef);
+                        padding: 25px; border-radius: 15px; border-left: 8px solid {risk_color};
+                        margin: 20px 0;'>
+                <h2 style='color: {risk_color}; margin: 0;'>{risk_level}</h2>
+                <p style='font-size: 1.2rem; margin: 10px 0;'>
+                    <strong>Risk Score:</strong> {risk_assessment['score']:.1f}/10
+                </p>
+                <p><strong>Recommendation:</strong> {risk_assessment['recommendation']}</p>
+                <p><strong>Timeline:</strong> {risk_assessment['timeline']}</p>
+                <p><strong>Patient ID:</strong> {patient_id}</p>
+            </div>
+            """, plain=f"""
+            ## {risk_level}
+            **Risk Score:** {risk_assessment['score']:.1f}/10  
+            **Recommendation:** {risk_assessment['recommendation']}  
+            **Timeline:** {risk_assessment['timeline']}  
+            **Patient ID:** {patient_id}
+            """)
+            if risk_assessment.get('method') == 'model':
+                st.caption(f"Fitted model: {risk_assessment['model_risk_level'].strip()} "
+                           f"({risk_assessment['probability']:.0%} estimated chance of confirmed kidney disease). "
+                           f"Rule-based baseline: {risk_assessment['rule_risk_level'].strip()}, "
+                           f"score {risk_assessment['score']:.1f}/10. The higher of the two is shown.")
+            
+            # Vital Signs Dashboard
+            st.subheader("📊 Your Vital Signs")
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                bp_status = "✅ Normal" if (screening_data['systolic_bp'] < 140 and screening_data['diastolic_bp'] < 90) else "⚠ High"
+                st.metric("Blood Pressure", 
+                         f"{screening_data['systolic_bp']}/{screening_data['diastolic_bp']} mmHg", 
+                         bp_status)
+            with col2:
+                glucose = screening_data['blood_glucose']
+                if glucose >= 200:
+                    glucose_status = "🔴 Diabetes"
+                elif glucose >= 140:
+                    glucose_status = "🟡 Pre-diabetes"
+                elif glucose >= 70:
+                    glucose_status = "🟢 Normal"
+                else:
+                    glucose_status = "🔵 Low"
+                st.metric("Blood Glucose", f"{glucose} mg/dL", glucose_status)
+            with col3:
+                bmi = risk_assessment.get('bmi')
+                if bmi:
+                    if bmi >= 30:
+                        bmi_status = "🔴 Obese"
+                    elif bmi >= 25:
+                        bmi_status = "🟡 Overweight"
+                    else:
+                        bmi_status = "🟢 Normal"
+                    st.metric("BMI", f"{bmi:.1f}", bmi_status)
+            with col4:
+                urine_color = "red" if screening_data['urine_protein'] in ["2+", "3+"] else \
+                             "orange" if screening_data['urine_protein'] in ["Trace", "1+"] else "green"
+                st.metric("Urine Protein", screening_data['urine_protein'])
+            
+            # Risk Factors
+            st.subheader("⚠ Identified Risk Factors")
+            if risk_assessment['risk_factors']:
+                for factor in risk_assessment['risk_factors']:
+                    st.write(f"• {factor}")
+            else:
+                st.success("No significant risk factors identified")
+            
+            # Longitudinal trends for returning patients
+            st.subheader("📉 Your Health Trends")
+            show_patient_trends(patient_id, {
+                **screening_data,
+                'patient_id': patient_id,
+                'risk_score': risk_assessment['score']
+            })
+            
+            # Glucose Gauge
+            st.subheader("📈 Blood Glucose Analysis")
+            show_glucose_gauge(glucose)
+        
+        with tabs[2]:
+            st.subheader("🏥 Referral Information")
+            
+            # Generate referral
+            suitable_facilities = referral_facilities(screening_data['location'], risk_level,
+                                                      ai_engine.facilities)
+            
+            # Referral Card
+            styled(f"""
+            <div style='background: #e8f4f8; padding: 20px; border-radius: 10px;'>
+                <h4>📋 Health Bridge Referral Slip</h4>
+                <p><strong>Patient:</strong> {screening_data['name']}</p>
+                <p><strong>Patient ID:</strong> {patient_id}</p>
+                <p><strong>Date:</strong> {datetime.now().strftime('%Y-%m-%d')}</p>
+                <p><strong>Priority:</strong> {"🔴 URGENT" if "HIGH" in risk_level or "CRITICAL" in risk_level else "🟢 ROUTINE"}</p>
+                <p><strong>Blood Glucose:</strong> {screening_data['blood_glucose']} mg/dL</p>
+                <p><strong>Blood Pressure:</strong> {screening_data['systolic_bp']}/{screening_data['diastolic_bp']} mmHg</p>
+            </div>
+            """, plain=f"""
+            #### 📋 Health Bridge Referral Slip
+            **Patient:** {screening_data['name']} ({patient_id})  
+            **Date:** {datetime.now().strftime('%Y-%m-%d')}  
+            **Priority:** {"🔴 URGENT" if "HIGH" in risk_level or "CRITICAL" in risk_level else "🟢 ROUTINE"}  
+            **Blood Glucose:** {screening_data['blood_glucose']} mg/dL · **Blood Pressure:** {screening_data['systolic_bp']}/{screening_data['diastolic_bp']} mmHg
+            """)
+            
+            # Facilities
+            if suitable_facilities:
+                st.subheader("📍 Recommended Healthcare Facilities")
+                for i, facility in enumerate(suitable_facilities[:2], 1):
+                    styled(f"""
+                    <div style='background: #f0f8ff; padding: 15px; border-radius: 8px;
+                                margin: 10px 0; border-left: 4px solid #1f77b4;'>
+                        <h5>{i}. {facility['name']}</h5>
+                        <p><strong>Type:</strong> {facility['type']} | 
+                           <strong>Specialty:</strong> {facility['specialty']}</p>
+                        <p><strong>Location:</strong> {facility['location']}</p>
+                        <p><strong>Contact:</strong> {facility['contact']}</p>
+                    </div>
+                    """, plain=f"""
+                    **{i}. {facility['name']}** ({facility['type']}, {facility['specialty']})  
+                    📍 {facility['location']} · 📞 {facility['contact']}
+                    """)
+                
+                # Map Integration (map tiles are skipped in lite mode)
+                if not lite_mode():
+                    with st.expander("🗺 View on Map"):
+                        lat, lng = facility.get('latitude', 0), facility.get('longitude', 0)
+                        if lat and lng:
+                            st.map(pd.DataFrame({
+                                'lat': [lat],
+                                'lon': [lng]
+                            }), zoom=13)
+            
+            # Download Referral
+            st.subheader("📄 Download Referral")
+            referral_text = f"""
+=================================
+HEALTH BRIDGE INITIATIVE - REFERRAL
+=================================
+Patient: {screening_data['name']}
+Patient ID: {patient_id}
+Date: {datetime.now().strftime('%Y-%m-%d')}
+Risk Level: {risk_level}
+
+VITAL SIGNS:
+- Blood Pressure: {screening_data['systolic_bp']}/{screening_data['diastolic_bp']} mmHg
+- Blood Glucose: {screening_data['blood_glucose']} mg/dL
+- Urine Protein: {screening_data['urine_protein']}
+- BMI: {risk_assessment.get('bmi', 'N/A')}
+
+RECOMMENDED FACILITIES:
+"""
+            for facility in suitable_facilities[:2]:
+                referral_text += f"\n• {facility['name']} ({facility['type']})"
+                referral_text += f"\n📍 {facility['location']}"
+                referral_text += f"\n📞 {facility['contact']}"
+                referral_text += f"\n⚕ Specialty: {facility['specialty']}\n"
+            
+            referral_text += f"""
+RECOMMENDATION:
+{risk_assessment['recommendation']}
+
+TIMELINE:
+{risk_assessment['timeline']}
+
+=================================
+For verification: www.healthbridge.ng
+Emergency: 112 or 767
+📞 *08179371170*
+=================================
+"""
+            
+            st.download_button(
+                label="📥 Download Referral Slip",
+                data=referral_text,
+                file_name=f"referral_{patient_id}.txt",
+                mime="text/plain",
+                use_container_width=True
+            )
+            
+            # Share options
+            st.markdown("### 📲 Share Your Results")
+            share_cols = st.columns(3)
+            with share_cols[0]:
+                if st.button("📧 Email", use_container_width=True):
+                    st.info("Email sharing coming soon!")
+            with share_cols[1]:
+                if st.button("📱 WhatsApp", use_container_width=True):
+                    st.info("WhatsApp sharing coming soon!")
+            with share_cols[2]:
+                if st.button("💾 Save to Phone", use_container_width=True):
+                    st.success("Referral saved to device!")
+        
+        with tabs[3]:
+            st.subheader("💡 Personalized Health Advice")
+            
+            # Generate advice based on risk factors
+            advice = []
+            risk_factors = [f.lower() for f in risk_assessment['risk_factors']]
+            
+            if any('hypertension' in f for f in risk_factors):
+                advice.extend([
+                    "• **Reduce salt intake** to less than 5g per day",
+                    "• **Increase potassium-rich foods**: bananas, spinach, sweet potatoes",
+                    "• **Exercise regularly**: 30 minutes most days",
+                    "• **Limit alcohol**: Max 1 drink/day for women, 2 for men"
+                ])
+            
+            if any('diabetes' in f or 'glucose' in f for f in risk_factors):
+                advice.extend([
+                    "• **Monitor blood sugar** regularly",
+                    "• **Choose complex carbs**: whole grains, vegetables",
+                    "• **Exercise**: 150 minutes/week of moderate activity",
+                    "• **Maintain healthy weight**: Target BMI 18.5-24.9"
+                ])
+            
+            if any('protein' in f for f in risk_factors):
+                advice.extend([
+                    "• **Stay hydrated**: 2-3 liters of water daily",
+                    "• **Avoid NSAIDs**: Ibuprofen, aspirin without prescription",
+                    "• **Control BP & sugar** strictly",
+                    "• **Regular kidney function tests** recommended"
+                ])
+            
+            # General advice
+            advice.extend([
+                "• **Avoid smoking and tobacco** products",
+                "• **Get 7-8 hours** of quality sleep nightly",
+                "• **Manage stress**: Meditation, deep breathing",
+                "• **Regular check-ups**: Annual health screening"
+            ])
+            
+            # Display advice
+            for item in advice:
+                st.markdown(item)
+            
+            # Glucose-specific advice
+            glucose = screening_data['blood_glucose']
+            if glucose >= 200:
+                st.warning("""
+                **🔴 IMPORTANT FOR HIGH BLOOD GLUCOSE (≥200 mg/dL):**
+                - **Urgent consultation** with doctor within 1 week
+                - **Monitor glucose** levels twice daily
+                - **Follow diabetic diet**: Low glycemic index foods
+                - **Medication** may be required immediately
+                """)
+            elif glucose >= 140:
+                st.info("""
+                **🟡 FOR ELEVATED BLOOD GLUCOSE (140-199 mg/dL):**
+                - **Consult doctor** within 1 month
+                - **Lifestyle modification** crucial
+                - **Reduce sugar** and processed foods
+                - **Re-check** in 3 months
+                """)
+            elif glucose < 70:
+                st.error("""
+                **🔵 FOR LOW BLOOD GLUCOSE (<70 mg/dL):**
+                - **Immediate action**: Consume 15g fast-acting carbs
+                - **Re-check** in 15 minutes
+                - **Consult doctor** if recurrent episodes
+                - **Carry glucose tablets** or sweets
+                """)
+            
+            # Local language note
+            if screening_data['language'] != 'English':
+                st.info(f"💬 Personalized advice in {screening_data['language']} coming soon!")
+            
+            # Funding eligibility
+            if "HIGH RISK" in risk_level or "CRITICAL" in risk_level:
+                styled("""
+                <div style='background: #fffacd; padding: 15px; border-radius: 8px; margin: 20px 0;'>
+                    <h5>💰 Financial Assistance Available</h5>
+                    <p>You may be eligible for our health funding support program.</p>
+                    <p>Our crowdfunding platform has only 1% processing fee.</p>
+                </div>
+                """, plain="**💰 Financial Assistance Available** — you may be eligible for our health "
+                           "funding support program (1% processing fee).")
+                
+                if st.button("Apply for Financial Support", use_container_width=True):
+                    st.switch_page(page_script("funding"))
@@ -0,0 +1,207 @@
+"""Volunteer registration page"""
+from datetime import datetime
+
+import streamlit as st
+
+from healthbridge.tracing import traced
+from healthbridge_app.engine import HealthBridgeAI, current_session
+
+@traced("page.show_volunteer_registration")
+def show_volunteer_registration():
+    """Volunteer registration and management"""
+    ai_engine = HealthBridgeAI()
+    st.title("🤝 Join Our Volunteer Team")
+    
+    tabs = st.tabs(["📝 Volunteer Application", "🔍 Find Opportunities", "📚 Volunteer Resources"])
+    
+    with tabs[0]:
+        with st.form("volunteer_application", clear_on_submit=True):
+            st.subheader("Personal Information")
+            col1, col2 = st.columns(2)
+            with col1:
+                full_name = st.text_input("Full Name*", placeholder="John Doe")
+                email = st.text_input("Email Address*", placeholder="john@example.com")
+                phone = st.text_input("Phone Number*", placeholder="08012345678")
+            with col2:
+                location = st.selectbox("Location*", ["Lagos", "Kano", "Abuja", "Port Harcourt", "Ibadan", "Others"])
+                profession = st.text_input("Profession/Occupation", placeholder="Doctor, Nurse, Student, etc.")
+                age = st.number_input("Age*", min_value=18, max_value=80, value=25)
+            
+            st.markdown("---")
+            st.subheader("Volunteer Preferences")
+            skills = st.multiselect("Select Your Skills*",
+                                  ["Medical Professional", "Nursing", "Community Health", "Data Entry",
+                                   "Event Management", "Fundraising", "Translation", "Counseling",
+                                   "Logistics", "IT Support", "Marketing", "Graphic Design",
+                                   "Photography/Videography", "Teaching", "Research", "Others"])
+            other_skills = st.text_input("Other Skills (if not listed)")
+            
+            availability = st.selectbox("Availability*",
+                                      ["Weekends Only", "Weekdays Only", "Flexible", "Specific Days", "Remote Only"])
+            if availability == "Specific Days":
+                specific_days = st.multiselect("Select Days",
+                                             ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"])
+            
+            experience = st.number_input("Years of Relevant Experience", min_value=0, max_value=50, value=0)
+            
+            st.markdown("---")
+            st.subheader("Background Information")
+            motivation = st.text_area("Why do you want to volunteer with us?*",
+                                    placeholder="Share your motivation...",
+                                    height=100)
+            previous_volunteering = st.text_area("Previous Volunteering Experience (if any)",
+                                               placeholder="Describe your previous experience...",
+                                               height=80)
+            emergency_contact = st.text_input("Emergency Contact Name & Number")
+            
+            st.markdown("---")
+            st.subheader("Terms & Conditions")
+            col3, col4 = st.columns(2)
+            with col3:
+                terms = st.checkbox("I agree to the Terms and Conditions*")
+                data_consent = st.checkbox("I consent to data processing*")
+            with col4:
+                code_of_conduct = st.checkbox("I agree to abide by the Code of Conduct*")
+                background_check = st.checkbox("I consent to background checks if required")
+            
+            submitted = st.form_submit_button("Submit Application", type="primary")
+            
+            if submitted:
+                # Validate required fields
+                required_fields = [full_name, email, phone, location, skills, motivation]
+                if not all(required_fields) or not all([terms, data_consent, code_of_conduct]):
+                    st.error("Please fill all required fields (*)")
+                else:
+                    volunteer_data = {
+                        "full_name": full_name,
+                        "email": email,
+                        "phone": phone,
+                        "location": location,
+                        "profession": profession,
+                        "age": age,
+                        "skills": ", ".join(skills) + (f", {other_skills}" if other_skills else ""),
+                        "availability": availability,
+                        "specific_days": specific_days if availability == "Specific Days" else None,
+                        "experience_years": experience,
+                        "motivation": motivation,
+                        "previous_experience": previous_volunteering,
+                        "emergency_contact": emergency_contact,
+                        "status": "pending",
+                        "applied_date": datetime.now().isoformat(),
+                        "last_updated": datetime.now().isoformat()
+                    }
+                    
+                    # Save to cloud
+                    result = ai_engine.save_to_cloud("volunteers", volunteer_data)
+                    
+                    if result:
+                        st.success("""
+                        ✅ Thank you for your application!
+                        
+                        **Next Steps:**
+                        1. You'll receive a confirmation email within 24 hours
+                        2. Our team will review your application
+                        3. We'll contact you for an interview
+                        4. Upon approval, you'll receive volunteer training
+                        
+                        **Contact:** volunteers@healthbridge.ng
+                        """)
+                        st.balloons()
+                        # Send confirmation (would integrate with email service)
+                        # send_confirmation_email(email, full_name)
+                    else:
+                        st.error("Failed to submit application. Please try again or contact us.")
+    
+    with tabs[1]:
+        st.subheader("Current Volunteer Opportunities")
+        opportunities = [
+            {
+                "title": "🩺 Community Health Screeners",
+                "location": "Lagos & Kano",
+                "commitment": "Weekends, 4-6 hours",
+                "skills": ["Medical background", "Compassionate", "Good communication"],
+                "description": "Assist in conducting health screenings at community camps"
+            },
+            {
+                "title": "📊 Data Entry Specialists",
+                "location": "Remote",
+                "commitment": "Flexible, 2-4 hours/week",
+                "skills": ["Computer literate", "Attention to detail", "Basic Excel"],
+                "description": "Help enter and organize screening data"
+            },
+            {
+                "title": "🗣 Community Ambassadors",
+                "location": "All Locations",
+                "commitment": "Variable",
+                "skills": ["Local language", "Public speaking", "Community networks"],
+                "description": "Raise awareness about health screening in local communities"
+            },
+            {
+                "title": "🎪 Event Volunteers",
+                "location": "Lagos",
+                "commitment": "Weekend events",
+                "skills": ["Logistics", "Teamwork", "Problem-solving"],
+                "description": "Help organize and run screening camps"
+            }
+        ]
+        
+        for opp in opportunities:
+            with st.expander(f"{opp['title']} - {opp['location']}"):
+                st.write(f"**Commitment:** {opp['commitment']}")
+                st.write(f"**Required Skills:** {', '.join(opp['skills'])}")
+                st.write(f"**Description:** {opp['description']}")
+                if st.button("Apply for this Role", key=opp['title']):
+                    current_session().select_opportunity(opp['title'])
+                    st.rerun()
+        
+        st.markdown("---")
+        st.subheader("Volunteer Benefits")
+        benefits_cols = st.columns(2)
+        with benefits_cols[0]:
+            st.write("✓ **Training & Development**")
+            st.write("✓ **Certificate of Service**")
+            st.write("✓ **Professional Networking**")
+            st.write("✓ **Skill Development**")
+        with benefits_cols[1]:
+            st.write("✓ **Travel Allowance**")
+            st.write("✓ **Meals during events**")
+            st.write("✓ **Health Bridge Merchandise**")
+            st.write("✓ **Impact Recognition**")
+    
+    with tabs[2]:
+        st.subheader("Volunteer Resources")
+        resource_cols = st.columns(3)
+        with resource_cols[0]:
+            st.markdown("### 📚 Training Materials")
+            st.write("[Health Screening Protocol](link)")
+            st.write("[Data Privacy Guidelines](link)")
+            st.write("[Community Engagement Guide](link)")
+            st.write("[Emergency Procedures](link)")
+        with resource_cols[1]:
+            st.markdown("### 📅 Upcoming Events")
+            st.write("**Jan 15:** Volunteer Orientation")
+            st.write("**Jan 20:** Community Screening - Lagos")
+            st.write("**Jan 27:** First Aid Training")
+            st.write("**Feb 3:** Data Entry Workshop")
+        with resource_cols[2]:
+            st.markdown("### 👥 Community")
+            st.write("**WhatsApp Group:** Join here")
+            st.write("**Forum:** volunteers.healthbridge.ng")
+            st.write("**Email:** volunteers@healthbridge.ng")
+            st.write("**Hotline:** 0817 937 1170")
+        
+        st.markdown("---")
+        st.subheader("Volunteer Stories")
+        stories = [
+            {"name": "Dr. OYELEYE HASSAN", "role": "Medical Volunteer",
+             "story": "I've screened over 500 people and detected 25 high-risk cases. Saving lives through early detection!"},
+            {"name": "IMAM OLOYEDE SODIQ", "role": "Community Ambassador",
+             "story": "Translating health information to Igbo has helped my community understand their risks better."},
+            {"name": "BILAL DAWODU", "role": "Data Specialist",
+             "story": "Every data point I enter represents a life we're helping to save. It's incredibly rewarding."}
+        ]
+        
+        for story in stories:
+            with st.expander(f"{story['name']} - {story['role']}"):
+                st.write(story['story'])
+                st.caption(f"Volunteer since 2023")
@@ -0,0 +1,214 @@
+"""Installable PWA: manifest, icons, service worker and offline screening queue
+
+The assets live in ``pwa_assets/`` and are served by the routes that
+``healthbridge_app.serve`` adds to Streamlit's server; this module holds
+what both the server and the pages need: the assets themselves, the
+manifest, the queue endpoint's validation and saving, and the page hook
+that registers the service worker. Under a plain ``streamlit run`` the
+routes are missing and ``register_pwa`` does nothing.
+
+Every asset carries ``cache_version()``, a hash of the asset files and the
+Streamlit version. The service worker names its caches after it, so any
+change to either busts the caches on the next visit.
+"""
+import hashlib
+import os
+import threading
+from datetime import datetime
+from functools import lru_cache
+
+import streamlit as st
+from streamlit import config
+
+from healthbridge_app.engine import HealthBridgeAI
+
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pwa_assets")
+ASSETS = {
+    "sw.js": "application/javascript; charset=utf-8",
+    "register.js": "application/javascript; charset=utf-8",
+    "queue.js": "application/javascript; charset=utf-8",
+    "offline.html": "text/html; charset=utf-8",
+    "icon-192.png": "image/png",
+    "icon-512.png": "image/png",
+}
+TEMPLATED = (".js", ".html")
+
+# Mirrors the fields and options of the screening form (pages/screening.py)
+SCREENING_NUMBERS = {
+    "age": (int, 1, 120),
+    "systolic_bp": (int, 80, 250),
+    "diastolic_bp": (int, 50, 150),
+    "blood_glucose": (int, 20, 600),
+    "weight": (float, 20.0, 200.0),
+    "height": (int, 100, 250),
+    "waist_circumference": (int, 50, 200),
+}
+SCREENING_CHOICES = {
+    "location": ("Lagos", "Kano", "Abuja", "Port Harcourt", "Ibadan", "Ogun", "Oyo", "Others"),
+    "language": ("English", "Yoruba", "Hausa", "Igbo", "Pidgin"),
+    "sex": ("Male", "Female", "Prefer not to say"),
+    "urine_protein": ("Negative", "Trace", "1+", "2+", "3+"),
+    "known_diabetes": ("No", "Yes"),
+    "known_hypertension": ("No", "Yes"),
+    "family_history": ("No", "Yes"),
+    "herbal_use": ("No", "Yes"),
+    "smoking": ("No", "Yes"),
+}
+
+
+def base_path():
+    """Site root as a URL path with leading and trailing slash"""
+    base = config.get_option("server.baseUrlPath").strip("/")
+    return f"/{base}/" if base else "/"
+
+
+@lru_cache(maxsize=1)
+def cache_version():
+    """Short hash of the PWA assets and the Streamlit frontend version"""
+    digest = hashlib.sha256(st.__version__.encode())
+    for name in sorted(ASSETS):
+        with open(os.path.join(ASSET_DIR, name), "rb") as f:
+            digest.update(name.encode() + f.read())
+    return digest.hexdigest()[:12]
+
+
+@lru_cache(maxsize=None)
+def asset(name, base, version):
+    """Asset bytes with ``__BASE__`` and ``__VERSION__`` filled in for text assets"""
+    with open(os.path.join(ASSET_DIR, name), "rb") as f:
+        content = f.read()
+    if name.endswith(TEMPLATED):
+        content = content.replace(b"__BASE__", base.encode()).replace(b"__VERSION__", version.encode())
+    return content
+
+
+def manifest(base="/"):
+    """Web app manifest for mobile installation"""
+    return {
+        "name": "Health Bridge Nigeria",
+        "short_name": "HealthBridge",
+        "description": "Early detection of chronic diseases in Nigeria",
+        "start_url": base,
+        "scope": base,
+        "display": "standalone",
+        "background_color": "#ffffff",
+        "theme_color": "#1f77b4",
+        "icons": [
+            {
+                "src": f"{base}pwa/icon-192.png",
+                "sizes": "192x192",
+                "type": "image/png",
+                "purpose": "any maskable"
+            },
+            {
+                "src": f"{base}pwa/icon-512.png",
+                "sizes": "512x512",
+                "type": "image/png",
+                "purpose": "any maskable"
+            }
+        ]
+    }
+
+
+# ==================== OFFLINE QUEUE ====================
+def coerce_screening(raw):
+    """Validated screening record from a queued form submission; raises ValueError"""
+    name = str(raw.get("name") or "").strip()
+    phone = str(raw.get("phone") or "").strip()
+    if not name or not phone:
+        raise ValueError("name and phone are required")
+    if raw.get("consent") is not True:
+        raise ValueError("consent is required")
+    data = {"name": name, "phone": phone}
+    for field, (kind, low, high) in SCREENING_NUMBERS.items():
+        try:
+            value = kind(raw[field])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"{field} must be a number") from None
+        if not low <= value <= high:
+            raise ValueError(f"{field} must be between {low} and {high}")
+        data[field] = value
+    for field, options in SCREENING_CHOICES.items():
+        value = raw.get(field, options[0])
+        if value not in options:
+            raise ValueError(f"{field} must be one of {', '.join(options)}")
+        data[field] = value
+    try:
+        data["timestamp"] = datetime.fromisoformat(str(raw.get("timestamp"))).isoformat()
+    except ValueError:
+        raise ValueError("timestamp must be an ISO 8601 date") from None
+    data["data_shared"] = raw.get("data_shared") is True
+    return data
+
+
+def save_queued(submissions):
+    """Save queued screenings; None if the cloud database is unavailable
+
+    Retries are deduplicated in the database by ``(client_id, timestamp)``,
+    so a submission is saved once whichever worker or process receives it.
+    """
+    ai_engine = HealthBridgeAI()
+    if not ai_engine.supabase:
+        return None
+    results = []
+    for item in submissions:
+        client_id = str(item.get("client_id") or "") if isinstance(item, dict) else ""
+        if not client_id:
+            results.append({"client_id": client_id, "status": "invalid", "error": "client_id is required"})
+            continue
+        try:
+            data = coerce_screening(item.get("data") or {})
+        except ValueError as e:
+            results.append({"client_id": client_id, "status": "invalid", "error": str(e)})
+            continue
+        existing = ai_engine.find_queued_screening(client_id, data["timestamp"])
+        if existing:
+            results.append({"client_id": client_id, "name": data["name"], "status": "duplicate",
+                            "risk_level": existing.get("risk_level"), "score": existing.get("risk_score")})
+            continue
+        risk_assessment, patient_id, saved = ai_engine.record_screening(data, client_id=client_id)
+        if saved:
+            status = "saved"
+        elif ai_engine.find_queued_screening(client_id, data["timestamp"]):
+            status = "duplicate"  # another worker saved it in the meantime
+        else:
+            status = "failed"
+        results.append({
+            "client_id": client_id,
+            "name": data["name"],
+            "status": status,
+            "risk_level": risk_assessment["risk_level"],
+            "score": risk_assessment["score"],
+        })
+    return results
+
+
+# ==================== PAGE HOOK ====================
+_routes_installed = threading.Event()
+
+
+def mark_installed():
+    """Called by the server once the PWA routes are in place"""
+    _routes_installed.set()
+
+
+def installed():
+    return _routes_installed.is_set()
+
+
+def register_pwa():
+    """Load register.js into the page once per page load, if the PWA routes are installed"""
+    if not installed():
+        return
+    from streamlit.components.v1 import html
+
+    html(f"""<script>
+    (function () {{
+        var doc = window.parent.document;
+        if (doc.getElementById("healthbridge-pwa")) return;
+        var script = doc.createElement("script");
+        script.id = "healthbridge-pwa";
+        script.src = "{base_path()}pwa/register.js?v={cache_version()}";
+        doc.head.appendChild(script);
+    }})();
+    </script>""", height=0)
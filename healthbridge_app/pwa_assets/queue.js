@@ -0,0 +1,117 @@
+/* Screenings recorded without a connection, kept in IndexedDB until the
+   server confirms them. Loaded by the offline form and by the service
+   worker (importScripts), so it only uses APIs available in both. */
+(function (scope) {
+  "use strict";
+
+  var DB_NAME = "healthbridge";
+  var DB_VERSION = 1;
+  var STORE = "screenings";
+  var BATCH = 50;
+  var flushing = null;
+
+  function open() {
+    return new Promise(function (resolve, reject) {
+      var request = indexedDB.open(DB_NAME, DB_VERSION);
+      request.onupgradeneeded = function () {
+        request.result.createObjectStore(STORE, { keyPath: "client_id" });
+      };
+      request.onsuccess = function () { resolve(request.result); };
+      request.onerror = function () { reject(request.error); };
+    });
+  }
+
+  function transaction(mode, body) {
+    return open().then(function (db) {
+      return new Promise(function (resolve, reject) {
+        var tx = db.transaction(STORE, mode);
+        var request = body(tx.objectStore(STORE));
+        tx.oncomplete = function () {
+          db.close();
+          resolve(request ? request.result : undefined);
+        };
+        tx.onerror = tx.onabort = function () {
+          db.close();
+          reject(tx.error);
+        };
+      });
+    });
+  }
+
+  function newId() {
+    if (scope.crypto && scope.crypto.randomUUID) {
+      return scope.crypto.randomUUID();
+    }
+    return Date.now().toString(36) + "-" + Math.random().toString(36).slice(2);
+  }
+
+  function send(endpoint, items) {
+    return fetch(endpoint, {
+      method: "POST",
+      credentials: "same-origin",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ submissions: items })
+    }).then(function (response) {
+      if (!response.ok) {
+        throw new Error("Queue upload failed: HTTP " + response.status);
+      }
+      return response.json();
+    });
+  }
+
+  var HBQueue = {
+    /* Store one screening; resolves to the queued item */
+    add: function (data) {
+      var item = { client_id: newId(), queued_at: new Date().toISOString(), data: data };
+      return transaction("readwrite", function (store) { store.put(item); }).then(function () {
+        return item;
+      });
+    },
+
+    all: function () {
+      return transaction("readonly", function (store) { return store.getAll(); });
+    },
+
+    count: function () {
+      return transaction("readonly", function (store) { return store.count(); });
+    },
+
+    remove: function (ids) {
+      return transaction("readwrite", function (store) {
+        ids.forEach(function (id) { store.delete(id); });
+      });
+    },
+
+    /* Post queued screenings in batches. Saved and duplicate entries leave
+       the queue; failed or invalid ones stay for the next attempt. Resolves
+       to the server's per-item results. Concurrent calls share one upload. */
+    flush: function (endpoint) {
+      if (flushing) {
+        return flushing;
+      }
+      var results = [];
+      function next(items) {
+        if (!items.length) {
+          return results;
+        }
+        return send(endpoint, items.slice(0, BATCH)).then(function (body) {
+          results = results.concat(body.results);
+          var done = body.results.filter(function (r) {
+            return r.status === "saved" || r.status === "duplicate";
+          }).map(function (r) { return r.client_id; });
+          return HBQueue.remove(done).then(function () { return next(items.slice(BATCH)); });
+        });
+      }
+      flushing = HBQueue.all().then(next).then(function (value) {
+        flushing = null;
+        return value;
+      }, function (error) {
+        flushing = null;
+        throw error;
+      });
+      return flushing;
+    }
+  };
+
+  scope.HBQueue = HBQueue;
+})(self);
@@ -0,0 +1,47 @@
+/* Page-side PWA setup, injected into the Streamlit page once per load by
+   healthbridge_app.pwa.register_pwa: manifest and icon links, service
+   worker registration, and a nudge to send queued screenings whenever the
+   device comes back online. */
+(function () {
+  "use strict";
+
+  var BASE = "__BASE__";
+
+  function link(rel, href, extra) {
+    var element = document.createElement("link");
+    element.rel = rel;
+    element.href = href;
+    Object.keys(extra || {}).forEach(function (key) { element.setAttribute(key, extra[key]); });
+    document.head.appendChild(element);
+  }
+
+  link("manifest", BASE + "manifest.webmanifest");
+  link("apple-touch-icon", BASE + "pwa/icon-192.png");
+  var theme = document.createElement("meta");
+  theme.name = "theme-color";
+  theme.content = "#1f77b4";
+  document.head.appendChild(theme);
+
+  if (!("serviceWorker" in navigator)) {
+    return;
+  }
+
+  function flush(registration) {
+    if (registration.sync) {
+      registration.sync.register("screenings").catch(function () {});
+    } else if (registration.active) {
+      registration.active.postMessage("flush");
+    }
+  }
+
+  navigator.serviceWorker.register(BASE + "sw.js", { scope: BASE }).then(function () {
+    return navigator.serviceWorker.ready;
+  }).then(function (registration) {
+    if (navigator.onLine) {
+      flush(registration);
+    }
+    window.addEventListener("online", function () { flush(registration); });
+  }).catch(function (error) {
+    console.warn("Health Bridge service worker not registered:", error);
+  });
+})();
@@ -0,0 +1,131 @@
+/* Health Bridge service worker.
+
+   __VERSION__ and __BASE__ are filled in by healthbridge_app.pwa when the
+   file is served. A new version (any asset or Streamlit upgrade) changes
+   this file, so browsers install the new worker, which drops old caches.
+
+   - Streamlit's hashed bundles and our own assets: cache first.
+   - Page loads: network first; after NAVIGATION_TIMEOUT_MS the cached app
+     shell is used, and with no connection at all the offline form.
+   - Components and the manifest: cached copy now, refreshed in background.
+   - Everything else (websocket, health checks, media): network only. */
+"use strict";
+
+var VERSION = "__VERSION__";
+var BASE = "__BASE__";
+var SHELL_CACHE = "healthbridge-shell-" + VERSION;
+var RUNTIME_CACHE = "healthbridge-runtime-" + VERSION;
+var OFFLINE_PAGE = BASE + "pwa/offline.html";
+var QUEUE_ENDPOINT = BASE + "pwa/screenings";
+var NAVIGATION_TIMEOUT_MS = 4000;
+var PRECACHE = [
+  BASE,
+  OFFLINE_PAGE,
+  BASE + "pwa/queue.js",
+  BASE + "pwa/register.js",
+  BASE + "pwa/icon-192.png",
+  BASE + "pwa/icon-512.png",
+  BASE + "manifest.webmanifest"
+];
+
+importScripts(BASE + "pwa/queue.js?v=" + VERSION);
+
+self.addEventListener("install", function (event) {
+  event.waitUntil(caches.open(SHELL_CACHE).then(function (cache) {
+    return cache.addAll(PRECACHE).then(function () {
+      // Streamlit's entry bundles, so the next load needs no network for them
+      return fetch(BASE + "asset-manifest.json")
+        .then(function (response) { return response.json(); })
+        .then(function (manifest) {
+          return cache.addAll((manifest.entrypoints || []).map(function (path) { return BASE + path; }));
+        })
+        .catch(function () {});
+    });
+  }).then(function () { return self.skipWaiting(); }));
+});
+
+self.addEventListener("activate", function (event) {
+  event.waitUntil(caches.keys().then(function (keys) {
+    return Promise.all(keys.filter(function (key) {
+      return key.indexOf("healthbridge-") === 0 && key !== SHELL_CACHE && key !== RUNTIME_CACHE;
+    }).map(function (key) { return caches.delete(key); }));
+  }).then(function () { return self.clients.claim(); }));
+});
+
+function cacheFirst(request) {
+  return caches.match(request, { ignoreSearch: true }).then(function (cached) {
+    return cached || fetch(request).then(function (response) {
+      if (response.ok) {
+        var copy = response.clone();
+        caches.open(RUNTIME_CACHE).then(function (cache) { cache.put(request, copy); });
+      }
+      return response;
+    });
+  });
+}
+
+function staleWhileRevalidate(request) {
+  return caches.match(request).then(function (cached) {
+    var network = fetch(request).then(function (response) {
+      if (response.ok) {
+        var copy = response.clone();
+        caches.open(RUNTIME_CACHE).then(function (cache) { cache.put(request, copy); });
+      }
+      return response;
+    });
+    return cached || network;
+  });
+}
+
+function navigate(request) {
+  var network = fetch(request).then(function (response) {
+    if (response.ok) {
+      // Every page path serves the same index.html, cached once under BASE
+      var copy = response.clone();
+      caches.open(SHELL_CACHE).then(function (cache) { cache.put(BASE, copy); });
+    }
+    return response;
+  });
+  var offline = network.catch(function () { return caches.match(OFFLINE_PAGE); });
+  var slow = new Promise(function (resolve) { setTimeout(resolve, NAVIGATION_TIMEOUT_MS); })
+    .then(function () { return caches.match(BASE); })
+    .then(function (cached) { return cached || offline; });
+  return Promise.race([offline, slow]);
+}
+
+self.addEventListener("fetch", function (event) {
+  var request = event.request;
+  var url = new URL(request.url);
+  if (request.method !== "GET" || url.origin !== self.location.origin || url.pathname.indexOf(BASE) !== 0) {
+    return;
+  }
+  var path = url.pathname.slice(BASE.length);
+  if (path.indexOf("static/") === 0 || path.indexOf("pwa/") === 0) {
+    event.respondWith(cacheFirst(request));
+  } else if (request.mode === "navigate") {
+    event.respondWith(navigate(request));
+  } else if (path.indexOf("component/") === 0 || path === "manifest.webmanifest" || path === "favicon.png") {
+    event.respondWith(staleWhileRevalidate(request));
+  }
+});
+
+function flushQueue() {
+  return self.HBQueue.flush(QUEUE_ENDPOINT).then(function (results) {
+    return self.clients.matchAll().then(function (clients) {
+      clients.forEach(function (client) { client.postMessage({ type: "queue-flushed", results: results }); });
+    });
+  });
+}
+
+// Background Sync where the browser has it; pages post "flush" otherwise
+self.addEventListener("sync", function (event) {
+  if (event.tag === "screenings") {
+    event.waitUntil(flushQueue());
+  }
+});
+
+self.addEventListener("message", function (event) {
+  if (event.data === "flush") {
+    event.waitUntil(flushQueue().catch(function () {}));
+  }
+});
@@ -0,0 +1,73 @@
+"""Page table and on-demand page loading
+
+Each entry names the page's menu label and icon, the module and function
+that render it, and the Streamlit script that serves it. ``render`` imports
+the page module on first use, so a session only ever loads the pages it
+visits. The scripts under ``pages/`` and the main script are what
+``st.switch_page`` accepts as targets.
+"""
+import importlib
+import threading
+
+MAIN_SCRIPT = "HEALTH BRIGDE INITIATIVE.py"
+
+
+class Page:
+    __slots__ = ("key", "label", "icon", "title", "module", "function", "script")
+
+    def __init__(self, key, label, icon, title, module, function, script):
+        self.key = key
+        self.label = label
+        self.icon = icon
+        self.title = title
+        self.module = module
+        self.function = function
+        self.script = script
+
+
+PAGES = {page.key: page for page in (
+    Page("home", "🏠 Home", "house", "Health Bridge Initiative",
+         "healthbridge_app.pages.home", "show_homepage", MAIN_SCRIPT),
+    Page("screening", "🔍 Screening", "clipboard-pulse", "Health Screening",
+         "healthbridge_app.pages.screening", "show_screening_page", "pages/1_Health_Screening.py"),
+    Page("dashboard", "📊 Dashboard", "bar-chart", "Dashboard",
+         "healthbridge_app.pages.dashboard", "show_dashboard", "pages/2_Dashboard.py"),
+    Page("volunteer", "🤝 Volunteer", "people", "Volunteer",
+         "healthbridge_app.pages.volunteer", "show_volunteer_registration", "pages/3_Volunteer.py"),
+    Page("funding", "💰 Funding", "cash-coin", "Funding Platform",
+         "healthbridge_app.pages.funding", "show_funding_platform", "pages/4_Funding_Platform.py"),
+    Page("admin", "🔧 Admin", "gear", "Admin",
+         "healthbridge_app.pages.admin", "show_admin_panel", "pages/5_Admin.py"),
+    Page("about", "📚 About", "info-circle", "About",
+         "healthbridge_app.pages.about", "show_about_page", "pages/6_About.py"),
+)}
+
+_lock = threading.Lock()
+_loaded = {}
+
+
+def page_script(key):
+    """``st.switch_page`` target for a page"""
+    return PAGES[key].script
+
+
+def page_function(key):
+    """The page's render function, importing its module on first use"""
+    function = _loaded.get(key)
+    if function is None:
+        page = PAGES[key]
+        with _lock:
+            function = _loaded.get(key)
+            if function is None:
+                function = getattr(importlib.import_module(page.module), page.function)
+                _loaded[key] = function
+    return function
+
+
+def render(key):
+    page_function(key)()
+
+
+def loaded_pages():
+    """Keys of the pages this process has imported so far"""
+    return [key for key in PAGES if key in _loaded]
@@ -0,0 +1,134 @@
+"""Run the app with its PWA routes (service worker, manifest, offline queue)
+
+Usage::
+
+    python -m healthbridge_app.serve [streamlit run options]
+
+Same as ``streamlit run "HEALTH BRIGDE INITIATIVE.py"``, with these routes
+added to Streamlit's Tornado app (relative to ``server.baseUrlPath``):
+
+* ``sw.js`` - the service worker
+* ``manifest.webmanifest`` - the web app manifest
+* ``pwa/<asset>`` - icons, ``register.js``, ``queue.js`` and ``offline.html``
+* ``pwa/screenings`` - POST target for screenings queued offline
+
+They cannot go through Streamlit's own static serving, which sends
+JavaScript and JSON as text/plain, and a service worker only controls pages
+at or below the path it is served from, so ``sw.js`` has to sit at the root.
+"""
+import json
+import sys
+from urllib.parse import urlparse
+
+import tornado.web
+from streamlit import config
+from streamlit.web import cli
+from streamlit.web.server.server import Server
+from streamlit.web.server.server_util import make_url_path_regex
+from tornado.ioloop import IOLoop
+
+from healthbridge_app.pwa import ASSETS, asset, base_path, cache_version, manifest, mark_installed, save_queued
+from healthbridge_app.registry import MAIN_SCRIPT
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+QUEUE_MAX_BATCH = 50
+
+
+class AssetHandler(tornado.web.RequestHandler):
+    """Serves one of ``ASSETS``; versioned URLs (``?v=``) are cached for a year"""
+
+    def initialize(self, name=None):
+        self.name = name
+
+    def get(self, name=None):
+        name = self.name or name
+        if name not in ASSETS:
+            raise tornado.web.HTTPError(404)
+        base, version = base_path(), cache_version()
+        self.set_header("Content-Type", ASSETS[name])
+        if name == "sw.js":
+            self.set_header("Cache-Control", "no-cache")
+            self.set_header("Service-Worker-Allowed", base)
+        elif self.get_argument("v", None) == version:
+            self.set_header("Cache-Control", IMMUTABLE)
+        else:
+            self.set_header("Cache-Control", "no-cache")
+        self.write(asset(name, base, version))
+
+
+class ManifestHandler(tornado.web.RequestHandler):
+    def get(self):
+        self.set_header("Content-Type", "application/manifest+json")
+        self.set_header("Cache-Control", "no-cache")
+        self.write(json.dumps(manifest(base_path())))
+
+
+class ScreeningQueueHandler(tornado.web.RequestHandler):
+    """Accepts ``{"submissions": [{"client_id", "data"}, ...]}``, one result per submission"""
+
+    def check_xsrf_cookie(self):
+        # The service worker cannot read Streamlit's XSRF cookie. post() only takes
+        # same-origin JSON, which a cross-site form cannot send without a CORS preflight.
+        origin = self.request.headers.get("Origin")
+        if origin and urlparse(origin).netloc != self.request.host:
+            raise tornado.web.HTTPError(403, "cross-origin request")
+
+    async def post(self):
+        if not self.request.headers.get("Content-Type", "").startswith("application/json"):
+            raise tornado.web.HTTPError(415, "expected application/json")
+        try:
+            submissions = json.loads(self.request.body)["submissions"]
+        except (ValueError, KeyError, TypeError):
+            raise tornado.web.HTTPError(400, "expected {\"submissions\": [...]}") from None
+        if not isinstance(submissions, list) or len(submissions) > QUEUE_MAX_BATCH:
+            raise tornado.web.HTTPError(400, f"submissions must be a list of at most {QUEUE_MAX_BATCH}")
+        # Supabase calls block, so they run off the server's event loop
+        results = await IOLoop.current().run_in_executor(None, save_queued, submissions)
+        if results is None:
+            raise tornado.web.HTTPError(503, "cloud database unavailable")
+        self.write({"results": results})
+
+
+def routes(base):
+    return [
+        (make_url_path_regex(base, "sw.js"), AssetHandler, {"name": "sw.js"}),
+        (make_url_path_regex(base, "manifest.webmanifest"), ManifestHandler),
+        (make_url_path_regex(base, "pwa/screenings"), ScreeningQueueHandler),
+        (make_url_path_regex(base, r"pwa/([\w.-]+)"), AssetHandler),
+    ]
+
+
+def install(app, base):
+    """Add the PWA routes to a Tornado app ahead of Streamlit's catch-all static route"""
+    router = app.wildcard_router
+    count = len(router.rules)
+    router.add_rules(routes(base))
+    added = router.rules[count:]
+    del router.rules[count:]
+    router.rules[:0] = added
+
+
+def patch_server():
+    """Make Streamlit's server install the PWA routes when it creates its app"""
+    original = Server._create_app
+    if getattr(original, "pwa", False):
+        return
+
+    def _create_app(self):
+        app = original(self)
+        install(app, config.get_option("server.baseUrlPath"))
+        mark_installed()
+        return app
+
+    _create_app.pwa = True
+    Server._create_app = _create_app
+
+
+def main(argv=None):
+    patch_server()
+    sys.argv = ["streamlit", "run", MAIN_SCRIPT, *(sys.argv[1:] if argv is None else argv)]
+    return cli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""Page chrome shared by every page script: config, session state, sidebar
+
+``run(key)`` is the whole body of the main script and of each script under
+``pages/``: it configures the page, initialises session state, draws the
+sidebar navigation and renders the page through the registry. Choosing a
+different page in the menu switches to that page's script, so each page has
+its own URL and Streamlit only executes the script that was asked for.
+"""
+import streamlit as st
+from streamlit_option_menu import option_menu
+
+from healthbridge_app.components import lite_mode, lite_toggle, start_metrics_server, styled
+from healthbridge_app.engine import HealthBridgeAI, current_session, get_shared_cache
+from healthbridge_app.pwa import register_pwa
+from healthbridge_app.registry import PAGES, page_script, render
+
+# ==================== STREAMLIT APP CONFIGURATION ====================
+def configure_page(title):
+    st.set_page_config(
+        page_title=title,
+        page_icon="🩺",
+        layout="wide",
+        initial_sidebar_state="collapsed",  # Better for mobile
+        menu_items={
+            'Get Help': 'https://healthbridge.ng/help',
+            'Report a bug': 'https://healthbridge.ng/bug',
+            'About': '### Health Bridge Initiative - Saving Lives Through Early Detection'
+        }
+    )
+
+# ==================== SESSION STATE INITIALIZATION ====================
+def init_session_state():
+    """This session's bounded state record (``healthbridge.sessions``), marked as seen"""
+    return current_session()
+
+# ==================== MOBILE APP ENHANCEMENTS ====================
+def mobile_optimizations():
+    """Apply mobile-specific optimizations (skipped in lite mode)"""
+    styled("""
+    <style>
+    /* Mobile-responsive design */
+    @media (max-width: 768px) {
+        .stButton > button {
+            width: 100%;
+            margin: 5px 0;
+        }
+        .stTextInput > div > div > input {
+            font-size: 16px !important; /* Prevents zoom on iOS */
+        }
+        .stNumberInput > div > div > input {
+            font-size: 16px !important;
+        }
+        .stSelectbox > div > div > div {
+            font-size: 16px !important;
+        }
+    }
+    /* PWA-like styling */
+    .pwa-header {
+        position: fixed;
+        top: 0;
+        width: 100%;
+        background: white;
+        z-index: 999;
+        padding: 10px;
+        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+    }
+    /* Mobile-friendly spacing */
+    .mobile-padding {
+        padding: 10px;
+    }
+    </style>
+    """)
+
+# ==================== NAVIGATION ====================
+def show_sidebar(current):
+    """Sidebar branding, page menu and quick actions; switches page on selection"""
+    ai_engine = HealthBridgeAI()
+    keys = list(PAGES)
+    by_label = {PAGES[key].label: key for key in keys}
+    
+    # Custom sidebar for mobile
+    with st.sidebar:
+        styled("""
+        <div style='text-align: center; padding: 20px 0;'>
+            <h2>🩺 Health Bridge</h2>
+            <p style='color: #666; font-size: 0.9rem;'>
+                Early Detection Saves Lives
+            </p>
+        </div>
+        """, plain="## 🩺 Health Bridge")
+        
+        # Mobile-friendly navigation; lite mode uses a plain radio instead of the menu component
+        if lite_mode():
+            menu = st.radio("Go to", list(by_label), index=keys.index(current), key=f"navigation_lite_{current}")
+        else:
+            menu = option_menu(
+                menu_title=None,
+                options=list(by_label),
+                icons=[PAGES[key].icon for key in keys],
+                menu_icon="cast",
+                default_index=keys.index(current),
+                orientation="vertical",
+                key=f"navigation_{current}",
+                styles={
+                    "container": {"padding": "0!important", "background-color": "#fafafa"},
+                    "icon": {"color": "orange", "font-size": "20px"},
+                    "nav-link": {"font-size": "16px", "text-align": "left", "margin": "0px"},
+                    "nav-link-selected": {"background-color": "#1f77b4"},
+                }
+            )
+        
+        lite_toggle()
+        st.markdown("---")
+        
+        # Quick actions
+        st.markdown("### Quick Actions")
+        if st.button("🆘 Emergency", use_container_width=True):
+            st.info("Emergency: 112 or 767\nPoison Control: 0800 112 112")
+        if st.button("📞 Call Us", use_container_width=True):
+            st.info("Hotline: 0817 937 1170")
+        
+        # User info if logged in
+        current_user = current_session().current_user
+        if current_user:
+            st.markdown(f"**Welcome,** {current_user}")
+        
+        # Offline mode indicator
+        if not ai_engine.supabase:
+            st.warning("⚠ Offline Mode")
+        
+        # Version info
+        st.markdown("---")
+        st.caption("v2.0.0 | Health Bridge Initiative")
+    
+    selected = by_label.get(menu, current)
+    if selected != current:
+        st.switch_page(page_script(selected))
+
+# ==================== MAIN APP FUNCTION ====================
+def run(key, navigation=True):
+    """Render page ``key`` with the shared chrome (``navigation=False`` skips the sidebar)"""
+    configure_page(PAGES[key].title)
+    init_session_state()
+    # Apply mobile optimizations
+    mobile_optimizations()
+    start_metrics_server()
+    register_pwa()
+    # Apply invalidations made by other workers since the last run
+    get_shared_cache().poll()
+    if navigation:
+        show_sidebar(key)
+    render(key)
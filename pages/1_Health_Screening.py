@@ -0,0 +1,4 @@
+"""Health screening page (code in healthbridge_app.pages.screening)"""
+from healthbridge_app.shell import run
+
+run("screening")
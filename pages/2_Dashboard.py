@@ -0,0 +1,4 @@
+"""Dashboard page (code in healthbridge_app.pages.dashboard)"""
+from healthbridge_app.shell import run
+
+run("dashboard")
@@ -0,0 +1,4 @@
+"""Volunteer registration page (code in healthbridge_app.pages.volunteer)"""
+from healthbridge_app.shell import run
+
+run("volunteer")
@@ -0,0 +1,4 @@
+"""Funding platform page (code in healthbridge_app.pages.funding)"""
+from healthbridge_app.shell import run
+
+run("funding")
@@ -0,0 +1,4 @@
+"""Admin panel page (code in healthbridge_app.pages.admin)"""
+from healthbridge_app.shell import run
+
+run("admin")
@@ -0,0 +1,4 @@
+"""About page (code in healthbridge_app.pages.about)"""
+from healthbridge_app.shell import run
+
+run("about")
@@ -0,0 +1,18 @@
+-- Trigram and prefix indexes backing people search and the patient picker.
+-- ILIKE '%term%' and similarity() lookups on these columns use the GIN
+-- indexes instead of scanning screening_data / volunteers.
+create extension if not exists pg_trgm;
+
+create index if not exists screening_data_name_trgm_idx
+    on screening_data using gin (name gin_trgm_ops);
+create index if not exists screening_data_phone_trgm_idx
+    on screening_data using gin (phone gin_trgm_ops);
+create index if not exists screening_data_patient_id_idx
+    on screening_data (patient_id);
+
+create index if not exists volunteers_full_name_trgm_idx
+    on volunteers using gin (full_name gin_trgm_ops);
+create index if not exists volunteers_email_trgm_idx
+    on volunteers using gin (email gin_trgm_ops);
+create index if not exists volunteers_phone_trgm_idx
+    on volunteers using gin (phone gin_trgm_ops);
@@ -0,0 +1,23 @@
+-- One row per resolved patient. screening_data.patient_id references
+-- patient_identities.patient_id once the linkage job has run.
+create table if not exists patient_identities (
+    patient_id   text primary key,
+    identity_key text not null unique,
+    name         text,
+    name_norm    text,
+    phone        text,
+    birth_year   integer,
+    sex          text,
+    location     text,
+    first_seen   timestamptz,
+    last_seen    timestamptz
+);
+
+create index if not exists patient_identities_phone_idx
+    on patient_identities (phone);
+create index if not exists patient_identities_name_trgm_idx
+    on patient_identities using gin (name gin_trgm_ops);
+create index if not exists patient_identities_phone_trgm_idx
+    on patient_identities using gin (phone gin_trgm_ops);
+create index if not exists patient_identities_last_seen_idx
+    on patient_identities (last_seen desc);
@@ -0,0 +1,3 @@
+-- Serves "last N screenings for this patient" as a single index range scan.
+create index if not exists screening_data_patient_timestamp_idx
+    on screening_data (patient_id, timestamp desc);
@@ -0,0 +1,83 @@
+-- Funding ledger: each confirmed payment reference is applied exactly once to
+-- the global and per-request running totals, inside a single transaction.
+create table if not exists funding_ledger (
+    reference          text primary key,
+    funding_request_id text,
+    amount             numeric(14, 2) not null,
+    applied_at         timestamptz not null default now()
+);
+
+create table if not exists funding_totals (
+    scope          text primary key,            -- 'global' or 'request:<id>'
+    amount_raised  numeric(14, 2) not null default 0,
+    donation_count integer not null default 0,
+    updated_at     timestamptz not null default now()
+);
+
+alter table funding_requests
+    alter column amount_raised set default 0;
+
+create or replace function apply_payment(p_reference text, p_amount numeric, p_request_id text default null)
+returns boolean
+language plpgsql
+as $$
+begin
+    insert into funding_ledger (reference, funding_request_id, amount)
+    values (p_reference, p_request_id, p_amount)
+    on conflict (reference) do nothing;
+    if not found then
+        return false;  -- already applied
+    end if;
+
+    insert into funding_totals as t (scope, amount_raised, donation_count)
+    values ('global', p_amount, 1)
+    on conflict (scope) do update
+        set amount_raised = t.amount_raised + excluded.amount_raised,
+            donation_count = t.donation_count + 1,
+            updated_at = now();
+
+    if p_request_id is not null then
+        insert into funding_totals as t (scope, amount_raised, donation_count)
+        values ('request:' || p_request_id, p_amount, 1)
+        on conflict (scope) do update
+            set amount_raised = t.amount_raised + excluded.amount_raised,
+                donation_count = t.donation_count + 1,
+                updated_at = now();
+        update funding_requests
+            set amount_raised = coalesce(amount_raised, 0) + p_amount
+            where id::text = p_request_id;
+    end if;
+    return true;
+end;
+$$;
+
+create or replace function rebuild_funding_ledger()
+returns void
+language plpgsql
+as $$
+begin
+    lock table funding_ledger, funding_totals in exclusive mode;
+    delete from funding_ledger where true;
+    delete from funding_totals where true;
+
+    insert into funding_ledger (reference, funding_request_id, amount)
+    select reference, metadata ->> 'funding_request_id', amount
+    from payments
+    where status = 'success' and reference is not null
+    on conflict (reference) do nothing;
+
+    insert into funding_totals (scope, amount_raised, donation_count)
+    select 'global', coalesce(sum(amount), 0), count(*) from funding_ledger;
+
+    insert into funding_totals (scope, amount_raised, donation_count)
+    select 'request:' || funding_request_id, sum(amount), count(*)
+    from funding_ledger
+    where funding_request_id is not null
+    group by funding_request_id;
+
+    update funding_requests r
+        set amount_raised = coalesce(
+            (select sum(l.amount) from funding_ledger l where l.funding_request_id = r.id::text), 0)
+        where true;
+end;
+$$;
@@ -0,0 +1,16 @@
+-- Paged "Detailed Screening Records" table: every sortable column has an
+-- index ending in id, matching the (column, id) order the app requests, so a
+-- page is an index range scan rather than a sort of the whole table. The
+-- filtered views (location, risk level) get their own timestamp-ordered
+-- indexes for the default sort.
+create index if not exists screening_data_timestamp_id_idx on screening_data (timestamp, id);
+create index if not exists screening_data_name_id_idx on screening_data (name, id);
+create index if not exists screening_data_age_id_idx on screening_data (age, id);
+create index if not exists screening_data_location_id_idx on screening_data (location, id);
+create index if not exists screening_data_glucose_id_idx on screening_data (blood_glucose, id);
+create index if not exists screening_data_risk_level_id_idx on screening_data (risk_level, id);
+
+create index if not exists screening_data_location_timestamp_idx
+    on screening_data (location, timestamp desc, id desc);
+create index if not exists screening_data_risk_level_timestamp_idx
+    on screening_data (risk_level, timestamp desc, id desc);
@@ -0,0 +1,202 @@
+-- Range-partition screening_data by month on "timestamp". Date-window
+-- queries from the dashboards (timestamp >= start and timestamp < end) are
+-- pruned to the partitions they overlap, and indexes stay per-month sized.
+--
+-- The existing table is renamed, rows are copied into the partitioned
+-- table, and the earlier screening_data indexes are recreated on the parent
+-- (Postgres creates them on every partition). Row-level security, its
+-- policies and the table grants are copied to the new table.
+--
+-- Rows without a "timestamp" cannot be placed in a partition; the migration
+-- stops if any exist, so they can be dated deliberately first.
+begin;
+
+do $$
+declare
+    v_undated bigint;
+begin
+    select count(*) into v_undated from screening_data where "timestamp" is null;
+    if v_undated > 0 then
+        raise exception 'screening_data has % rows without a timestamp', v_undated
+            using hint = 'Set their "timestamp" (e.g. from when they were collected) before partitioning.';
+    end if;
+end;
+$$;
+
+alter table screening_data rename to screening_data_unpartitioned;
+
+create table screening_data (
+    like screening_data_unpartitioned including defaults including constraints including comments
+) partition by range ("timestamp");
+
+alter table screening_data alter column "timestamp" set not null;
+alter table screening_data add primary key (id, "timestamp");
+
+-- New sequence for id, continuing from the copied rows
+create sequence if not exists screening_data_partitioned_id_seq;
+select setval('screening_data_partitioned_id_seq',
+              coalesce((select max(id) from screening_data_unpartitioned), 0) + 1, false);
+alter table screening_data alter column id set default nextval('screening_data_partitioned_id_seq');
+alter sequence screening_data_partitioned_id_seq owned by screening_data.id;
+
+create table if not exists screening_data_default partition of screening_data default;
+
+-- Creates the month's partition. Rows for that month already sitting in the
+-- default partition (written before the month was provisioned) are moved
+-- into it; the default partition is detached meanwhile, so Postgres does not
+-- reject the new partition and inserts wait on the lock rather than failing.
+create or replace function create_screening_partition(p_month date)
+returns text
+language plpgsql
+as $$
+declare
+    v_start date := date_trunc('month', p_month)::date;
+    v_end   date := (date_trunc('month', p_month) + interval '1 month')::date;
+    v_name  text := format('screening_data_y%sm%s', to_char(v_start, 'YYYY'), to_char(v_start, 'MM'));
+    v_stray boolean;
+begin
+    if to_regclass(v_name) is not null then
+        return v_name;
+    end if;
+    execute format(
+        'select exists (select 1 from screening_data_default where "timestamp" >= %L and "timestamp" < %L)',
+        v_start, v_end) into v_stray;
+    if v_stray then
+        alter table screening_data detach partition screening_data_default;
+        execute format(
+            'create table %I partition of screening_data for values from (%L) to (%L)',
+            v_name, v_start, v_end);
+        execute format(
+            'insert into %I select * from screening_data_default where "timestamp" >= %L and "timestamp" < %L',
+            v_name, v_start, v_end);
+        execute format(
+            'delete from screening_data_default where "timestamp" >= %L and "timestamp" < %L',
+            v_start, v_end);
+        alter table screening_data attach partition screening_data_default default;
+    else
+        execute format(
+            'create table %I partition of screening_data for values from (%L) to (%L)',
+            v_name, v_start, v_end);
+    end if;
+    return v_name;
+end;
+$$;
+
+-- Partitions from the oldest screening through p_months_ahead months from now
+create or replace function ensure_screening_partitions(p_months_ahead integer default 3)
+returns void
+language plpgsql
+as $$
+declare
+    v_month date;
+    v_first date;
+begin
+    select date_trunc('month', coalesce(min("timestamp"::timestamp), now()))::date
+        into v_first from screening_data_unpartitioned;
+    for v_month in
+        select generate_series(v_first, date_trunc('month', now()) + make_interval(months => p_months_ahead),
+                               interval '1 month')::date
+    loop
+        perform create_screening_partition(v_month);
+    end loop;
+end;
+$$;
+
+select ensure_screening_partitions(3);
+
+insert into screening_data select * from screening_data_unpartitioned;
+
+-- Row-level security, policies and grants; without the policies the anon
+-- key would be locked out of the new table
+do $$
+declare
+    v_policy record;
+    v_grant  record;
+begin
+    if (select relrowsecurity from pg_class where oid = 'screening_data_unpartitioned'::regclass) then
+        alter table screening_data enable row level security;
+    end if;
+    if (select relforcerowsecurity from pg_class where oid = 'screening_data_unpartitioned'::regclass) then
+        alter table screening_data force row level security;
+    end if;
+    for v_policy in
+        select policyname, permissive, roles, cmd, qual, with_check
+        from pg_policies
+        where schemaname = current_schema() and tablename = 'screening_data_unpartitioned'
+    loop
+        execute format('create policy %I on screening_data as %s for %s to %s%s%s',
+                       v_policy.policyname, v_policy.permissive, v_policy.cmd,
+                       (select string_agg(quote_ident(r), ', ') from unnest(v_policy.roles) r),
+                       coalesce(' using (' || v_policy.qual || ')', ''),
+                       coalesce(' with check (' || v_policy.with_check || ')', ''));
+    end loop;
+    for v_grant in
+        select grantee, privilege_type
+        from information_schema.role_table_grants
+        where table_schema = current_schema() and table_name = 'screening_data_unpartitioned'
+    loop
+        execute format('grant %s on screening_data to %I', v_grant.privilege_type, v_grant.grantee);
+        if v_grant.privilege_type = 'INSERT' then
+            execute format('grant usage on sequence screening_data_partitioned_id_seq to %I',
+                           v_grant.grantee);
+        end if;
+    end loop;
+end;
+$$;
+
+drop table screening_data_unpartitioned;
+
+-- From now on the coming months are created ahead, and any month that has
+-- landed in the default partition (e.g. no pg_cron to run this monthly) gets
+-- its own partition and its rows moved there
+create or replace function ensure_screening_partitions(p_months_ahead integer default 3)
+returns void
+language plpgsql
+as $$
+declare
+    v_month date;
+begin
+    for v_month in
+        select distinct date_trunc('month', "timestamp"::timestamp)::date from screening_data_default
+        union
+        select generate_series(date_trunc('month', now()),
+                               date_trunc('month', now()) + make_interval(months => p_months_ahead),
+                               interval '1 month')::date
+        order by 1
+    loop
+        perform create_screening_partition(v_month);
+    end loop;
+end;
+$$;
+
+-- Indexes from earlier migrations, now partitioned
+create index if not exists screening_data_name_trgm_idx
+    on screening_data using gin (name gin_trgm_ops);
+create index if not exists screening_data_phone_trgm_idx
+    on screening_data using gin (phone gin_trgm_ops);
+create index if not exists screening_data_patient_id_idx
+    on screening_data (patient_id);
+create index if not exists screening_data_patient_timestamp_idx
+    on screening_data (patient_id, "timestamp" desc);
+create index if not exists screening_data_timestamp_id_idx on screening_data ("timestamp", id);
+create index if not exists screening_data_name_id_idx on screening_data (name, id);
+create index if not exists screening_data_age_id_idx on screening_data (age, id);
+create index if not exists screening_data_location_id_idx on screening_data (location, id);
+create index if not exists screening_data_glucose_id_idx on screening_data (blood_glucose, id);
+create index if not exists screening_data_risk_level_id_idx on screening_data (risk_level, id);
+create index if not exists screening_data_location_timestamp_idx
+    on screening_data (location, "timestamp" desc, id desc);
+create index if not exists screening_data_risk_level_timestamp_idx
+    on screening_data (risk_level, "timestamp" desc, id desc);
+
+commit;
+
+-- Keep upcoming months provisioned where pg_cron is available
+do $$
+begin
+    if exists (select 1 from pg_extension where extname = 'pg_cron') then
+        perform cron.schedule('ensure-screening-partitions', '0 3 1 * *',
+                              'select ensure_screening_partitions(3)');
+    end if;
+end;
+$$;
@@ -0,0 +1,16 @@
+-- What the referral facility found, reported back after a screening. The
+-- fitted kidney risk model (healthbridge.model) is trained on screenings
+-- joined to these rows; screenings without an outcome are not used.
+create table if not exists referral_outcomes (
+    screening_id  bigint primary key,           -- screening_data.id
+    patient_id    text,
+    ckd_confirmed boolean not null,
+    egfr          numeric(5, 1),
+    facility      text,
+    reported_at   timestamptz not null default now()
+);
+
+create index if not exists referral_outcomes_patient_id_idx
+    on referral_outcomes (patient_id);
+create index if not exists referral_outcomes_reported_at_idx
+    on referral_outcomes (reported_at);
@@ -0,0 +1,84 @@
+-- Per-day donation totals ('day:YYYY-MM-DD' scopes in funding_totals), so the
+-- funding analytics chart reads the ledger instead of scanning payments.
+-- apply_payment() takes the payment time; rebuild_funding_ledger() dates each
+-- payment by payments.created_at.
+drop function if exists apply_payment(text, numeric, text);
+
+create or replace function apply_payment(p_reference text, p_amount numeric, p_request_id text default null,
+                                         p_paid_at timestamptz default now())
+returns boolean
+language plpgsql
+as $$
+begin
+    insert into funding_ledger (reference, funding_request_id, amount, applied_at)
+    values (p_reference, p_request_id, p_amount, coalesce(p_paid_at, now()))
+    on conflict (reference) do nothing;
+    if not found then
+        return false;  -- already applied
+    end if;
+
+    insert into funding_totals as t (scope, amount_raised, donation_count)
+    values ('global', p_amount, 1),
+           ('day:' || to_char(coalesce(p_paid_at, now()) at time zone 'utc', 'YYYY-MM-DD'), p_amount, 1)
+    on conflict (scope) do update
+        set amount_raised = t.amount_raised + excluded.amount_raised,
+            donation_count = t.donation_count + 1,
+            updated_at = now();
+
+    if p_request_id is not null then
+        insert into funding_totals as t (scope, amount_raised, donation_count)
+        values ('request:' || p_request_id, p_amount, 1)
+        on conflict (scope) do update
+            set amount_raised = t.amount_raised + excluded.amount_raised,
+                donation_count = t.donation_count + 1,
+                updated_at = now();
+        update funding_requests
+            set amount_raised = coalesce(amount_raised, 0) + p_amount
+            where id::text = p_request_id;
+    end if;
+    return true;
+end;
+$$;
+
+create or replace function rebuild_funding_ledger()
+returns void
+language plpgsql
+as $$
+begin
+    lock table funding_ledger, funding_totals in exclusive mode;
+    delete from funding_ledger where true;
+    delete from funding_totals where true;
+
+    insert into funding_ledger (reference, funding_request_id, amount, applied_at)
+    select reference, metadata ->> 'funding_request_id', amount, coalesce(created_at, now())
+    from payments
+    where status = 'success' and reference is not null
+    on conflict (reference) do nothing;
+
+    insert into funding_totals (scope, amount_raised, donation_count)
+    select 'global', coalesce(sum(amount), 0), count(*) from funding_ledger;
+
+    insert into funding_totals (scope, amount_raised, donation_count)
+    select 'request:' || funding_request_id, sum(amount), count(*)
+    from funding_ledger
+    where funding_request_id is not null
+    group by funding_request_id;
+
+    insert into funding_totals (scope, amount_raised, donation_count)
+    select 'day:' || to_char(applied_at at time zone 'utc', 'YYYY-MM-DD'), sum(amount), count(*)
+    from funding_ledger
+    group by 1;
+
+    update funding_requests r
+        set amount_raised = coalesce(
+            (select sum(l.amount) from funding_ledger l where l.funding_request_id = r.id::text), 0)
+        where true;
+end;
+$$;
+
+-- Backfill the day scopes for payments already in the ledger
+insert into funding_totals (scope, amount_raised, donation_count)
+select 'day:' || to_char(applied_at at time zone 'utc', 'YYYY-MM-DD'), sum(amount), count(*)
+from funding_ledger
+group by 1
+on conflict (scope) do nothing;
@@ -0,0 +1,11 @@
+-- Offline-queue submissions carry the client_id the browser gave them. A
+-- retry after a lost response may reach another app worker or a restarted
+-- process, so the database, not the worker, decides whether it is already
+-- saved. Unique keys on the partitioned table must include the partition
+-- key; a queued screening keeps its "timestamp" across retries, so
+-- (client_id, "timestamp") identifies it. Rows entered through the form
+-- have no client_id and never conflict.
+alter table screening_data add column if not exists client_id text;
+
+create unique index if not exists screening_data_client_id_timestamp_key
+    on screening_data (client_id, "timestamp");